@@ -69,7 +69,7 @@ class HistoricalReturnsAlphaModel(AlphaModel):
 
         # initialize data for added securities
         symbols = [ x.symbol for x in changes.added_securities ]
-        history = algorithm.history(symbols, self.lookback, self.resolution)
+        history = algorithm.history(symbols, self.lookback, self.resolution, fields=['close'])
         if history.empty: return
 
         tickers = history.index.levels[0]
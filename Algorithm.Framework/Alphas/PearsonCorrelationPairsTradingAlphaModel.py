@@ -51,7 +51,7 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
 
         symbols = sorted([ x.symbol for x in self.securities ])
 
-        history = algorithm.history(symbols, self.lookback, self.resolution)
+        history = algorithm.history(symbols, self.lookback, self.resolution, fields=['close'])
 
         if not history.empty:
             history = history.close.unstack(level=0)
@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+from Portfolio.RollingMoments import RollingMoments
 from itertools import groupby
 from numpy import dot, transpose
 from numpy.linalg import inv
@@ -66,6 +67,8 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         self.sign = lambda x: -1 if x < 0 else (1 if x > 0 else 0)
         self.symbol_data_by_symbol = {}
+        # Mean and covariance of the returns of the symbols, updated with every return
+        self.moments = RollingMoments(period)
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancing_func
@@ -86,9 +89,8 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         # Get view vectors
         p, q = self.get_views(last_active_insights)
         if p is not None:
-            returns = dict()
+            symbols = dict()
             # Updates the BlackLittermanSymbolData with insights
-            # Create a dictionary keyed by the symbols in the insights with an pandas.Series as value to create a data frame
             for insight in last_active_insights:
                 symbol = insight.symbol
                 symbol_data = self.symbol_data_by_symbol.get(symbol, self.BlackLittermanSymbolData(symbol, self.lookback, self.period))
@@ -96,12 +98,15 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
                     self.algorithm.set_run_time_error(ArgumentNullException('BlackLittermanOptimizationPortfolioConstructionModel does not accept \'None\' as Insight.magnitude. Please make sure your Alpha Model is generating Insights with the Magnitude property set.'))
                     return targets
                 symbol_data.add(insight.generated_time_utc, insight.magnitude)
-                returns[symbol] = symbol_data.return_
+                symbols[symbol] = symbol_data
 
-            returns = pd.DataFrame(returns)
+            # The returns of the symbols in the insights, a view of the returns kept by the moments
+            symbols = list(symbols)
+            mean, covariance = self.moments.get_moments(symbols)
+            returns = self.moments.get_returns(symbols)
 
             # Calculate prior estimate of the mean and covariance
-            pi, sigma = self.get_equilibrium_return(returns)
+            pi, sigma = self.get_equilibrium_return(returns, mean, covariance)
 
             # Calculate posterior estimate of the mean and covariance
             pi, sigma = self.apply_blacklitterman_master_formula(pi, sigma, p, q)
@@ -150,7 +155,7 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         # initialize data for added securities
         added_symbols = { x.symbol: x.exchange.time_zone for x in changes.added_securities }
-        history = algorithm.history(list(added_symbols.keys()), self.lookback * self.period, self.resolution)
+        history = algorithm.history(list(added_symbols.keys()), self.lookback * self.period, self.resolution, fields=['close'])
 
         if history.empty:
             return
@@ -162,7 +167,7 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             if str(symbol) not in symbols:
                 continue
 
-            symbol_data = self.symbol_data_by_symbol.get(symbol, self.BlackLittermanSymbolData(symbol, self.lookback, self.period))
+            symbol_data = self.symbol_data_by_symbol.get(symbol, self.BlackLittermanSymbolData(symbol, self.lookback, self.period, self.moments))
             for time, close in history[symbol].items():
                 utc_time = Extensions.convert_to_utc(time, timezone)
                 symbol_data.update(utc_time, close)
@@ -196,10 +201,12 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         return Pi, Sigma
 
-    def get_equilibrium_return(self, returns):
+    def get_equilibrium_return(self, returns, mean = None, covariance = None):
         '''Calculate equilibrium returns and covariance
         Args:
             returns: Matrix of returns where each column represents a security and each row returns for the given date/time (size: K x N)
+            mean: Array of double with the mean of the returns. Computed from the returns if None
+            covariance: Multi-dimensional array of double with the covariance of the returns. Computed from the returns if None
         Returns:
             equilibrium_return: Array of double of equilibrium returns
             cov: Multi-dimensional array of double with the portfolio covariance of returns (size: K x K)'''
@@ -208,9 +215,9 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         # equal weighting scheme
         W = np.array([1/size]*size)
         # the covariance matrix of excess returns (N x N matrix)
-        cov = returns.cov()*252
+        cov = (returns.cov() if covariance is None else covariance)*252
         # annualized return
-        annual_return = np.sum(((1 + returns.mean())**252 -1) * W)
+        annual_return = np.sum(((1 + (returns.mean() if mean is None else mean))**252 -1) * W)
         # annualized variance of return
         annual_variance = dot(W.T, dot(cov, W))
         # the risk aversion coefficient
@@ -271,40 +278,45 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
     class BlackLittermanSymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, period, moments = None):
             self._symbol = symbol
             self.roc = RateOfChange(f'{symbol}.roc({lookback})', lookback)
             self.roc.updated += self.on_rate_of_change_updated
-            self.window = RollingWindow(period)
+            self._period = period
+            # The returns are kept by the RollingMoments of the model, shared with the other symbols
+            self._moments = RollingMoments(period) if moments is None else moments
+            self._last_time = None
 
         def reset(self):
             self.roc.updated -= self.on_rate_of_change_updated
             self.roc.reset()
-            self.window.reset()
+            self._moments.remove(self._symbol)
+            self._last_time = None
 
         def update(self, utc_time, close):
             self.roc.update(utc_time, close)
 
         def on_rate_of_change_updated(self, roc, value):
             if roc.is_ready:
-                self.window.add(value)
+                self._add(value.end_time, value.value)
 
         def add(self, time, value):
-            if self.window.samples > 0 and self.window[0].end_time == time:
+            if self._last_time == time:
                 return
 
-            item = IndicatorDataPoint(self._symbol, time, value)
-            self.window.add(item)
+            self._add(time, value)
+
+        def _add(self, time, value):
+            self._last_time = time
+            self._moments.update(self._symbol, time, value)
 
         @property
         def return_(self):
-            return pd.Series(
-                data = [x.value for x in self.window],
-                index = [x.end_time for x in self.window])
+            return self._moments.get_returns([self._symbol]).iloc[:, 0]
 
         @property
         def is_ready(self):
-            return self.window.is_ready
+            return self._moments.get_count(self._symbol) >= self._period
 
         def __str__(self, **kwargs):
-            return f'{self.roc.name}: {(1 + self.window[0])**252 - 1:.2%}'
+            return f'{self.roc.name}: {(1 + self.return_.iloc[-1])**252 - 1:.2%}'
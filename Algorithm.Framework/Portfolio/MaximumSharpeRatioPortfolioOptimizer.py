@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from scipy.optimize import minimize
+from Portfolio.QuadraticProgrammingSolver import QuadraticProgrammingSolver
 
 ### <summary>
 ### Provides an implementation of a portfolio optimizer that maximizes the portfolio Sharpe Ratio.
@@ -26,16 +27,24 @@ class MaximumSharpeRatioPortfolioOptimizer:
     def __init__(self,
                  minimum_weight = -1,
                  maximum_weight = 1,
-                 risk_free_rate = 0):
+                 risk_free_rate = 0,
+                 warm_start = False,
+                 solver = None):
         '''Initialize the MaximumSharpeRatioPortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
             maximum_weight(float): The upper bounds on portfolio weights
-            risk_free_rate(float): The risk free rate'''
+            risk_free_rate(float): The risk free rate
+            warm_start(bool): True to start each optimization from the previous solution. False, the default, to start from equal weights. The solver tolerance is absolute, so a warm started solution can differ from a cold started one
+            solver: The quadratic programming solver: 'admm', 'osqp', 'cvxpy' or a QuadraticProgrammingSolver. None to use SLSQP'''
         self.minimum_weight = minimum_weight
         self.maximum_weight = maximum_weight
         self.risk_free_rate = risk_free_rate
         self.expected_returns = []
+        self.warm_start = warm_start
+        self.solver = None if solver is None else QuadraticProgrammingSolver.create(solver)
+        # Weights of the last successful optimization by column
+        self._previous_weights = {}
 
     def optimize(self, historical_returns, expected_returns = None, covariance = None):
         '''
@@ -53,28 +62,59 @@ class MaximumSharpeRatioPortfolioOptimizer:
             expected_returns = historical_returns.mean()
         expected_returns = expected_returns - self.risk_free_rate
 
-        size = covariance.columns.size   # K x 1
+        columns = covariance.columns
+        size = columns.size   # K x 1
         x0 = np.array(size * [1. / size])
+        initial_guess = self.get_initial_guess(columns, x0)
+
+        # Contiguous arrays, the objective and constraints are evaluated on every iteration
+        covariance = np.ascontiguousarray(covariance, dtype=float)
+        expected_returns = np.ascontiguousarray(expected_returns, dtype=float).reshape(-1)
+        ones = np.ones(size)
+
+        # The target return is the one of the equal weights, regardless of the starting point
         k = expected_returns.dot(x0)
 
         # Sharpe Maximization under Quadratic Constraints
         # https://quant.stackexchange.com/questions/18521/sharpe-maximization-under-quadratic-constraints
-        # (µ − r_f)^T w = k
-        constraints = [
-            {'type': 'eq', 'fun': lambda weights: expected_returns.dot(weights) - k}]
+        if self.solver is not None:
+            # minimize wᵀΣw subject to (µ − r_f)^T w = k, Σw = 1 and the bounds
+            opt = self.solver.solve(2 * covariance, np.zeros(size),
+                                    np.vstack([expected_returns, ones]), np.array([k, 1]),
+                                    np.full(size, self.minimum_weight), np.full(size, self.maximum_weight), initial_guess)
+        else:
+            # (µ − r_f)^T w = k
+            # The constraints are linear so their Jacobians are constant
+            constraints = [
+                {'type': 'eq', 'fun': lambda weights: expected_returns.dot(weights) - k, 'jac': lambda weights: expected_returns}]
+
+            # Σw = 1
+            constraints.append(
+                {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights), 'jac': lambda weights: ones})
 
-        # Σw = 1
-        constraints.append(
-            {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights)})
+            opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),   # Objective function
+                           initial_guess,                                             # Initial guess
+                           jac = lambda weights: self.portfolio_variance_gradient(weights, covariance),   # Gradient of the objective
+                           bounds = self.get_boundary_conditions(size),               # Bounds for variables: lw ≤ w ≤ up
+                           constraints = constraints,                                 # Constraints definition
+                           method='SLSQP')        # Optimization method:  Sequential Least SQuares Programming
 
-        opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),   # Objective function
-                       x0,                                                        # Initial guess
-                       bounds = self.get_boundary_conditions(size),               # Bounds for variables: lw ≤ w ≤ up
-                       constraints = constraints,                                 # Constraints definition
-                       method='SLSQP')        # Optimization method:  Sequential Least SQuares Programming
-        sharpe_ratio = expected_returns.dot(opt['x']) / opt.fun
+        if not opt['success']: return x0
 
-        return opt['x'] if opt['success'] else x0
+        self._previous_weights = dict(zip(columns, opt['x']))
+        return opt['x']
+
+    def get_initial_guess(self, columns, x0):
+        '''Gets the starting point of the optimization: the previous solution for the columns that were optimized before
+        and the equal weight of x0 for the new ones, scaled to satisfy the budget constraint
+        Args:
+            columns: The columns of the covariance matrix
+            x0: The equal weights'''
+        if not self.warm_start or not self._previous_weights:
+            return x0
+        initial_guess = np.array([self._previous_weights.get(column, x0[i]) for i, column in enumerate(columns)])
+        total = np.sum(initial_guess)
+        return initial_guess / total if total > 0 else x0
 
     def portfolio_variance(self, weights, covariance):
         '''Computes the portfolio variance
@@ -87,6 +127,13 @@ class MaximumSharpeRatioPortfolioOptimizer:
             raise ValueError(f'MaximumSharpeRatioPortfolioOptimizer.portfolio_variance: Volatility cannot be zero. Weights: {weights}')
         return variance
 
+    def portfolio_variance_gradient(self, weights, covariance):
+        '''Computes the gradient of the portfolio variance: 2Σw
+        Args:
+            weighs: Portfolio weights
+            covariance: Covariance matrix of historical returns'''
+        return 2 * np.dot(covariance, weights)
+
     def get_boundary_conditions(self, size):
         '''Creates the boundary condition for the portfolio weights'''
         return tuple((self.minimum_weight, self.maximum_weight) for x in range(size))
@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.RollingMoments import RollingMoments
 
 ### <summary>
 ### Provides an implementation of Mean-Variance portfolio optimization based on modern portfolio theory.
@@ -51,6 +52,8 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         self.optimizer = MinimumVariancePortfolioOptimizer(lower, upper, target_return) if optimizer is None else optimizer
 
         self.symbol_data_by_symbol = {}
+        # Mean and covariance of the returns of the symbols, updated with every return
+        self.moments = RollingMoments(period)
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancing_func
@@ -88,12 +91,14 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
 
         symbols = [insight.symbol for insight in active_insights]
 
-        # Create a dictionary keyed by the symbols in the insights with an pandas.series as value to create a data frame
-        returns = { str(symbol.id) : data.return_ for symbol, data in self.symbol_data_by_symbol.items() if symbol in symbols }
-        returns = pd.DataFrame(returns)
+        # The returns of the symbols in the insights, a view of the returns kept by the moments
+        symbols = [symbol for symbol in self.symbol_data_by_symbol if symbol in symbols]
+        labels = [str(symbol.id) for symbol in symbols]
+        returns = self.moments.get_returns(symbols, labels)
+        expected_returns, covariance = self.moments.get_moments(symbols, labels)
 
         # The portfolio optimizer finds the optional weights for the given data
-        weights = self.optimizer.optimize(returns)
+        weights = self.optimizer.optimize(returns, expected_returns, covariance)
         weights = pd.Series(weights, index = returns.columns)
 
         # Create portfolio targets from the specified insights
@@ -122,7 +127,7 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         # initialize data for added securities
         symbols = [x.symbol for x in changes.added_securities]
         for symbol in [x for x in symbols if x not in self.symbol_data_by_symbol]:
-            self.symbol_data_by_symbol[symbol] = self.MeanVarianceSymbolData(symbol, self.lookback, self.period)
+            self.symbol_data_by_symbol[symbol] = self.MeanVarianceSymbolData(symbol, self.lookback, self.period, self.moments)
 
         history = algorithm.history[TradeBar](symbols, self.lookback * self.period, self.resolution)
         for bars in history:
@@ -131,40 +136,42 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
 
     class MeanVarianceSymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, period, moments = None):
             self._symbol = symbol
             self.roc = RateOfChange(f'{symbol}.roc({lookback})', lookback)
             self.roc.updated += self.on_rate_of_change_updated
-            self.window = RollingWindow(period)
+            self._period = period
+            # The returns are kept by the RollingMoments of the model, shared with the other symbols
+            self._moments = RollingMoments(period) if moments is None else moments
 
         def reset(self):
             self.roc.updated -= self.on_rate_of_change_updated
             self.roc.reset()
-            self.window.reset()
+            self._moments.remove(self._symbol)
 
         def update(self, time, value):
             return self.roc.update(time, value)
 
         def on_rate_of_change_updated(self, roc, value):
             if roc.is_ready:
-                self.window.add(value)
+                self._add(value.end_time, value.value)
 
         def add(self, time, value):
-            item = IndicatorDataPoint(self._symbol, time, value)
-            self.window.add(item)
+            self._add(time, value)
+
+        def _add(self, time, value):
+            self._moments.update(self._symbol, time, value)
 
         # Get symbols' returns, we use simple return according to
         # Meucci, Attilio, Quant Nugget 2: Linear vs. Compounded Returns – Common Pitfalls in Portfolio Management (May 1, 2010).
         # GARP Risk Professional, pp. 49-51, April 2010 , Available at SSRN: https://ssrn.com/abstract=1586656
         @property
         def return_(self):
-            return pd.Series(
-                data = [x.value for x in self.window],
-                index = [x.end_time for x in self.window])
+            return self._moments.get_returns([self._symbol]).iloc[:, 0]
 
         @property
         def is_ready(self):
-            return self.window.is_ready
+            return self._moments.get_count(self._symbol) >= self._period
 
         def __str__(self, **kwargs):
-            return '{}: {:.2%}'.format(self.roc.name, self.window[0])
+            return '{}: {:.2%}'.format(self.roc.name, self.return_.iloc[-1])
@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from scipy.optimize import minimize
+from Portfolio.QuadraticProgrammingSolver import QuadraticProgrammingSolver
 
 ### <summary>
 ### Provides an implementation of a portfolio optimizer that calculate the optimal weights
@@ -25,15 +26,23 @@ class MinimumVariancePortfolioOptimizer:
     def __init__(self,
                  minimum_weight = -1,
                  maximum_weight = 1,
-                 target_return = 0.02):
+                 target_return = 0.02,
+                 warm_start = False,
+                 solver = None):
         '''Initialize the MinimumVariancePortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
             maximum_weight(float): The upper bounds on portfolio weights
-            target_return(float): The target portfolio return'''
+            target_return(float): The target portfolio return
+            warm_start(bool): True to start each optimization from the previous solution. False, the default, to start from equal weights. The solver tolerance is absolute, so a warm started solution can differ from a cold started one
+            solver: The quadratic programming solver: 'admm', 'osqp', 'cvxpy' or a QuadraticProgrammingSolver. None to use SLSQP'''
         self.minimum_weight = minimum_weight
         self.maximum_weight = maximum_weight
         self.target_return = target_return
+        self.warm_start = warm_start
+        self.solver = None if solver is None else QuadraticProgrammingSolver.create(solver)
+        # Weights of the last successful optimization by column
+        self._previous_weights = {}
 
     def optimize(self, historical_returns, expected_returns = None, covariance = None):
         '''
@@ -52,23 +61,51 @@ class MinimumVariancePortfolioOptimizer:
 
         size = historical_returns.columns.size   # K x 1
         x0 = np.array(size * [1. / size])
+        initial_guess = self.get_initial_guess(historical_returns.columns, x0)
 
-        constraints = [
-            {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights)},
-            {'type': 'eq', 'fun': lambda weights: self.get_target_constraint(weights, expected_returns)}]
+        # Contiguous arrays, the objective and constraints are evaluated on every iteration
+        covariance = np.ascontiguousarray(covariance, dtype=float)
+        expected_returns = np.ascontiguousarray(expected_returns, dtype=float).reshape(-1)
+        ones = np.ones(size)
 
-        # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
-        opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),     # Objective function
-                       x0,                                                        # Initial guess
-                       bounds = self.get_boundary_conditions(size),               # Bounds for variables
-                       constraints = constraints,                                 # Constraints definition
-                       method='SLSQP')     # Optimization method:  Sequential Least Squares Programming (SLSQP)
+        if self.solver is not None:
+            # minimize wᵀΣw subject to Σw = 1, µᵀw = target and the bounds
+            opt = self.solver.solve(2 * covariance, np.zeros(size),
+                                    np.vstack([ones, expected_returns]), np.array([1, self.target_return]),
+                                    np.full(size, self.minimum_weight), np.full(size, self.maximum_weight), initial_guess)
+        else:
+            # The constraints are linear so their Jacobians are constant
+            constraints = [
+                {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights), 'jac': lambda weights: ones},
+                {'type': 'eq', 'fun': lambda weights: self.get_target_constraint(weights, expected_returns), 'jac': lambda weights: expected_returns}]
+
+            # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
+            opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),     # Objective function
+                           initial_guess,                                             # Initial guess
+                           jac = lambda weights: self.portfolio_variance_gradient(weights, covariance),   # Gradient of the objective
+                           bounds = self.get_boundary_conditions(size),               # Bounds for variables
+                           constraints = constraints,                                 # Constraints definition
+                           method='SLSQP')     # Optimization method:  Sequential Least Squares Programming (SLSQP)
 
         if not opt['success']: return x0
 
         # Scale the solution to ensure that the sum of the absolute weights is 1
         sum_of_absolute_weights = np.sum(np.abs(opt['x']))
-        return opt['x'] / sum_of_absolute_weights
+        weights = opt['x'] / sum_of_absolute_weights
+        self._previous_weights = dict(zip(historical_returns.columns, opt['x']))
+        return weights
+
+    def get_initial_guess(self, columns, x0):
+        '''Gets the starting point of the optimization: the previous solution for the columns that were optimized before
+        and the equal weight of x0 for the new ones, scaled to satisfy the budget constraint
+        Args:
+            columns: The columns of the historical returns
+            x0: The equal weights'''
+        if not self.warm_start or not self._previous_weights:
+            return x0
+        initial_guess = np.array([self._previous_weights.get(column, x0[i]) for i, column in enumerate(columns)])
+        total = np.sum(initial_guess)
+        return initial_guess / total if total > 0 else x0
 
     def portfolio_variance(self, weights, covariance):
         '''Computes the portfolio variance
@@ -81,6 +118,13 @@ class MinimumVariancePortfolioOptimizer:
             raise ValueError(f'MinimumVariancePortfolioOptimizer.portfolio_variance: Volatility cannot be zero. Weights: {weights}')
         return variance
 
+    def portfolio_variance_gradient(self, weights, covariance):
+        '''Computes the gradient of the portfolio variance: 2Σw
+        Args:
+            weighs: Portfolio weights
+            covariance: Covariance matrix of historical returns'''
+        return 2 * np.dot(covariance, weights)
+
     def get_boundary_conditions(self, size):
         '''Creates the boundary condition for the portfolio weights'''
         return tuple((self.minimum_weight, self.maximum_weight) for x in range(size))
@@ -91,4 +135,4 @@ class MinimumVariancePortfolioOptimizer:
 
     def get_target_constraint(self, weights, expected_returns):
         '''Ensure that the portfolio return target a given return'''
-        return np.dot(np.matrix(expected_returns), np.matrix(weights).T).item() - self.target_return
+        return np.dot(expected_returns, weights) - self.target_return
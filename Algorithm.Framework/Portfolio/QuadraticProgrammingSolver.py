@@ -0,0 +1,288 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from abc import ABC, abstractmethod
+from scipy.linalg import cho_factor, cho_solve
+from scipy.optimize import OptimizeResult
+
+### <summary>
+### Solvers of the box constrained quadratic programs of the mean-variance portfolio optimizers:
+### minimize ½ xᵀPx + qᵀx subject to Ax = b and lower ≤ x ≤ upper
+### </summary>
+class QuadraticProgrammingSolver(ABC):
+    '''Base class of the solvers of the box constrained quadratic programs of the mean-variance portfolio optimizers:
+    minimize ½ xᵀPx + qᵀx subject to Ax = b and lower ≤ x ≤ upper'''
+
+    @abstractmethod
+    def solve(self, P, q, A, b, lower, upper, initial_guess):
+        '''Solves the quadratic program
+        Args:
+            P: Positive semidefinite matrix of the quadratic term (size: K x K)
+            q: Array of the linear term (size: K x 1)
+            A: Matrix of the equality constraints (size: M x K)
+            b: Array of the right hand side of the equality constraints (size: M x 1)
+            lower: Array of the lower bounds of the variables (size: K x 1)
+            upper: Array of the upper bounds of the variables (size: K x 1)
+            initial_guess: Array the solver starts from (size: K x 1)
+        Returns:
+            OptimizeResult with the solution 'x', 'success' and the number of iterations 'nit'
+        '''
+
+    @staticmethod
+    def create(solver):
+        '''Gets the solver of the given name: 'admm', 'osqp' or 'cvxpy'. Solver instances are returned as they are
+        Args:
+            solver: The name of the solver or a solver instance'''
+        if not isinstance(solver, str):
+            return solver
+        solvers = {
+            'admm': AdmmQuadraticProgrammingSolver,
+            'osqp': OsqpQuadraticProgrammingSolver,
+            'cvxpy': CvxpyQuadraticProgrammingSolver
+        }
+        if solver.lower() not in solvers:
+            raise ValueError(f'QuadraticProgrammingSolver.create: unknown solver {solver}. Available solvers: {", ".join(solvers)}')
+        return solvers[solver.lower()]()
+
+class AdmmQuadraticProgrammingSolver(QuadraticProgrammingSolver):
+    '''Alternating direction method of multipliers (ADMM) solver written with NumPy, following the OSQP algorithm.
+    The KKT matrix is factorized once per step size, so every iteration costs two triangular solves, then the active set
+    of the ADMM solution is polished by solving its equality constrained problem exactly.
+    https://web.stanford.edu/~boyd/papers/pdf/osqp.pdf'''
+
+    def __init__(self,
+                 rho = 0.1,
+                 sigma = 1e-6,
+                 alpha = 1.6,
+                 absolute_tolerance = 1e-6,
+                 relative_tolerance = 1e-6,
+                 max_iterations = 10000,
+                 check_interval = 25,
+                 infeasibility_tolerance = 1e-4,
+                 polish = True):
+        '''Initialize the AdmmQuadraticProgrammingSolver
+        Args:
+            rho(float): The initial step size, adapted every check of the residuals
+            sigma(float): The regularization of the variables, keeps the KKT matrix definite for singular covariances
+            alpha(float): The relaxation parameter, between 0 and 2
+            absolute_tolerance(float): The absolute tolerance of the primal and dual residuals
+            relative_tolerance(float): The relative tolerance of the primal and dual residuals
+            max_iterations(int): The maximum number of iterations
+            check_interval(int): The number of iterations between checks of the residuals
+            infeasibility_tolerance(float): The tolerance of the certificate of primal infeasibility
+            polish(bool): True to solve the active set of the solution exactly'''
+        self.rho = rho
+        self.sigma = sigma
+        self.alpha = alpha
+        self.absolute_tolerance = absolute_tolerance
+        self.relative_tolerance = relative_tolerance
+        self.max_iterations = max_iterations
+        self.check_interval = check_interval
+        self.infeasibility_tolerance = infeasibility_tolerance
+        self.polish = polish
+
+    def solve(self, P, q, A, b, lower, upper, initial_guess):
+        try:
+            return self._solve(P, q, A, b, lower, upper, initial_guess)
+        except (np.linalg.LinAlgError, ValueError) as e:
+            # e.g. a covariance with NaN values, of symbols without enough returns
+            return OptimizeResult(x=np.asarray(initial_guess, dtype=float), success=False, nit=0, status=3, message=str(e))
+
+    def _solve(self, P, q, A, b, lower, upper, initial_guess):
+        '''Solves the quadratic program, raises if the problem isn't finite or the factorization of the KKT matrix fails'''
+        P = np.asarray(P, dtype=float)
+        q = np.asarray(q, dtype=float)
+        A = np.atleast_2d(np.asarray(A, dtype=float))
+        b = np.asarray(b, dtype=float)
+        lower = np.asarray(lower, dtype=float)
+        upper = np.asarray(upper, dtype=float)
+        size = q.size
+        if not all(np.all(np.isfinite(x)) for x in (P, q, A, b)):
+            # NaN values would only surface after max_iterations
+            raise ValueError('AdmmQuadraticProgrammingSolver.solve: the problem must not contain infs or NaNs')
+
+        # Scaling the objective and the rows of the equalities doesn't change the solution,
+        # but covariances of daily returns are tiny and the residuals are compared against absolute tolerances
+        diagonal = np.mean(np.diag(P))
+        scale = diagonal if diagonal > 0 else 1
+        P = P / scale
+        q = q / scale
+        norms = np.linalg.norm(A, axis=1)
+        norms[norms == 0] = 1
+        A = A / norms[:, None]
+        b = b / norms
+
+        # The equalities are the rows of A, the bounds are constraints on x itself.
+        # Equalities take a larger step size, as in OSQP
+        rho_bounds = self.rho
+        rho_equalities = np.full(b.size, self.rho * 1e3)
+        factor = self._factorize(P, A, rho_equalities, rho_bounds)
+
+        x = np.clip(np.asarray(initial_guess, dtype=float), lower, upper)
+        z_equalities = b.copy()
+        z_bounds = x.copy()
+        y_equalities = np.zeros(b.size)
+        y_bounds = np.zeros(size)
+
+        success = False
+        infeasible = False
+        iteration = 0
+        while iteration < self.max_iterations:
+            iteration += 1
+            rhs = self.sigma * x - q + A.T @ (rho_equalities * z_equalities - y_equalities) + rho_bounds * z_bounds - y_bounds
+            x_tilde = cho_solve(factor, rhs)
+
+            # Relaxed updates of the variables, the projection of z on the constraints and the dual update
+            x = self.alpha * x_tilde + (1 - self.alpha) * x
+            relaxed_equalities = self.alpha * (A @ x_tilde) + (1 - self.alpha) * z_equalities
+            relaxed_bounds = self.alpha * x_tilde + (1 - self.alpha) * z_bounds
+            z_equalities = b
+            z_bounds = np.clip(relaxed_bounds + y_bounds / rho_bounds, lower, upper)
+            delta_equalities = rho_equalities * (relaxed_equalities - z_equalities)
+            delta_bounds = rho_bounds * (relaxed_bounds - z_bounds)
+            y_equalities = y_equalities + delta_equalities
+            y_bounds = y_bounds + delta_bounds
+
+            if iteration % self.check_interval != 0:
+                continue
+
+            # The dual updates of infeasible problems converge to a certificate of infeasibility
+            delta_norm = max(np.max(np.abs(delta_equalities), initial=0), np.max(np.abs(delta_bounds)))
+            if delta_norm > 0:
+                tolerance = self.infeasibility_tolerance * delta_norm
+                support = b @ delta_equalities + upper @ np.maximum(delta_bounds, 0) + lower @ np.minimum(delta_bounds, 0)
+                if np.max(np.abs(A.T @ delta_equalities + delta_bounds)) <= tolerance and support <= -tolerance:
+                    infeasible = True
+                    break
+
+            Ax = A @ x
+            Px = P @ x
+            Aty = A.T @ y_equalities + y_bounds
+            primal_residual = max(np.max(np.abs(Ax - b), initial=0), np.max(np.abs(x - z_bounds)))
+            dual_residual = np.max(np.abs(Px + q + Aty))
+            primal_norm = max(np.max(np.abs(Ax), initial=0), np.max(np.abs(x)), np.max(np.abs(b), initial=0), np.max(np.abs(z_bounds)))
+            dual_norm = max(np.max(np.abs(Px)), np.max(np.abs(Aty)), np.max(np.abs(q)))
+            if primal_residual <= self.absolute_tolerance + self.relative_tolerance * primal_norm and \
+               dual_residual <= self.absolute_tolerance + self.relative_tolerance * dual_norm:
+                success = True
+                break
+
+            # Balance the primal and dual residuals, refactorizing only if the step size changes significantly
+            ratio = np.sqrt((primal_residual / max(primal_norm, 1e-12)) / max(dual_residual / max(dual_norm, 1e-12), 1e-12))
+            rho = np.clip(rho_bounds * ratio, 1e-6, 1e6)
+            if rho > 5 * rho_bounds or rho < rho_bounds / 5:
+                rho_equalities = rho_equalities * rho / rho_bounds
+                rho_bounds = rho
+                factor = self._factorize(P, A, rho_equalities, rho_bounds)
+
+        # z is the projection of x on the bounds
+        x = z_bounds
+        if success and self.polish:
+            x = self._polish(P, q, A, b, lower, upper, x)
+
+        if success:
+            status, message = 0, 'Optimization terminated successfully'
+        elif infeasible:
+            status, message = 2, 'The problem is infeasible'
+        else:
+            status, message = 1, 'Iteration limit reached'
+        return OptimizeResult(x=x, success=success, nit=iteration, status=status, message=message)
+
+    def _factorize(self, P, A, rho_equalities, rho_bounds):
+        '''Cholesky factorization of the KKT matrix reduced to x: P + σI + Aᵀ diag(ρ) A + ρI'''
+        matrix = P + A.T @ (rho_equalities[:, None] * A)
+        matrix[np.diag_indices_from(matrix)] += self.sigma + rho_bounds
+        return cho_factor(matrix)
+
+    def _polish(self, P, q, A, b, lower, upper, x):
+        '''Solves the equality constrained problem of the free variables, fixing the ones at their bounds.
+        Returns the polished solution if it satisfies the optimality conditions, the given solution otherwise'''
+        tolerance = 1e-7 * np.maximum(1, np.abs(x))
+        at_lower = x - lower <= tolerance
+        at_upper = upper - x <= tolerance
+        free = ~(at_lower | at_upper)
+        fixed = np.where(at_lower, lower, upper)
+
+        count = np.count_nonzero(free)
+        P_free = P[np.ix_(free, free)]
+        A_free = A[:, free]
+        kkt = np.block([[P_free, A_free.T], [A_free, np.zeros((b.size, b.size))]])
+        rhs = np.concatenate([-q[free] - P[np.ix_(free, ~free)] @ fixed[~free], b - A[:, ~free] @ fixed[~free]])
+        try:
+            solution = np.linalg.solve(kkt, rhs)
+        except np.linalg.LinAlgError:
+            return x
+
+        polished = fixed.copy()
+        polished[free] = solution[:count]
+        multipliers = solution[count:]
+
+        # Primal feasibility and the sign of the gradient at the bounds: the polished point must be optimal
+        tolerance = 1e-9
+        gradient = P @ polished + q + A.T @ multipliers
+        if np.any(polished < lower - tolerance) or np.any(polished > upper + tolerance) or \
+           np.any(np.abs(A @ polished - b) > 1e-9) or \
+           np.any(gradient[at_lower] < -1e-7) or np.any(gradient[at_upper] > 1e-7):
+            return x
+        return np.clip(polished, lower, upper)
+
+class OsqpQuadraticProgrammingSolver(QuadraticProgrammingSolver):
+    '''Solver using OSQP, which must be installed: pip install osqp'''
+
+    def __init__(self, **settings):
+        '''Initialize the OsqpQuadraticProgrammingSolver
+        Args:
+            settings: The OSQP settings, e.g. eps_abs, eps_rel or max_iter'''
+        self.settings = {'verbose': False, 'polish': True, 'eps_abs': 1e-6, 'eps_rel': 1e-6}
+        self.settings.update(settings)
+
+    def solve(self, P, q, A, b, lower, upper, initial_guess):
+        import osqp
+        from scipy import sparse
+
+        A = np.atleast_2d(np.asarray(A, dtype=float))
+        size = len(q)
+        constraints = sparse.vstack([sparse.csc_matrix(A), sparse.identity(size, format='csc')], format='csc')
+        solver = osqp.OSQP()
+        solver.setup(sparse.csc_matrix(np.triu(P)), np.asarray(q, dtype=float), constraints,
+                     np.concatenate([b, lower]), np.concatenate([b, upper]), **self.settings)
+        solver.warm_start(x=np.asarray(initial_guess, dtype=float))
+        result = solver.solve()
+
+        success = result.info.status == 'solved'
+        return OptimizeResult(x=result.x, success=success, nit=result.info.iter,
+                              status=0 if success else 1, message=result.info.status)
+
+class CvxpyQuadraticProgrammingSolver(QuadraticProgrammingSolver):
+    '''Solver using cvxpy, which must be installed: pip install cvxpy'''
+
+    def __init__(self, **solve_arguments):
+        '''Initialize the CvxpyQuadraticProgrammingSolver
+        Args:
+            solve_arguments: The arguments of cvxpy Problem.solve, e.g. solver'''
+        self.solve_arguments = solve_arguments
+
+    def solve(self, P, q, A, b, lower, upper, initial_guess):
+        import cvxpy as cp
+
+        x = cp.Variable(len(q))
+        x.value = np.asarray(initial_guess, dtype=float)
+        objective = cp.Minimize(0.5 * cp.quad_form(x, cp.psd_wrap(P)) + q @ x)
+        problem = cp.Problem(objective, [np.atleast_2d(A) @ x == b, x >= lower, x <= upper])
+        problem.solve(warm_start=True, **self.solve_arguments)
+
+        success = problem.status == cp.OPTIMAL
+        iterations = problem.solver_stats.num_iters if problem.solver_stats is not None else None
+        return OptimizeResult(x=x.value, success=success, nit=iterations,
+                              status=0 if success else 1, message=problem.status)
@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+from Portfolio.RollingMoments import RollingMoments
 
 ### <summary>
 ### Risk Parity Portfolio Construction Model
@@ -51,6 +52,8 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
         self.optimizer = RiskParityPortfolioOptimizer() if optimizer is None else optimizer
 
         self._symbol_data_by_symbol = {}
+        # Covariance of the returns of the symbols, updated with every return
+        self._moments = RollingMoments(period)
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancing_func
@@ -77,12 +80,19 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
 
         symbols = [insight.symbol for insight in active_insights]
 
-        # Create a dictionary keyed by the symbols in the insights with an pandas.series as value to create a data frame
-        returns = { str(symbol) : data.return_ for symbol, data in self._symbol_data_by_symbol.items() if symbol in symbols }
-        returns = pd.DataFrame(returns)
+        # The returns of the symbols in the insights, a view of the returns kept by the moments
+        symbols = [symbol for symbol in self._symbol_data_by_symbol if symbol in symbols]
+        labels = [str(symbol) for symbol in symbols]
+        returns = self._moments.get_returns(symbols, labels)
+
+        # The covariance of the moments is over the times each pair of symbols has returns. It's the one of np.cov,
+        # used by the optimizer, only if every symbol has a return at every time, else the optimizer computes it
+        covariance = None
+        if not np.isnan(returns.values).any():
+            covariance = self._moments.get_moments(symbols, labels)[1].values
 
         # The portfolio optimizer finds the optional weights for the given data
-        weights = self.optimizer.optimize(returns)
+        weights = self.optimizer.optimize(returns, covariance=covariance)
         weights = pd.Series(weights, index = returns.columns)
 
         # Create portfolio targets from the specified insights
@@ -106,7 +116,7 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
 
         # initialize data for added securities
         symbols = [ x.symbol for x in changes.added_securities ]
-        history = algorithm.history(symbols, self.lookback * self.period, self.resolution)
+        history = algorithm.history(symbols, self.lookback * self.period, self.resolution, fields=['close'])
         if history.empty: return
 
         tickers = history.index.levels[0]
@@ -114,23 +124,25 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
             symbol = SymbolCache.get_symbol(ticker)
 
             if symbol not in self._symbol_data_by_symbol:
-                symbol_data = self.RiskParitySymbolData(symbol, self.lookback, self.period)
+                symbol_data = self.RiskParitySymbolData(symbol, self.lookback, self.period, self._moments)
                 symbol_data.warm_up_indicators(history.loc[ticker])
                 self._symbol_data_by_symbol[symbol] = symbol_data
                 algorithm.register_indicator(symbol, symbol_data.roc, self.resolution)
 
     class RiskParitySymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, period, moments = None):
             self._symbol = symbol
             self.roc = RateOfChange(f'{symbol}.roc({lookback})', lookback)
             self.roc.updated += self.on_rate_of_change_updated
-            self.window = RollingWindow(period)
+            self._period = period
+            # The returns are kept by the RollingMoments of the model, shared with the other symbols
+            self._moments = RollingMoments(period) if moments is None else moments
 
         def reset(self):
             self.roc.updated -= self.on_rate_of_change_updated
             self.roc.reset()
-            self.window.reset()
+            self._moments.remove(self._symbol)
 
         def warm_up_indicators(self, history):
             for tuple in history.itertuples():
@@ -138,21 +150,21 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
 
         def on_rate_of_change_updated(self, roc, value):
             if roc.is_ready:
-                self.window.add(value)
+                self._add(value.end_time, value.value)
 
         def add(self, time, value):
-            item = IndicatorDataPoint(self._symbol, time, value)
-            self.window.add(item)
+            self._add(time, value)
+
+        def _add(self, time, value):
+            self._moments.update(self._symbol, time, value)
 
         @property
         def return_(self):
-            return pd.Series(
-                data = [x.value for x in self.window],
-                index = [x.end_time for x in self.window])
+            return self._moments.get_returns([self._symbol]).iloc[:, 0]
 
         @property
         def is_ready(self):
-            return self.window.is_ready
+            return self._moments.get_count(self._symbol) >= self._period
 
         def __str__(self, **kwargs):
-            return '{}: {:.2%}'.format(self.roc.name, self.window[0])
+            return '{}: {:.2%}'.format(self.roc.name, self.return_.iloc[-1])
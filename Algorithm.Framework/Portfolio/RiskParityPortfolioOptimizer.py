@@ -22,13 +22,18 @@ class RiskParityPortfolioOptimizer:
     
     def __init__(self, 
                  minimum_weight = 1e-05, 
-                 maximum_weight = sys.float_info.max):
+                 maximum_weight = sys.float_info.max,
+                 warm_start = False):
         '''Initialize the RiskParityPortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
-            maximum_weight(float): The upper bounds on portfolio weights'''
+            maximum_weight(float): The upper bounds on portfolio weights
+            warm_start(bool): True to start each optimization from the previous solution. False, the default, to start from equal weights. The solver tolerance is absolute, so a warm started solution can differ from a cold started one'''
         self.minimum_weight = minimum_weight if minimum_weight >= 1e-05 else 1e-05
         self.maximum_weight = maximum_weight if maximum_weight >= minimum_weight else minimum_weight
+        self.warm_start = warm_start
+        # Unnormalized solution of the last successful optimization by column
+        self._previous_solution = {}
 
     def optimize(self, historical_returns, budget = None, covariance = None):
         '''
@@ -56,8 +61,24 @@ class RiskParityPortfolioOptimizer:
         objective = lambda weights: 0.5 * weights.T @ covariance @ weights - budget.T @ np.log(weights)
         gradient = lambda weights: covariance @ weights - budget / weights
         hessian = lambda weights: covariance + np.diag((budget / weights**2).flatten())
-        solver = minimize(objective, jac=gradient, hess=hessian, x0=x0, method="Newton-CG")
+        solver = minimize(objective, jac=gradient, hess=hessian, x0=self.get_initial_guess(historical_returns.columns, x0), method="Newton-CG")
 
         if not solver["success"]: return x0
+        self._previous_solution = dict(zip(historical_returns.columns, solver["x"]))
         # Normalize weights: w = x / x^T.1
         return np.clip(solver["x"]/np.sum(solver["x"]), self.minimum_weight, self.maximum_weight)
+
+    def get_initial_guess(self, columns, x0):
+        '''Gets the starting point of the optimization: the previous solution for the columns that were optimized before.
+        The solution isn't normalized, so new columns start from the average of the previous ones
+        Args:
+            columns: The columns of the historical returns
+            x0: The equal weights'''
+        if not self.warm_start or not self._previous_solution:
+            return x0
+        previous = [self._previous_solution.get(column) for column in columns]
+        known = [x for x in previous if x is not None and x > 0]
+        if not known:
+            return x0
+        default = np.mean(known)
+        return np.array([x if x is not None and x > 0 else default for x in previous])
@@ -0,0 +1,325 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from collections import deque
+from scipy.linalg.blas import dgemm, dger
+
+### <summary>
+### Last returns of a universe of symbols with their rolling mean and covariance, updated with each new return.
+### The moments are the ones of a data frame of the last returns of every symbol: the mean of every column and
+### the covariance of every pair of columns over the times both have a return, like pandas DataFrame.mean and cov.
+### </summary>
+class RollingMoments:
+    '''Last returns of a universe of symbols with their rolling mean and covariance, updated with each new return.
+    The moments are the ones of a data frame of the last returns of every symbol: the mean of every column and
+    the covariance of every pair of columns over the times both have a return, like pandas DataFrame.mean and cov.
+
+    The data frame is a preallocated T x N numpy array with a row per time, oldest first, and a column per symbol.
+    New times take the next row, and the rows are moved back to the start of the array once they reach its end,
+    so adding a return is O(1) amortized and the returns are a view of the array instead of a frame built from series.
+
+    It keeps the sums of the data frame: the counts of the pairs of returns, the sums of the returns of a symbol
+    over the times another has a return and the sums of the products of the returns.
+    Each row of the data frame that changes updates the sums in O(N²) instead of the O(N²T) of computing the covariance again'''
+
+    def __init__(self, period):
+        '''Initialize the RollingMoments
+        Args:
+            period(int): The number of returns kept for every symbol'''
+        self.period = period
+        # Rows of the data frame by time, NaN where a symbol has no return. The rows in use are the ones from start to end,
+        # the ones without returns are removed when the rows are moved. The rows are sorted by time unless a time is added out of order
+        self._values = np.empty((0, 0))
+        self._times = np.empty(0, dtype=object)
+        self._count_by_row = np.empty(0, dtype=int)
+        self._row_by_time = {}
+        self._start = 0
+        self._end = 0
+        self._last_time = None
+        self._sorted = True
+        # Columns of the data frame by symbol and the times of the returns of every symbol, oldest first
+        self._column_by_symbol = {}
+        self._free_columns = []
+        self._times_by_symbol = {}
+        # Rows updated since the sums were, with their values at the time
+        self._pending = {}
+        self._updates_since_recompute = 0
+        self._counts = np.empty((0, 0))
+        self._sums = np.empty((0, 0))
+        self._products = np.empty((0, 0))
+
+    def update(self, symbol, time, value):
+        '''Adds the return of the symbol at the given time, dropping its oldest return if it has more than period returns.
+        The return replaces the previous one if the symbol already has a return at that time
+        Args:
+            symbol: The symbol of the return
+            time: The time of the return
+            value(float): The return'''
+        column = self._column_by_symbol.get(symbol)
+        if column is None:
+            column = self._add_symbol(symbol)
+
+        times = self._times_by_symbol[symbol]
+        row = self._get_row(time)
+        if np.isnan(self._values[row, column]):
+            times.append(time)
+            self._count_by_row[row] += 1
+        self._set_value(row, column, value)
+
+        if len(times) > self.period:
+            oldest = self._row_by_time[times.popleft()]
+            self._set_value(oldest, column, np.nan)
+            self._count_by_row[oldest] -= 1
+            self._free_row_if_empty(oldest)
+
+    def remove(self, symbol):
+        '''Removes the symbol and all its returns
+        Args:
+            symbol: The symbol to remove'''
+        column = self._column_by_symbol.pop(symbol, None)
+        if column is None:
+            return
+        times = self._times_by_symbol.pop(symbol)
+
+        # The sums of the other symbols over the times of this one only depend on its column
+        self._values[:, column] = np.nan
+        for values in self._pending.values():
+            values[column] = np.nan
+        for matrix in (self._counts, self._sums, self._products):
+            matrix[column, :] = 0
+            matrix[:, column] = 0
+        for time in times:
+            row = self._row_by_time[time]
+            self._count_by_row[row] -= 1
+            self._free_row_if_empty(row)
+        self._free_columns.append(column)
+
+    def reset(self):
+        '''Removes all the symbols and their returns'''
+        self.__init__(self.period)
+
+    def get_moments(self, symbols, labels = None):
+        '''Gets the mean and the covariance of the returns of the symbols, NaN for the symbols without returns
+        Args:
+            symbols: The symbols of the moments
+            labels: The labels of the symbols in the moments. Defaults to the symbols
+        Returns:
+            The mean (pandas.Series) and the covariance (pandas.DataFrame) of the returns'''
+        self._apply_pending()
+        labels = list(symbols) if labels is None else list(labels)
+        columns = [self._column_by_symbol.get(symbol) for symbol in symbols]
+        known = np.array([column is not None for column in columns], dtype=bool)
+        if not known.any():
+            return pd.Series(np.nan, index=labels), pd.DataFrame(np.nan, index=labels, columns=labels)
+
+        # Symbols without returns take any column, their moments are NaN
+        columns = np.array([column if column is not None else 0 for column in columns], dtype=np.intp)
+        covariance = self._select(self._products, columns)
+        sums = np.diag(self._sums)[columns]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = sums / np.diag(self._counts)[columns]
+            count = len(self._row_by_time)
+            if self._count_by_row[self._start:self._end].sum() == count * len(self._column_by_symbol):
+                # Every symbol has returns at the same times, the sums over the times of another symbol are its own sums
+                if count < 2:
+                    covariance[:] = np.nan
+                else:
+                    dger(-1.0, mean, sums, a=covariance.T, overwrite_a=True)
+                    covariance *= 1 / (count - 1)
+            else:
+                counts = self._select(self._counts, columns)
+                pair_sums = self._select(self._sums, columns)
+                covariance -= pair_sums * pair_sums.T / counts
+                covariance /= counts - 1
+                covariance[counts < 2] = np.nan
+        mean[~known] = np.nan
+        covariance[~known, :] = np.nan
+        covariance[:, ~known] = np.nan
+
+        return pd.Series(mean, index=labels), pd.DataFrame(covariance, index=labels, columns=labels)
+
+    def get_returns(self, symbols, labels = None):
+        '''Gets the data frame of the returns of the symbols, sorted by time, with the times any of them has a return.
+        The values are a read only view of the returns when the symbols are the first ones added, in order, otherwise a copy.
+        Views change with the next update, the data frame must not be kept
+        Args:
+            symbols: The symbols of the columns of the data frame
+            labels: The labels of the columns. Defaults to the symbols
+        Returns:
+            The returns (pandas.DataFrame), NaN where a symbol has no return'''
+        labels = list(symbols) if labels is None else list(labels)
+        columns = [self._column_by_symbol.get(symbol) for symbol in symbols]
+        known = np.array([column is not None for column in columns], dtype=bool)
+        if not known.any():
+            return pd.DataFrame(np.empty((0, len(labels))), columns=labels)
+
+        rows = slice(self._start, self._end)
+        if not self._sorted or not self._count_by_row[rows].all():
+            rows = self._start + np.flatnonzero(self._count_by_row[rows])
+            if not self._sorted:
+                rows = rows[np.argsort(self._times[rows], kind='stable')]
+
+        columns = np.array([column if column is not None else 0 for column in columns], dtype=np.intp)
+        if known.all() and np.array_equal(columns, np.arange(columns.size)):
+            values = self._values[rows, :columns.size]
+        else:
+            values = self._values[rows].take(columns, axis=1)
+            values[:, ~known] = np.nan
+        times = self._times[rows]
+
+        # Rows where only other symbols have returns
+        if np.count_nonzero(known) < len(self._column_by_symbol):
+            with_returns = ~np.isnan(values).all(axis=1)
+            if not with_returns.all():
+                values = values[with_returns]
+                times = times[with_returns]
+
+        if values.base is self._values:
+            values = values.view()
+            values.flags.writeable = False
+        return pd.DataFrame(values, index=pd.Index(times), columns=labels, copy=False)
+
+    def get_count(self, symbol):
+        '''Gets the number of returns of the symbol, at most period
+        Args:
+            symbol: The symbol of the returns'''
+        times = self._times_by_symbol.get(symbol)
+        return 0 if times is None else len(times)
+
+    @staticmethod
+    def _select(matrix, columns):
+        '''Copies the rows and columns of the matrix, a slice if the columns are the first ones in order'''
+        if np.array_equal(columns, np.arange(columns.size)):
+            return matrix[:columns.size, :columns.size].copy()
+        # Taking the rows then the columns is faster than indexing with np.ix_
+        return matrix.take(columns, axis=0).take(columns, axis=1)
+
+    def _add_symbol(self, symbol):
+        '''Gets a column for the symbol, growing the data frame if there are no free columns'''
+        if not self._free_columns:
+            size = self._values.shape[1]
+            capacity = max(2 * size, 8)
+            values = np.full((self._values.shape[0], capacity), np.nan)
+            values[:, :size] = self._values
+            self._values = values
+            for key, values in self._pending.items():
+                self._pending[key] = np.concatenate([values, np.full(capacity - size, np.nan)])
+            self._counts, self._sums, self._products = [np.pad(matrix, (0, capacity - size)) for matrix in (self._counts, self._sums, self._products)]
+            self._free_columns = list(range(capacity - 1, size - 1, -1))
+
+        column = self._free_columns.pop()
+        self._column_by_symbol[symbol] = column
+        self._times_by_symbol[symbol] = deque()
+        return column
+
+    def _get_row(self, time):
+        '''Gets the row of the time, taking the next one if the time is new'''
+        row = self._row_by_time.get(time)
+        if row is not None:
+            return row
+
+        if self._end == self._values.shape[0]:
+            self._move_rows()
+
+        row = self._end
+        self._end += 1
+        self._row_by_time[time] = row
+        self._times[row] = time
+        self._count_by_row[row] = 0
+        if self._last_time is not None and time < self._last_time:
+            self._sorted = False
+        else:
+            self._last_time = time
+        return row
+
+    def _move_rows(self):
+        '''Moves the rows with returns to the start of the array, sorted by time, growing it if they fill more than half of it.
+        Every row is moved once every capacity - rows new times, so it costs O(N) per time'''
+        # The pending rows are identified by their position, the sums are updated before the rows move
+        self._apply_pending()
+
+        rows = self._start + np.flatnonzero(self._count_by_row[self._start:self._end])
+        if not self._sorted:
+            rows = rows[np.argsort(self._times[rows], kind='stable')]
+        size = rows.size
+        capacity = max(self._values.shape[0], 2 * size, 2 * (self.period + 1))
+
+        values = np.full((capacity, self._values.shape[1]), np.nan)
+        values[:size] = self._values[rows]
+        times = np.empty(capacity, dtype=object)
+        times[:size] = self._times[rows]
+        count_by_row = np.zeros(capacity, dtype=int)
+        count_by_row[:size] = self._count_by_row[rows]
+
+        self._values, self._times, self._count_by_row = values, times, count_by_row
+        self._row_by_time = {time: row for row, time in enumerate(times[:size])}
+        self._start = 0
+        self._end = size
+        self._sorted = True
+
+    def _set_value(self, row, column, value):
+        '''Sets the value of the data frame, keeping the previous values of the row until the sums are updated'''
+        if row not in self._pending:
+            self._pending[row] = self._values[row].copy()
+        self._values[row, column] = value
+
+    def _free_row_if_empty(self, row):
+        '''Frees the row if none of the symbols has a return at its time. The oldest rows without returns are dropped,
+        the other ones are left until the rows move'''
+        if self._count_by_row[row] == 0:
+            del self._row_by_time[self._times[row]]
+            self._times[row] = None
+            while self._start < self._end and self._count_by_row[self._start] == 0:
+                self._start += 1
+
+    def _apply_pending(self):
+        '''Updates the sums with the rows that changed since the last call'''
+        if not self._pending:
+            return
+
+        # Computing the sums again is cheaper than many rank one updates, and also clears the accumulated rounding errors
+        self._updates_since_recompute += len(self._pending)
+        if 2 * len(self._pending) >= len(self._row_by_time) or self._updates_since_recompute >= 2 * self.period:
+            self._recompute()
+            return
+
+        # Remove the previous values of the rows and add the current ones, with a single rank k update of every sum
+        rows = list(self._pending)
+        values = np.vstack([np.array(list(self._pending.values())), self._values[rows]])
+        signs = np.repeat([-1., 1.], len(rows))[:, None]
+        mask = (~np.isnan(values)).astype(float)
+        values = np.where(mask > 0, values, 0)
+        self._add_product(self._counts, signs * mask, mask)
+        self._add_product(self._sums, signs * values, mask)
+        self._add_product(self._products, signs * values, values)
+        self._pending.clear()
+
+    @staticmethod
+    def _add_product(matrix, left, right):
+        '''Adds leftᵀ @ right to the matrix in place, without allocating a temporary N x N matrix'''
+        # BLAS works on column major matrices: the transpose of the row major matrix is updated with rightᵀ @ left
+        dgemm(1.0, right, left, beta=1.0, c=matrix.T, trans_a=True, overwrite_c=True)
+
+    def _recompute(self):
+        '''Computes the sums from all the rows of the data frame'''
+        # The rows without returns are NaN, they add nothing to the sums
+        values = self._values[self._start:self._end]
+        mask = (~np.isnan(values)).astype(float)
+        values = np.where(mask > 0, values, 0)
+        self._counts = mask.T @ mask
+        self._sums = values.T @ mask
+        self._products = values.T @ values
+        self._pending.clear()
+        self._updates_since_recompute = 0
@@ -1018,11 +1018,15 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="columnar">Whether to build the data frame from numpy arrays, without creating python objects per row.
+        /// Faster and lighter for large requests, the resulting data frame is the same</param>
+        /// <param name="fields">Optional list of the columns to include, e.g. ["close"]. The other columns are never created</param>
         /// <returns>A python dictionary with pandas DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject tickers, int periods, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, bool columnar = false,
+            PyObject fields = null)
         {
             if (tickers.TryConvert<Universe>(out var universe))
             {
@@ -1030,13 +1034,13 @@ namespace QuantConnect.Algorithm
                 var requests = CreateBarCountHistoryRequests(new[] { universe.Symbol }, universe.DataType, periods, resolution, fillForward, extendedMarketHours,
                     dataMappingMode, dataNormalizationMode, contractDepthOffset);
                 // we pass in 'BaseDataCollection' type so we clean up the data frame if we can
-                return GetDataFrame(History(requests.Where(x => x != null)), flatten, typeof(BaseDataCollection));
+                return GetDataFrame(History(requests.Where(x => x != null)), flatten, typeof(BaseDataCollection), columnar, fields);
             }
             if (tickers.TryCreateType(out var type))
             {
                 var requests = CreateBarCountHistoryRequests(Securities.Keys, type, periods, resolution, fillForward, extendedMarketHours,
                     dataMappingMode, dataNormalizationMode, contractDepthOffset);
-                return GetDataFrame(History(requests.Where(x => x != null)), flatten, type);
+                return GetDataFrame(History(requests.Where(x => x != null)), flatten, type, columnar, fields);
             }
 
             var symbols = tickers.ConvertToSymbolEnumerable().ToArray();
@@ -1045,7 +1049,9 @@ namespace QuantConnect.Algorithm
             return GetDataFrame(
                 History(symbols, periods, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode, contractDepthOffset),
                 flatten,
-                dataType);
+                dataType,
+                columnar,
+                fields);
         }
 
         /// <summary>
@@ -1065,14 +1071,18 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="columnar">Whether to build the data frame from numpy arrays, without creating python objects per row.
+        /// Faster and lighter for large requests, the resulting data frame is the same</param>
+        /// <param name="fields">Optional list of the columns to include, e.g. ["close"]. The other columns are never created</param>
         /// <returns>A python dictionary with pandas DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject tickers, TimeSpan span, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, bool columnar = false,
+            PyObject fields = null)
         {
             return History(tickers, Time - span, Time, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode,
-                contractDepthOffset, flatten);
+                contractDepthOffset, flatten, columnar, fields);
         }
 
         /// <summary>
@@ -1092,11 +1102,97 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="columnar">Whether to build the data frame from numpy arrays, without creating python objects per row.
+        /// Faster and lighter for large requests, the resulting data frame is the same</param>
+        /// <param name="fields">Optional list of the columns to include, e.g. ["close"]. The other columns are never created</param>
         /// <returns>A python dictionary with a pandas DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, bool columnar = false,
+            PyObject fields = null)
+        {
+            var history = GetHistorySlices(tickers, start, end, resolution, fillForward, extendedMarketHours, dataMappingMode,
+                dataNormalizationMode, contractDepthOffset, out var dataType);
+            return GetDataFrame(history, flatten, dataType, columnar, fields);
+        }
+
+        /// <summary>
+        /// Gets the historical data for the specified symbols between the specified dates as a sequence of data frames,
+        /// one per chunk of time. The data is streamed from the history provider and converted one chunk at a time,
+        /// so the memory used is bounded by the chunk size instead of the whole request.
+        /// The symbols must exist in the Securities collection.
+        /// </summary>
+        /// <param name="tickers">The symbols to retrieve historical data for</param>
+        /// <param name="start">The start time in the algorithm's time zone</param>
+        /// <param name="end">The end time in the algorithm's time zone</param>
+        /// <param name="resolution">The resolution to request</param>
+        /// <param name="chunk">The span of time of each data frame, 5 days by default</param>
+        /// <param name="fillForward">True to fill forward missing data, false otherwise</param>
+        /// <param name="extendedMarketHours">True to include extended market hours data, false otherwise</param>
+        /// <param name="dataMappingMode">The contract mapping mode to use for the security history request</param>
+        /// <param name="dataNormalizationMode">The price scaling mode to use for the securities history</param>
+        /// <param name="contractDepthOffset">The continuous contract desired offset from the current front month.
+        /// For example, 0 will use the front month, 1 will use the back month contract</param>
+        /// <param name="flatten">Whether to flatten the resulting data frames.
+        /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
+        /// If flatten is true, the resulting data frame will contain one row per universe constituent,
+        /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="columnar">Whether to build the data frames from numpy arrays, without creating python objects per row</param>
+        /// <param name="fields">Optional list of the columns to include, e.g. ["close"]. The other columns are never created</param>
+        /// <returns>An enumerable of pandas DataFrames containing the requested historical data, in time order</returns>
+        [DocumentationAttribute(HistoricalData)]
+        public IEnumerable<PyObject> HistoryChunks(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null, TimeSpan? chunk = null,
+            bool? fillForward = null, bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null,
+            DataNormalizationMode? dataNormalizationMode = null, int? contractDepthOffset = null, bool flatten = false, bool columnar = false,
+            PyObject fields = null)
+        {
+            var chunkSpan = chunk ?? TimeSpan.FromDays(5);
+            if (chunkSpan <= TimeSpan.Zero)
+            {
+                throw new ArgumentException($"The history chunk size must be positive, got {chunkSpan}", nameof(chunk));
+            }
+
+            // the requests are validated here, the data frames are created as they are iterated
+            var history = GetHistorySlices(tickers, start, end, resolution, fillForward, extendedMarketHours, dataMappingMode,
+                dataNormalizationMode, contractDepthOffset, out var dataType);
+            return GetDataFrameChunks(RemoveMemoizing(history), start, chunkSpan, flatten, dataType, columnar, fields);
+        }
+
+        /// <summary>
+        /// Converts the slices into one data frame per chunk of time, buffering a single chunk at a time
+        /// </summary>
+        private IEnumerable<PyObject> GetDataFrameChunks(IEnumerable<Slice> history, DateTime start, TimeSpan chunk, bool flatten, Type dataType,
+            bool columnar, PyObject fields)
+        {
+            var chunkEnd = start + chunk;
+            var slices = new List<Slice>();
+            foreach (var slice in history)
+            {
+                if (slice.Time >= chunkEnd && slices.Count > 0)
+                {
+                    yield return GetDataFrame(slices, flatten, dataType, columnar, fields);
+                    slices = new List<Slice>();
+                }
+                while (slice.Time >= chunkEnd)
+                {
+                    chunkEnd += chunk;
+                }
+                slices.Add(slice);
+            }
+
+            if (slices.Count > 0)
+            {
+                yield return GetDataFrame(slices, flatten, dataType, columnar, fields);
+            }
+        }
+
+        /// <summary>
+        /// Gets the history slices for the symbols, universe or data type of the python object between the specified dates
+        /// </summary>
+        private IEnumerable<Slice> GetHistorySlices(PyObject tickers, DateTime start, DateTime end, Resolution? resolution, bool? fillForward,
+            bool? extendedMarketHours, DataMappingMode? dataMappingMode, DataNormalizationMode? dataNormalizationMode, int? contractDepthOffset,
+            out Type dataType)
         {
             if (tickers.TryConvert<Universe>(out var universe))
             {
@@ -1104,22 +1200,20 @@ namespace QuantConnect.Algorithm
                 var requests = CreateDateRangeHistoryRequests(new[] { universe.Symbol }, universe.DataType, start, end, resolution, fillForward, extendedMarketHours,
                     dataMappingMode, dataNormalizationMode, contractDepthOffset);
                 // we pass in 'BaseDataCollection' type so we clean up the data frame if we can
-                return GetDataFrame(History(requests.Where(x => x != null)), flatten, typeof(BaseDataCollection));
+                dataType = typeof(BaseDataCollection);
+                return History(requests.Where(x => x != null));
             }
             if (tickers.TryCreateType(out var type))
             {
                 var requests = CreateDateRangeHistoryRequests(Securities.Keys, type, start, end, resolution, fillForward, extendedMarketHours,
                     dataMappingMode, dataNormalizationMode, contractDepthOffset);
-                return GetDataFrame(History(requests.Where(x => x != null)), flatten, type);
+                dataType = type;
+                return History(requests.Where(x => x != null));
             }
 
             var symbols = tickers.ConvertToSymbolEnumerable().ToArray();
-            var dataType = Extensions.GetCustomDataTypeFromSymbols(symbols);
-
-            return GetDataFrame(
-                History(symbols, start, end, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode, contractDepthOffset),
-                flatten,
-                dataType);
+            dataType = Extensions.GetCustomDataTypeFromSymbols(symbols);
+            return History(symbols, start, end, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode, contractDepthOffset);
         }
 
         /// <summary>
@@ -1140,17 +1234,21 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="columnar">Whether to build the data frame from numpy arrays, without creating python objects per row.
+        /// Faster and lighter for large requests, the resulting data frame is the same</param>
+        /// <param name="fields">Optional list of the columns to include, e.g. ["close"]. The other columns are never created</param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject type, PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null,
             bool? fillForward = null, bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null,
-            DataNormalizationMode? dataNormalizationMode = null, int? contractDepthOffset = null, bool flatten = false)
+            DataNormalizationMode? dataNormalizationMode = null, int? contractDepthOffset = null, bool flatten = false, bool columnar = false,
+            PyObject fields = null)
         {
             var symbols = tickers.ConvertToSymbolEnumerable().ToArray();
             var requestedType = type.CreateType();
             var requests = CreateDateRangeHistoryRequests(symbols, requestedType, start, end, resolution, fillForward, extendedMarketHours,
                 dataMappingMode, dataNormalizationMode, contractDepthOffset);
-            return GetDataFrame(History(requests.Where(x => x != null)), flatten, requestedType);
+            return GetDataFrame(History(requests.Where(x => x != null)), flatten, requestedType, columnar, fields);
         }
 
         /// <summary>
@@ -1172,11 +1270,15 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="columnar">Whether to build the data frame from numpy arrays, without creating python objects per row.
+        /// Faster and lighter for large requests, the resulting data frame is the same</param>
+        /// <param name="fields">Optional list of the columns to include, e.g. ["close"]. The other columns are never created</param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject type, PyObject tickers, int periods, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, bool columnar = false,
+            PyObject fields = null)
         {
             var symbols = tickers.ConvertToSymbolEnumerable().ToArray();
             var requestedType = type.CreateType();
@@ -1185,7 +1287,7 @@ namespace QuantConnect.Algorithm
             var requests = CreateBarCountHistoryRequests(symbols, requestedType, periods, resolution, fillForward, extendedMarketHours,
                 dataMappingMode, dataNormalizationMode, contractDepthOffset);
 
-            return GetDataFrame(History(requests.Where(x => x != null)), flatten, requestedType);
+            return GetDataFrame(History(requests.Where(x => x != null)), flatten, requestedType, columnar, fields);
         }
 
         /// <summary>
@@ -1206,14 +1308,18 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="columnar">Whether to build the data frame from numpy arrays, without creating python objects per row.
+        /// Faster and lighter for large requests, the resulting data frame is the same</param>
+        /// <param name="fields">Optional list of the columns to include, e.g. ["close"]. The other columns are never created</param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject type, PyObject tickers, TimeSpan span, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, bool columnar = false,
+            PyObject fields = null)
         {
             return History(type, tickers, Time - span, Time, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode,
-                contractDepthOffset, flatten);
+                contractDepthOffset, flatten, columnar, fields);
         }
 
         /// <summary>
@@ -1234,14 +1340,18 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="columnar">Whether to build the data frame from numpy arrays, without creating python objects per row.
+        /// Faster and lighter for large requests, the resulting data frame is the same</param>
+        /// <param name="fields">Optional list of the columns to include, e.g. ["close"]. The other columns are never created</param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject type, Symbol symbol, DateTime start, DateTime end, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, bool columnar = false,
+            PyObject fields = null)
         {
             return History(type.CreateType(), symbol, start, end, resolution, fillForward, extendedMarketHours, dataMappingMode,
-                dataNormalizationMode, contractDepthOffset, flatten);
+                dataNormalizationMode, contractDepthOffset, flatten, columnar, fields);
         }
 
         /// <summary>
@@ -1262,10 +1372,13 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="columnar">Whether to build the data frame from numpy arrays, without creating python objects per row.
+        /// Faster and lighter for large requests, the resulting data frame is the same</param>
+        /// <param name="fields">Optional list of the columns to include, e.g. ["close"]. The other columns are never created</param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         private PyObject History(Type type, Symbol symbol, DateTime start, DateTime end, Resolution? resolution, bool? fillForward,
             bool? extendedMarketHours, DataMappingMode? dataMappingMode, DataNormalizationMode? dataNormalizationMode,
-            int? contractDepthOffset, bool flatten)
+            int? contractDepthOffset, bool flatten, bool columnar, PyObject fields)
         {
             var requests = CreateDateRangeHistoryRequests(new[] { symbol }, type, start, end, resolution, fillForward,
                 extendedMarketHours, dataMappingMode, dataNormalizationMode, contractDepthOffset);
@@ -1275,7 +1388,7 @@ namespace QuantConnect.Algorithm
                     $"This could be due to the specified security not being of the requested type. Symbol: {symbol} Requested Type: {type.Name}");
             }
 
-            return GetDataFrame(History(requests), flatten, type);
+            return GetDataFrame(History(requests), flatten, type, columnar, fields);
         }
 
         /// <summary>
@@ -1297,11 +1410,15 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="columnar">Whether to build the data frame from numpy arrays, without creating python objects per row.
+        /// Faster and lighter for large requests, the resulting data frame is the same</param>
+        /// <param name="fields">Optional list of the columns to include, e.g. ["close"]. The other columns are never created</param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject type, Symbol symbol, int periods, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, bool columnar = false,
+            PyObject fields = null)
         {
             var managedType = type.CreateType();
             resolution = GetResolution(symbol, resolution, managedType);
@@ -1311,7 +1428,7 @@ namespace QuantConnect.Algorithm
             var start = _historyRequestFactory.GetStartTimeAlgoTz(symbol, periods, resolution.Value, marketHours.ExchangeHours,
                 marketHours.DataTimeZone, managedType, extendedMarketHours);
             return History(managedType, symbol, start, Time, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode,
-                contractDepthOffset, flatten);
+                contractDepthOffset, flatten, columnar, fields);
         }
 
         /// <summary>
@@ -1332,14 +1449,18 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="columnar">Whether to build the data frame from numpy arrays, without creating python objects per row.
+        /// Faster and lighter for large requests, the resulting data frame is the same</param>
+        /// <param name="fields">Optional list of the columns to include, e.g. ["close"]. The other columns are never created</param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject type, Symbol symbol, TimeSpan span, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, bool columnar = false,
+            PyObject fields = null)
         {
             return History(type, symbol, Time - span, Time, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode,
-                contractDepthOffset, flatten);
+                contractDepthOffset, flatten, columnar, fields);
         }
 
         /// <summary>
@@ -2063,9 +2184,9 @@ namespace QuantConnect.Algorithm
         /// <summary>
         /// Converts an enumerable of Slice into a Python Pandas data frame
         /// </summary>
-        protected PyObject GetDataFrame(IEnumerable<Slice> data, bool flatten, Type dataType = null)
+        protected PyObject GetDataFrame(IEnumerable<Slice> data, bool flatten, Type dataType = null, bool columnar = false, PyObject fields = null)
         {
-            var history = PandasConverter.GetDataFrame(RemoveMemoizing(data), flatten, dataType);
+            var history = PandasConverter.GetDataFrame(RemoveMemoizing(data), flatten, dataType, columnar, GetHistoryFields(fields));
             return flatten ? history : TryCleanupCollectionDataFrame(dataType, history);
         }
 
@@ -2079,6 +2200,30 @@ namespace QuantConnect.Algorithm
             return flatten ? history : TryCleanupCollectionDataFrame(typeof(T), history);
         }
 
+        /// <summary>
+        /// Gets the column names of a history fields argument, either a single name or a list of them
+        /// </summary>
+        private static string[] GetHistoryFields(PyObject fields)
+        {
+            if (fields == null)
+            {
+                return null;
+            }
+
+            using (Py.GIL())
+            {
+                if (fields.IsNone())
+                {
+                    return null;
+                }
+                if (PyString.IsStringType(fields))
+                {
+                    return new[] { fields.As<string>() };
+                }
+                return fields.As<string[]>();
+            }
+        }
+
         private IEnumerable<T> RemoveMemoizing<T>(IEnumerable<T> data)
         {
             var memoizingEnumerable = data as MemoizingEnumerable<T>;
@@ -18,12 +18,17 @@ Allowing support for indexing of Lean created Indexes with tickers like "SPY", S
 
 '''
 
+import threading
+import numpy as np
 import pandas as pd
+from contextlib import ContextDecorator
 from pandas.core.indexes.frozen import FrozenList as pdFrozenList
 
 from clr import AddReference
 AddReference("QuantConnect.Common")
+AddReference("QuantConnect.Configuration")
 from QuantConnect import *
+from QuantConnect.Configuration import Config
 
 class PandasColumn(str):
     '''
@@ -42,39 +47,181 @@ class PandasColumn(str):
     def __hash__(self):
         return super().__hash__()
 
+# Resolutions of strings to Symbols by the SymbolCache, None if they don't resolve.
+# Cleared when the SymbolCache version changes, so a ticker added or removed later is resolved again.
+# The version is read once per mapped pandas operation, not per key, so a repeated lookup is a dictionary hit
+_symbols = {}
+_symbols_version = None
+_symbols_max_size = 100000
+
+def _validate_symbols():
+    '''Clears the resolved Symbols if the SymbolCache changed or if there are too many'''
+    global _symbols_version
+    version = SymbolCache.version
+    if version != _symbols_version or len(_symbols) > _symbols_max_size:
+        _symbols.clear()
+        _symbols_version = version
+
+def _get_symbol(key):
+    '''Gets the Symbol the string resolves to using the SymbolCache, None if it doesn't resolve.
+    The results, including the negative ones, are cached until the SymbolCache changes.
+    The caller validates the cache first
+    '''
+    try:
+        return _symbols[key]
+    except KeyError:
+        kvp = SymbolCache.try_get_symbol(key, None)
+        symbol = kvp[1] if kvp[0] else None
+        _symbols[key] = symbol
+        return symbol
+
+def _map_sequence(keys):
+    '''Maps the elements of a list or tuple, resolving all their strings with a single SymbolCache call'''
+    tickers = {key for key in keys if type(key) is str}
+    missing = [key for key in tickers if key not in _symbols]
+    if missing:
+        _symbols.update(zip(missing, SymbolCache.try_get_symbols(missing)))
+    symbols = {key: _symbols[key] for key in tickers}
+
+    mapped = []
+    for key in keys:
+        if type(key) is str:
+            symbol = symbols[key]
+            mapped.append(key if symbol is None else symbol)
+        else:
+            mapped.append(_map(key))
+    return mapped
+
 def mapper(key):
     '''Maps a Symbol object or a Symbol Ticker (string) to the string representation of
     Symbol SecurityIdentifier.If cannot map, returns the object
     '''
+    _validate_symbols()
+    return _map(key)
+
+def _map(key):
+    '''Maps the key like mapper, without validating the resolved Symbols'''
     keyType = type(key)
     if keyType is tuple:
-        return tuple(mapper(x) for x in key)
+        return tuple(_map_sequence(key))
     if keyType is str:
-        kvp = SymbolCache.try_get_symbol(key, None)
-        if kvp[0]:
-            return kvp[1]
+        symbol = _get_symbol(key)
+        if symbol is not None:
+            return symbol
         return key
     if keyType is list:
-        return [mapper(x) for x in key]
+        return _map_sequence(key)
     if keyType is dict:
-        return {k: mapper(v) for k, v in key.items()}
+        return {k: _map(v) for k, v in key.items()}
+    if keyType is np.ndarray and key.ndim == 1 and key.dtype.kind in 'OU':
+        values = key.tolist()
+        mapped = _map_sequence(values)
+        if all(x is y for x, y in zip(mapped, values)):
+            return key
+        result = np.empty(len(mapped), dtype=object)
+        result[:] = mapped
+        return result
     return key
 
+def _has_str_key(key):
+    '''Whether the key contains a string the mapper could remap, mirroring the types mapper handles'''
+    keyType = type(key)
+    if keyType is str:
+        return True
+    if keyType is tuple or keyType is list:
+        return any(_has_str_key(x) for x in key)
+    if keyType is dict:
+        return any(_has_str_key(x) for x in key.values())
+    # Arrays of strings or objects, not scanned since mapping them is as expensive
+    if keyType is np.ndarray:
+        return key.dtype.kind in 'OU'
+    return False
+
+def _is_lean_index(index):
+    '''Whether the index can contain Lean Symbols. Symbols are stored in object indexes that pandas
+    infers as 'mixed', the inferred type is cached by pandas so this is cheap after the first call
+    '''
+    if isinstance(index, pd.MultiIndex):
+        return any(_is_lean_index(level) for level in index.levels)
+    return index.dtype == object and index.inferred_type == 'mixed'
+
+class _MappingState(threading.local):
+    '''Per thread state of lean_pandas_mapping, the mapping is enabled by default on every thread'''
+    def __init__(self):
+        self.enabled = True
+        self.previous = []
+
+_mapping_state = _MappingState()
+
+class lean_pandas_mapping(ContextDecorator):
+    '''Context manager and decorator that enables or disables the mapping of keys on the current thread.
+    Disabling it runs pandas indexing natively, e.g. for numerical code that never indexes by ticker:
+
+        with lean_pandas_mapping(False):
+            ...
+
+        @lean_pandas_mapping(False)
+        def optimize(returns):
+            ...
+    '''
+    def __init__(self, enabled = True):
+        self.enabled = enabled
+
+    def __enter__(self):
+        # A stack since the same instance can be entered again by a recursive call of a decorated function
+        _mapping_state.previous.append(_mapping_state.enabled)
+        _mapping_state.enabled = self.enabled
+        return self
+
+    def __exit__(self, *exc):
+        _mapping_state.enabled = _mapping_state.previous.pop()
+        return False
+
+def _needs_mapping(args, kwargs):
+    '''Whether the keys of an indexing call should be remapped: only string keys on Lean indexes are,
+    unless the mapping is disabled on this thread.
+    The first argument is the indexed object: an indexer (loc, at...), an Index or a DataFrame
+    '''
+    if not _mapping_state.enabled:
+        return False
+    for key in args[1:]:
+        if _has_str_key(key):
+            break
+    else:
+        if not kwargs or not _has_str_key(kwargs):
+            return False
+
+    obj = args[0]
+    if isinstance(obj, pd.Index):
+        return _is_lean_index(obj)
+
+    if not isinstance(obj, pd.DataFrame):
+        # Indexers keep the indexed frame or series in obj, avoiding getattr that DataFrame resolves to columns
+        obj = obj.obj
+    if isinstance(obj, pd.DataFrame) and _is_lean_index(obj.columns):
+        return True
+    return _is_lean_index(obj.index)
+
 def wrap_keyerror_function(f):
     '''Wraps function f with wrapped_function, used for functions that throw KeyError when not found.
     wrapped_function converts the args / kwargs to use alternative index keys and then calls the function.
     If this fails we fall back to the original key and try it as well, if they both fail we throw our error.
+    Calls without string keys or on indexes without Lean Symbols go straight to pandas.
     '''
     def wrapped_function(*args, **kwargs):
+        if not _needs_mapping(args, kwargs):
+            return f(*args, **kwargs)
+
         # Map args & kwargs and execute function
+        _validate_symbols()
         try:
             newargs = args
             newkwargs = kwargs
 
             if len(args) > 1:
-                newargs = mapper(args)
+                newargs = _map(args)
             if len(kwargs) > 0:
-                newkwargs = mapper(kwargs)
+                newkwargs = _map(kwargs)
 
             return f(*newargs, **newkwargs)
         except KeyError as e:
@@ -101,17 +248,18 @@ def wrap_bool_function(f):
 
         # Try the original args; if true just return true
         originalResult = f(*args, **kwargs)
-        if originalResult:
+        if originalResult or not _needs_mapping(args, kwargs):
             return originalResult
 
         # Try our mapped args; return this result regardless
+        _validate_symbols()
         newargs = args
         newkwargs = kwargs
 
         if len(args) > 1:
-            newargs = mapper(args)
+            newargs = _map(args)
         if len(kwargs) > 0:
-            newkwargs = mapper(kwargs)
+            newkwargs = _map(kwargs)
 
         return f(*newargs, **newkwargs)
 
@@ -119,22 +267,38 @@ def wrap_bool_function(f):
     return wrapped_function
 
 
+# Pandas functions wrapped by this module: (owner, name, native function, wrapped function)
+_wrapped_functions = []
+
+def _wrap(owner, name, wrapper):
+    native = getattr(owner, name)
+    _wrapped_functions.append((owner, name, native, wrapper(native)))
+
+def set_lean_pandas_mapping(enabled):
+    '''Installs or removes the wrapped pandas functions for the whole process.
+    When removed pandas runs natively on every thread, regardless of lean_pandas_mapping
+    '''
+    for owner, name, native, wrapped in _wrapped_functions:
+        setattr(owner, name, wrapped if enabled else native)
+
 # Wrap all core indexing functions that are shared, yet still throw key errors if index not found
-pd.core.indexing._LocationIndexer.__getitem__ = wrap_keyerror_function(pd.core.indexing._LocationIndexer.__getitem__)
-pd.core.indexing._ScalarAccessIndexer.__getitem__ = wrap_keyerror_function(pd.core.indexing._ScalarAccessIndexer.__getitem__)
-pd.core.indexes.base.Index.get_loc = wrap_keyerror_function(pd.core.indexes.base.Index.get_loc)
+_wrap(pd.core.indexing._LocationIndexer, '__getitem__', wrap_keyerror_function)
+_wrap(pd.core.indexing._ScalarAccessIndexer, '__getitem__', wrap_keyerror_function)
+_wrap(pd.core.indexes.base.Index, 'get_loc', wrap_keyerror_function)
 
 # Wrap our DF _getitem__ as well, even though most pathways go through the above functions
 # There are cases like indexing with an array that need to be mapped earlier to stop KeyError from arising
-pd.core.frame.DataFrame.__getitem__ = wrap_keyerror_function(pd.core.frame.DataFrame.__getitem__)
+_wrap(pd.core.frame.DataFrame, '__getitem__', wrap_keyerror_function)
 
 # For older version of pandas we may need to wrap extra functions
 if (int(pd.__version__.split('.')[0]) < 1):
-    pd.core.indexes.base.Index.get_value = wrap_keyerror_function(pd.core.indexes.base.Index.get_value)
+    _wrap(pd.core.indexes.base.Index, 'get_value', wrap_keyerror_function)
 
 # Special cases where we need to wrap a function that won't throw a keyerror when not found but instead returns true or false
 # Wrap __contains__ to support Python syntax like 'SPY' in DataFrame
-pd.core.indexes.base.Index.__contains__ = wrap_bool_function(pd.core.indexes.base.Index.__contains__)
+_wrap(pd.core.indexes.base.Index, '__contains__', wrap_bool_function)
+
+set_lean_pandas_mapping(Config.GetBool("python-pandas-mapping", True))
 
 # For compatibility with PandasData.cs usage of this module (Previously wrapped classes)
 FrozenList = pdFrozenList
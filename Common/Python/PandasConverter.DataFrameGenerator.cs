@@ -22,6 +22,7 @@ using System;
 using System.Collections;
 using System.Collections.Generic;
 using System.Linq;
+using System.Threading.Tasks;
 
 namespace QuantConnect.Python
 {
@@ -36,23 +37,37 @@ namespace QuantConnect.Python
             private static readonly string[] MultiCanonicalSymbolsDataFrameNames = new[] { "canonical", "time" };
             private static readonly string[] SingleBaseDataCollectionDataFrameNames = new[] { "time" };
 
+            /// <summary>
+            /// Number of slices buffered before their data is added to the <see cref="PandasData"/> instances in parallel.
+            /// Bounds the memory held by the buffered data
+            /// </summary>
+            private const int ParallelBatchSize = 1000;
+
             private readonly Type _dataType;
             private readonly bool _requestedTick;
             private readonly bool _requestedQuoteBar;
             private readonly bool _requestedTradeBar;
             private readonly bool _timeAsColumn;
+            private readonly bool _columnar;
+            private readonly IEnumerable<string> _fields;
 
             /// <summary>
             /// PandasData instances for each symbol. Does not hold BaseDataCollection instances.
             /// </summary>
             private Dictionary<Symbol, PandasData> _pandasData;
+            /// <summary>
+            /// Data waiting to be added to each <see cref="PandasData"/> instance when collecting in parallel.
+            /// For trade and quote bars pairs, the trade bar is stored as the data. Custom and python data are never buffered
+            /// </summary>
+            private Dictionary<PandasData, List<(BaseData Data, QuoteBar QuoteBar, bool IsBarPair)>> _pendingData;
             private List<(Symbol Symbol, DateTime Time, IEnumerable<ISymbolProvider> Data)> _collections;
 
             private int _maxLevels;
             private bool _shouldUseSymbolOnlyIndex;
             private readonly bool _flatten;
 
-            protected DataFrameGenerator(Type dataType = null, bool timeAsColumn = false, bool flatten = false)
+            protected DataFrameGenerator(Type dataType = null, bool timeAsColumn = false, bool flatten = false, bool columnar = false,
+                IEnumerable<string> fields = null)
             {
                 _dataType = dataType;
                 // if no data type is requested we check all
@@ -61,10 +76,13 @@ namespace QuantConnect.Python
                 _requestedQuoteBar = dataType == null || dataType == typeof(QuoteBar);
                 _timeAsColumn = timeAsColumn;
                 _flatten = flatten;
+                _columnar = columnar;
+                _fields = fields;
             }
 
-            public DataFrameGenerator(IEnumerable<Slice> slices, bool flatten = false, Type dataType = null)
-                : this(dataType, flatten: flatten)
+            public DataFrameGenerator(IEnumerable<Slice> slices, bool flatten = false, Type dataType = null, bool columnar = false,
+                IEnumerable<string> fields = null)
+                : this(dataType, flatten: flatten, columnar: columnar, fields: fields)
             {
                 AddData(slices);
             }
@@ -77,7 +95,12 @@ namespace QuantConnect.Python
             protected void AddData(IEnumerable<Slice> slices)
             {
                 HashSet<SecurityIdentifier> addedData = null;
+                if (MaxDegreeOfParallelism > 1)
+                {
+                    _pendingData = new();
+                }
 
+                var pendingSlices = 0;
                 foreach (var slice in slices)
                 {
                     foreach (var data in slice.AllData)
@@ -91,14 +114,14 @@ namespace QuantConnect.Python
                         var pandasData = GetPandasData(data);
                         if (pandasData.IsCustomData || (_requestedTick && data is Tick))
                         {
-                            pandasData.Add(data);
+                            AddToPandasData(pandasData, data);
                         }
                         else
                         {
                             if (!_requestedTradeBar && !_requestedQuoteBar && _dataType != null && data.GetType().IsAssignableTo(_dataType))
                             {
                                 // support for auxiliary data history requests
-                                pandasData.Add(data);
+                                AddToPandasData(pandasData, data);
                                 continue;
                             }
 
@@ -127,11 +150,95 @@ namespace QuantConnect.Python
                                     slice.Bars.TryGetValue(quoteBar.Symbol, out tradeBar);
                                 }
                             }
-                            pandasData.Add(tradeBar, quoteBar);
+                            AddToPandasData(pandasData, tradeBar, quoteBar);
                         }
                     }
 
                     addedData?.Clear();
+
+                    if (_pendingData != null && ++pendingSlices == ParallelBatchSize)
+                    {
+                        AddPendingData();
+                        pendingSlices = 0;
+                    }
+                }
+
+                AddPendingData();
+                _pendingData = null;
+            }
+
+            private void AddToPandasData(PandasData pandasData, BaseData data)
+            {
+                // custom and python data members might call into python, they are always collected by this thread
+                if (_pendingData == null || pandasData.IsCustomData || data is IPythonDerivedType)
+                {
+                    pandasData.Add(data);
+                    return;
+                }
+                GetPendingData(pandasData).Add((data, null, false));
+            }
+
+            private void AddToPandasData(PandasData pandasData, TradeBar tradeBar, QuoteBar quoteBar)
+            {
+                if (_pendingData == null || tradeBar is IPythonDerivedType || quoteBar is IPythonDerivedType)
+                {
+                    pandasData.Add(tradeBar, quoteBar);
+                    return;
+                }
+                GetPendingData(pandasData).Add((tradeBar, quoteBar, true));
+            }
+
+            private List<(BaseData Data, QuoteBar QuoteBar, bool IsBarPair)> GetPendingData(PandasData pandasData)
+            {
+                if (!_pendingData.TryGetValue(pandasData, out var pendingData))
+                {
+                    _pendingData[pandasData] = pendingData = new();
+                }
+                return pendingData;
+            }
+
+            /// <summary>
+            /// Adds the buffered data to their <see cref="PandasData"/> instances, one symbol per thread.
+            /// The data of each symbol is added in order, so the result is the same as adding it sequentially.
+            /// Only Lean data types are buffered, no python object is created while collecting the values.
+            /// The GIL is released while the threads collect, so the caller doesn't block python
+            /// </summary>
+            private void AddPendingData()
+            {
+                if (_pendingData == null || _pendingData.Count == 0)
+                {
+                    return;
+                }
+
+                // the caller might hold the GIL, take it so we can release it whichever the case
+                using (Py.GIL())
+                {
+                    var state = PythonEngine.BeginAllowThreads();
+                    try
+                    {
+                        var options = new ParallelOptions { MaxDegreeOfParallelism = MaxDegreeOfParallelism };
+                        Parallel.ForEach(_pendingData, options, kvp =>
+                        {
+                            var pandasData = kvp.Key;
+                            foreach (var (data, quoteBar, isBarPair) in kvp.Value)
+                            {
+                                if (isBarPair)
+                                {
+                                    pandasData.Add((TradeBar)data, quoteBar);
+                                }
+                                else
+                                {
+                                    pandasData.Add(data);
+                                }
+                            }
+                            kvp.Value.Clear();
+                        });
+                    }
+                    finally
+                    {
+                        // we always need to reset the state so that we can dispose of the GIL
+                        PythonEngine.EndAllowThreads(state);
+                    }
                 }
             }
 
@@ -254,7 +361,7 @@ namespace QuantConnect.Python
 
                 foreach (var data in _pandasData.Values)
                 {
-                    yield return data.ToPandasDataFrame(levels ?? _maxLevels, filterMissingValueColumns);
+                    yield return data.ToPandasDataFrame(levels ?? _maxLevels, filterMissingValueColumns, _columnar);
                 }
             }
 
@@ -270,7 +377,8 @@ namespace QuantConnect.Python
 
                 foreach (var (symbol, time, data) in _collections.GroupBy(x => x.Symbol).SelectMany(x => x))
                 {
-                    var generator = new DataFrameGenerator(_dataType, timeAsColumn: !symbolOnlyIndex, flatten: _flatten);
+                    var generator = new DataFrameGenerator(_dataType, timeAsColumn: !symbolOnlyIndex, flatten: _flatten, columnar: _columnar,
+                        fields: _fields);
                     generator.AddData(data);
                     var dataFrame = generator.GenerateDataFrame(symbolOnlyIndex: symbolOnlyIndex, forceMultiValueSymbol: forceMultiValueSymbol);
 
@@ -283,7 +391,7 @@ namespace QuantConnect.Python
                 _pandasData ??= new();
                 if (!_pandasData.TryGetValue(data.Symbol, out var pandasData))
                 {
-                    pandasData = new PandasData(data, _timeAsColumn);
+                    pandasData = new PandasData(data, _timeAsColumn, _fields);
                     _pandasData[data.Symbol] = pandasData;
                     _maxLevels = Math.Max(_maxLevels, pandasData.Levels);
                 }
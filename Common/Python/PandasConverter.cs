@@ -14,6 +14,7 @@
 */
 
 using Python.Runtime;
+using QuantConnect.Configuration;
 using QuantConnect.Data;
 using QuantConnect.Indicators;
 using QuantConnect.Util;
@@ -31,6 +32,15 @@ namespace QuantConnect.Python
     {
         private static dynamic _pandas;
         private static PyObject _concat;
+        private static PyObject _seriesFactory;
+        private static PyObject _indexFactory;
+
+        /// <summary>
+        /// The maximum number of threads collecting the data of the different symbols of a history data frame.
+        /// The python objects are always created by a single thread, holding the GIL. Custom and python data are always collected sequentially.
+        /// Defaults to 1, which collects all the data sequentially
+        /// </summary>
+        public static int MaxDegreeOfParallelism { get; set; } = Config.GetInt("python-pandas-converter-parallelism", 1);
 
         /// <summary>
         /// Initializes the <see cref="PandasConverter"/> class
@@ -43,6 +53,8 @@ namespace QuantConnect.Python
                 _pandas = pandas;
                 // keep it so we don't need to ask for it each time
                 _concat = pandas.GetAttr("concat");
+                _seriesFactory = pandas.GetAttr("Series");
+                _indexFactory = pandas.GetAttr("Index");
             }
         }
 
@@ -53,10 +65,14 @@ namespace QuantConnect.Python
         /// <param name="flatten">Whether to flatten collections into rows and columns</param>
         /// <param name="dataType">Optional type of bars to add to the data frame
         /// If true, the base data items time will be ignored and only the base data collection time will be used in the index</param>
+        /// <param name="columnar">Whether to build the data frame from numpy arrays, without creating python objects per row.
+        /// Faster and lighter for large requests</param>
+        /// <param name="fields">Optional names of the columns to include, the rest of the data members are never read or converted</param>
         /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
-        public PyObject GetDataFrame(IEnumerable<Slice> data, bool flatten = false, Type dataType = null)
+        public PyObject GetDataFrame(IEnumerable<Slice> data, bool flatten = false, Type dataType = null, bool columnar = false,
+            IEnumerable<string> fields = null)
         {
-            var generator = new DataFrameGenerator(data, flatten, dataType);
+            var generator = new DataFrameGenerator(data, flatten, dataType, columnar, fields);
             return generator.GenerateDataFrame();
         }
 
@@ -94,21 +110,33 @@ namespace QuantConnect.Python
             using (Py.GIL())
             {
                 using var pyDict = new PyDict();
+                // the outputs of an indicator usually share their times, so they share the index
+                var indexCache = new Dictionary<IReadOnlyCollection<DateTime>, PyObject>(new ListComparer<DateTime>());
 
-                foreach (var kvp in data)
+                try
                 {
-                    AddSeriesToPyDict(kvp.Key, kvp.Value, pyDict);
-                }
+                    foreach (var kvp in data)
+                    {
+                        AddSeriesToPyDict(kvp.Key, kvp.Value, pyDict, indexCache);
+                    }
 
-                if (extraData != null)
+                    if (extraData != null)
+                    {
+                        foreach (var kvp in extraData)
+                        {
+                            AddDynamicSeriesToPyDict(kvp.Key, kvp.Value, pyDict, indexCache);
+                        }
+                    }
+
+                    return MakeIndicatorDataFrame(pyDict);
+                }
+                finally
                 {
-                    foreach (var kvp in extraData)
+                    foreach (var index in indexCache.Values)
                     {
-                        AddDynamicSeriesToPyDict(kvp.Key, kvp.Value, pyDict);
+                        index.Dispose();
                     }
                 }
-
-                return MakeIndicatorDataFrame(pyDict);
             }
         }
 
@@ -125,6 +153,8 @@ namespace QuantConnect.Python
                 var inputTypeStr = inputPythonType.ToString();
                 var targetTypeStr = nameof(PyDict);
                 PyObject currentKvp = null;
+                // the outputs of an indicator usually share their times, so they share the index
+                var indexCache = new Dictionary<IReadOnlyCollection<DateTime>, PyObject>(new ListComparer<DateTime>());
 
                 try
                 {
@@ -136,7 +166,7 @@ namespace QuantConnect.Python
                     foreach (var kvp in pyDictData.Items())
                     {
                         currentKvp = kvp;
-                        AddSeriesToPyDict(kvp[0].As<string>(), kvp[1].As<List<IndicatorDataPoint>>(), seriesPyDict);
+                        AddSeriesToPyDict(kvp[0].As<string>(), kvp[1].As<List<IndicatorDataPoint>>(), seriesPyDict, indexCache);
                     }
 
                     return MakeIndicatorDataFrame(seriesPyDict);
@@ -150,6 +180,13 @@ namespace QuantConnect.Python
 
                     throw new ArgumentException(Messages.PandasConverter.ConvertToDictionaryFailed(inputTypeStr, targetTypeStr, e.Message), e);
                 }
+                finally
+                {
+                    foreach (var index in indexCache.Values)
+                    {
+                        index.Dispose();
+                    }
+                }
             }
         }
 
@@ -276,10 +313,13 @@ namespace QuantConnect.Python
         /// <param name="key">Key to insert in the <see cref="PyDict"/></param>
         /// <param name="points">List of <see cref="IndicatorDataPoint"/> that will make up the resulting series</param>
         /// <param name="pyDict"><see cref="PyDict"/> where the resulting key-value pair will be inserted into</param>
-        private void AddSeriesToPyDict(string key, List<IndicatorDataPoint> points, PyDict pyDict)
+        /// <param name="indexCache">The indexes already created, keyed by their times</param>
+        /// <remarks>The values and the times are copied to python as numpy arrays, without a python object per point</remarks>
+        private void AddSeriesToPyDict(string key, List<IndicatorDataPoint> points, PyDict pyDict,
+            Dictionary<IReadOnlyCollection<DateTime>, PyObject> indexCache)
         {
-            var index = new List<DateTime>();
-            var values = new List<double>();
+            var index = new List<DateTime>(points.Count);
+            var values = new List<double>(points.Count);
 
             foreach (var point in points)
             {
@@ -289,7 +329,27 @@ namespace QuantConnect.Python
                     values.Add((double)point.Value);
                 }
             }
-            pyDict.SetItem(key.ToLowerInvariant(), _pandas.Series(values, index));
+
+            var pyIndex = GetIndicatorIndex(index, indexCache);
+            using var pyValues = PandasData.ToNumpyArray(values.ToArray());
+            using var kwargs = Py.kw("index", pyIndex);
+            using var series = _seriesFactory.Invoke(new[] { pyValues }, kwargs);
+            pyDict.SetItem(key.ToLowerInvariant(), series);
+        }
+
+        /// <summary>
+        /// Gets the datetime index of the given times, reusing the one of a previous series with the same times
+        /// </summary>
+        private static PyObject GetIndicatorIndex(List<DateTime> times, Dictionary<IReadOnlyCollection<DateTime>, PyObject> indexCache)
+        {
+            if (!indexCache.TryGetValue(times, out var index))
+            {
+                // numpy can't represent every date in nanoseconds, pandas handles those like before
+                using var source = PandasData.ToNumpyDateTimes(times) ?? times.ToPyListUnSafe();
+                index = _indexFactory.Invoke(source);
+                indexCache[times] = index;
+            }
+            return index;
         }
 
         /// <summary>
@@ -300,7 +360,9 @@ namespace QuantConnect.Python
         /// <param name="key">Key to insert in the <see cref="PyDict"/></param>
         /// <param name="entries">A list of tuples whose first item is the timestamp and whose second item is the value associated with that timestamp.</param>
         /// <param name="pyDict"><see cref="PyDict"/> where the resulting key-value pair will be inserted into</param>
-        private void AddDynamicSeriesToPyDict(string key, List<(DateTime Timestamp, object Value)> entries, PyDict pyDict)
+        /// <param name="indexCache">The indexes already created, keyed by their times</param>
+        private void AddDynamicSeriesToPyDict(string key, List<(DateTime Timestamp, object Value)> entries, PyDict pyDict,
+            Dictionary<IReadOnlyCollection<DateTime>, PyObject> indexCache)
         {
             var index = new List<DateTime>();
             var values = new List<object>();
@@ -313,7 +375,7 @@ namespace QuantConnect.Python
                     values.Add(value is Enum e ? e.ToString() : value);
                 }
             }
-            pyDict.SetItem(key.ToLowerInvariant(), _pandas.Series(values, index));
+            pyDict.SetItem(key.ToLowerInvariant(), _pandas.Series(values, GetIndicatorIndex(index, indexCache)));
         }
 
         /// <summary>
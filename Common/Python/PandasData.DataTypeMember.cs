@@ -40,7 +40,9 @@ namespace QuantConnect.Python
         /// </summary>
         private abstract class DataTypeMember
         {
-            private static readonly StringBuilder _stringBuilder = new StringBuilder();
+            // per thread, the data of different symbols can be collected in parallel
+            [ThreadStatic]
+            private static StringBuilder _stringBuilder;
 
             private DataTypeMember _parent;
             private string _name;
@@ -130,15 +132,17 @@ namespace QuantConnect.Python
 
             private string BuildMemberName(string baseName)
             {
-                _stringBuilder.Clear();
-                while (_parent != null && _parent.ShouldBeUnwrapped)
+                var stringBuilder = _stringBuilder ??= new StringBuilder();
+                stringBuilder.Clear();
+                var parent = _parent;
+                while (parent != null && parent.ShouldBeUnwrapped)
                 {
-                    _stringBuilder.Insert(0, _parent.Prefix);
-                    _parent = _parent._parent;
+                    stringBuilder.Insert(0, parent.Prefix);
+                    parent = parent._parent;
                 }
 
-                _stringBuilder.Append(baseName.ToLowerInvariant());
-                return _stringBuilder.ToString();
+                stringBuilder.Append(baseName.ToLowerInvariant());
+                return stringBuilder.ToString();
             }
 
             private IEnumerable<string> GetMemberNames(string parentPrefix)
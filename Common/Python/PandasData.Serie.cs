@@ -0,0 +1,375 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using Python.Runtime;
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Linq;
+
+namespace QuantConnect.Python
+{
+    public partial class PandasData
+    {
+        /// <summary>
+        /// The type of the values stored by a <see cref="Serie"/>
+        /// </summary>
+        private enum SerieType
+        {
+            /// <summary>
+            /// Only null values so far
+            /// </summary>
+            Null,
+            /// <summary>
+            /// Floating point values, null values are stored as NaN
+            /// </summary>
+            Double,
+            /// <summary>
+            /// Integer values without null values
+            /// </summary>
+            Long,
+            /// <summary>
+            /// Boolean values without null values
+            /// </summary>
+            Bool,
+            /// <summary>
+            /// Date times stored as ticks, null values are stored as <see cref="Serie.NullTicks"/>
+            /// </summary>
+            DateTime,
+            /// <summary>
+            /// Fallback for any other value or for mixed types
+            /// </summary>
+            Object
+        }
+
+        /// <summary>
+        /// Column of a data frame. Values are kept in typed buffers, without boxing, which are handed to numpy as contiguous arrays.
+        /// Falls back to object storage for mixed or non primitive types, where pandas infers the type of the column as before
+        /// </summary>
+        private class Serie
+        {
+            private static readonly IFormatProvider InvariantCulture = CultureInfo.InvariantCulture;
+
+            // numpy datetime64[ns] represents dates from 1677-09-21 to 2262-04-11
+            private static readonly long EpochTicks = new DateTime(1970, 1, 1).Ticks;
+            private static readonly long MinNanosecondTicks = new DateTime(1678, 1, 1).Ticks;
+            private static readonly long MaxNanosecondTicks = new DateTime(2262, 1, 1).Ticks;
+            private const long NullTicks = -1;
+            private const long NotATime = long.MinValue;
+
+            private SerieType _type;
+            private int _count;
+            private List<double> _doubles;
+            private List<long> _longs;
+            private List<bool> _bools;
+            private List<object> _objects;
+
+            public bool ShouldFilter { get; private set; }
+            public List<DateTime> Times { get; }
+
+            /// <summary>
+            /// The number of values in the serie
+            /// </summary>
+            public int Count => _count;
+
+            public Serie(bool withTimeIndex = true)
+            {
+                ShouldFilter = true;
+                if (withTimeIndex)
+                {
+                    Times = new();
+                }
+            }
+
+            public void Add(DateTime time, object input, bool overrideValues)
+            {
+                var value = input is decimal ? Convert.ToDouble(input, InvariantCulture) : input;
+                if (ShouldFilter)
+                {
+                    // we need at least 1 valid entry for the series not to get filtered
+                    if (value is double doubleValue)
+                    {
+                        if (!doubleValue.IsNaNOrZero())
+                        {
+                            ShouldFilter = false;
+                        }
+                    }
+                    else if (value is string stringValue)
+                    {
+                        if (!string.IsNullOrWhiteSpace(stringValue))
+                        {
+                            ShouldFilter = false;
+                        }
+                    }
+                    else if (value is bool boolValue)
+                    {
+                        if (boolValue)
+                        {
+                            ShouldFilter = false;
+                        }
+                    }
+                    else if (value != null)
+                    {
+                        if (value is ICollection enumerable)
+                        {
+                            if (enumerable.Count != 0)
+                            {
+                                ShouldFilter = false;
+                            }
+                        }
+                        else
+                        {
+                            ShouldFilter = false;
+                        }
+                    }
+                }
+
+                if (overrideValues && Times != null && Times.Count > 0 && Times[^1] == time)
+                {
+                    // If the time is the same as the last one, we overwrite the value
+                    RemoveLastValue();
+                    AddValue(value);
+                }
+                else
+                {
+                    AddValue(value);
+                    Times?.Add(time);
+                }
+            }
+
+            /// <summary>
+            /// Gets the value at the given position, boxed
+            /// </summary>
+            public object GetValue(int index)
+            {
+                return _type switch
+                {
+                    SerieType.Double => _doubles[index],
+                    SerieType.Long => _longs[index],
+                    SerieType.Bool => _bools[index],
+                    SerieType.DateTime => _longs[index] == NullTicks ? null : (object)new DateTime(_longs[index]),
+                    SerieType.Object => _objects[index],
+                    _ => null
+                };
+            }
+
+            /// <summary>
+            /// Gets the values as a numpy array for the typed buffers, or as a python list for object values
+            /// </summary>
+            public PyObject ToPython()
+            {
+                switch (_type)
+                {
+                    case SerieType.Double:
+                        return ToNumpy(_doubles.ToArray());
+                    case SerieType.Long:
+                        return ToNumpy(_longs.ToArray());
+                    case SerieType.Bool:
+                        // The buffer of a bool array has 4 bytes per item, so it's handed to numpy as bytes
+                        using (var bytes = ToNumpy(_bools.Select(x => x ? (byte)1 : (byte)0).ToArray()))
+                        {
+                            return bytes.InvokeMethod("view", _numpyBool);
+                        }
+                    case SerieType.DateTime:
+                        // Let pandas handle the dates numpy can't represent in nanoseconds, like before
+                        return ToNumpyDateTimes(_count, i => _longs[i]) ?? ToPythonList();
+                    default:
+                        return ToPythonList();
+                }
+            }
+
+            /// <summary>
+            /// Converts the times to a numpy datetime64[ns] array
+            /// </summary>
+            /// <returns>The numpy array, null if any of the times can't be represented in nanoseconds</returns>
+            public static PyObject ToNumpyDateTimes(List<DateTime> times)
+            {
+                return ToNumpyDateTimes(times.Count, i => times[i].Ticks);
+            }
+
+            private static PyObject ToNumpyDateTimes(int count, Func<int, long> getTicks)
+            {
+                var nanoseconds = new long[count];
+                for (var i = 0; i < count; i++)
+                {
+                    var ticks = getTicks(i);
+                    if (ticks == NullTicks)
+                    {
+                        nanoseconds[i] = NotATime;
+                    }
+                    else if (ticks < MinNanosecondTicks || ticks > MaxNanosecondTicks)
+                    {
+                        return null;
+                    }
+                    else
+                    {
+                        nanoseconds[i] = (ticks - EpochTicks) * 100;
+                    }
+                }
+
+                using var int64 = ToNumpy(nanoseconds);
+                return int64.InvokeMethod("view", _numpyDateTime);
+            }
+
+            private PyObject ToPythonList()
+            {
+                var pyvalues = new PyList();
+                for (var i = 0; i < _count; i++)
+                {
+                    using var pyObject = GetValue(i).ToPython();
+                    pyvalues.Append(pyObject);
+                }
+                return pyvalues;
+            }
+
+            public static PyObject ToNumpy(Array array)
+            {
+                // numpy copies the array through the buffer protocol, without creating a python object per value
+                using var pyArray = array.ToPython();
+                return _numpyArray.Invoke(pyArray);
+            }
+
+            private void AddValue(object value)
+            {
+                var valueType = GetSerieType(value);
+                var type = GetCommonType(valueType);
+                if (type != _type)
+                {
+                    ConvertTo(type);
+                }
+
+                switch (_type)
+                {
+                    case SerieType.Double:
+                        _doubles.Add(value == null ? double.NaN : Convert.ToDouble(value, InvariantCulture));
+                        break;
+                    case SerieType.Long:
+                        _longs.Add(Convert.ToInt64(value, InvariantCulture));
+                        break;
+                    case SerieType.Bool:
+                        _bools.Add((bool)value);
+                        break;
+                    case SerieType.DateTime:
+                        _longs.Add(value == null ? NullTicks : ((DateTime)value).Ticks);
+                        break;
+                    case SerieType.Object:
+                        _objects.Add(value);
+                        break;
+                }
+                _count++;
+            }
+
+            private void RemoveLastValue()
+            {
+                switch (_type)
+                {
+                    case SerieType.Double:
+                        _doubles.RemoveAt(_count - 1);
+                        break;
+                    case SerieType.Long:
+                    case SerieType.DateTime:
+                        _longs.RemoveAt(_count - 1);
+                        break;
+                    case SerieType.Bool:
+                        _bools.RemoveAt(_count - 1);
+                        break;
+                    case SerieType.Object:
+                        _objects.RemoveAt(_count - 1);
+                        break;
+                }
+                _count--;
+            }
+
+            /// <summary>
+            /// Gets the type that can store both the current values and a value of the given type,
+            /// following the type pandas infers for a list of such values
+            /// </summary>
+            private SerieType GetCommonType(SerieType valueType)
+            {
+                if (valueType == _type)
+                {
+                    return _type;
+                }
+
+                switch (_type)
+                {
+                    case SerieType.Null:
+                        // integers and booleans have no null value: pandas makes the former floats and the latter objects
+                        if (_count > 0 && valueType == SerieType.Long)
+                        {
+                            return SerieType.Double;
+                        }
+                        return _count > 0 && valueType == SerieType.Bool ? SerieType.Object : valueType;
+                    case SerieType.Double:
+                        return valueType is SerieType.Null or SerieType.Long ? SerieType.Double : SerieType.Object;
+                    case SerieType.Long:
+                        return valueType is SerieType.Null or SerieType.Double ? SerieType.Double : SerieType.Object;
+                    case SerieType.DateTime:
+                        return valueType == SerieType.Null ? SerieType.DateTime : SerieType.Object;
+                    default:
+                        return SerieType.Object;
+                }
+            }
+
+            private void ConvertTo(SerieType type)
+            {
+                switch (type)
+                {
+                    case SerieType.Double:
+                        _doubles = _type == SerieType.Long
+                            ? _longs.ConvertAll(x => (double)x)
+                            : Enumerable.Repeat(double.NaN, _count).ToList();
+                        _longs = null;
+                        break;
+                    case SerieType.Long:
+                        _longs = new();
+                        break;
+                    case SerieType.Bool:
+                        _bools = new();
+                        break;
+                    case SerieType.DateTime:
+                        _longs = Enumerable.Repeat(NullTicks, _count).ToList();
+                        break;
+                    case SerieType.Object:
+                        var objects = new List<object>(_count + 1);
+                        for (var i = 0; i < _count; i++)
+                        {
+                            objects.Add(GetValue(i));
+                        }
+                        _objects = objects;
+                        _doubles = null;
+                        _longs = null;
+                        _bools = null;
+                        break;
+                }
+                _type = type;
+            }
+
+            private static SerieType GetSerieType(object value)
+            {
+                return value switch
+                {
+                    null => SerieType.Null,
+                    double or float => SerieType.Double,
+                    long or int or short or sbyte or byte or ushort or uint => SerieType.Long,
+                    bool => SerieType.Bool,
+                    DateTime => SerieType.DateTime,
+                    _ => SerieType.Object
+                };
+            }
+        }
+    }
+}
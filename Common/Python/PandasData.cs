@@ -21,7 +21,6 @@ using QuantConnect.Util;
 using System;
 using System.Collections;
 using System.Collections.Generic;
-using System.Globalization;
 using System.Linq;
 using System.Reflection;
 
@@ -41,6 +40,12 @@ namespace QuantConnect.Python
         private static PyObject _multiIndexFactory;
         private static PyObject _multiIndex;
         private static PyObject _indexFactory;
+        private static PyObject _numpyArray;
+        private static PyObject _numpyZeros;
+        private static PyString _numpyInt8;
+        private static PyObject _factorize;
+        private static PyString _numpyBool;
+        private static PyString _numpyDateTime;
 
         private static PyList _defaultNames;
         private static PyList _level1Names;
@@ -73,6 +78,8 @@ namespace QuantConnect.Python
         private readonly bool _isBaseData;
         private readonly bool _timeAsColumn;
         private readonly Dictionary<string, Serie> _series;
+        private readonly HashSet<string> _fields;
+        private readonly HashSet<DataTypeMember> _skippedMembers;
 
         private readonly Dictionary<Type, List<DataTypeMember>> _members = new();
 
@@ -101,6 +108,14 @@ namespace QuantConnect.Python
                 _multiIndex = _pandas.GetAttr("MultiIndex");
                 _multiIndexFactory = _multiIndex.GetAttr("from_tuples");
                 _indexFactory = _pandas.GetAttr("Index");
+                using var numpy = Py.Import("numpy");
+                _numpyArray = numpy.GetAttr("array");
+                _numpyZeros = numpy.GetAttr("zeros");
+                _numpyInt8 = new PyString("int8");
+                using var pandas = Py.Import("pandas");
+                _factorize = pandas.GetAttr("factorize");
+                _numpyBool = new PyString("bool");
+                _numpyDateTime = new PyString("datetime64[ns]");
                 _empty = new PyString(string.Empty);
 
                 var time = new PyString("time");
@@ -116,9 +131,17 @@ namespace QuantConnect.Python
         /// <summary>
         /// Initializes an instance of <see cref="PandasData"/>
         /// </summary>
-        public PandasData(object data, bool timeAsColumn = false)
+        /// <param name="data">The first data point, used to determine the type of the data</param>
+        /// <param name="timeAsColumn">Whether to add the time as a column instead of an index level</param>
+        /// <param name="fields">The columns to include, case insensitive. The values of other members are never read. Null includes all</param>
+        public PandasData(object data, bool timeAsColumn = false, IEnumerable<string> fields = null)
         {
             _series = new();
+            if (fields != null)
+            {
+                _fields = fields.Select(x => x.ToLowerInvariant()).ToHashSet();
+                _skippedMembers = new();
+            }
             var baseData = data as IBaseData;
 
             // in the case we get a list/collection of data we take the first data point to determine the type
@@ -260,8 +283,9 @@ namespace QuantConnect.Python
         /// </summary>
         /// <param name="levels">Number of levels of the multi index</param>
         /// <param name="filterMissingValueColumns">If false, make sure columns with "missing" values only are still added to the dataframe</param>
+        /// <param name="columnar">Whether to build the index from numpy arrays instead of a python tuple per row</param>
         /// <returns>pandas.DataFrame object</returns>
-        public PyObject ToPandasDataFrame(int levels = 2, bool filterMissingValueColumns = true)
+        public PyObject ToPandasDataFrame(int levels = 2, bool filterMissingValueColumns = true, bool columnar = false)
         {
             using var _ = Py.GIL();
 
@@ -313,12 +337,20 @@ namespace QuantConnect.Python
                 if (filterMissingValueColumns && serie.ShouldFilter) continue;
 
                 var key = serie.Times ?? EmptySeriesTimesKey;
-                if (!indexCache.TryGetValue(key, out var index))
+                if (!indexCache.TryGetValue(key, out var index) && columnar)
+                {
+                    index = CreateColumnarIndex(serie, indexTemplate, names);
+                    if (index != null)
+                    {
+                        indexCache[key] = index;
+                    }
+                }
+                if (index == null)
                 {
                     PyList indexSource;
                     if (_timeAsColumn)
                     {
-                        indexSource = serie.Values.Select(_ => CreateIndexSourceValue(DateTime.MinValue, indexTemplate)).ToPyListUnSafe();
+                        indexSource = Enumerable.Range(0, serie.Count).Select(_ => CreateIndexSourceValue(DateTime.MinValue, indexTemplate)).ToPyListUnSafe();
                     }
                     else
                     {
@@ -346,12 +378,7 @@ namespace QuantConnect.Python
                 }
 
                 // Adds pandas.Series value keyed by the column name
-                using var pyvalues = new PyList();
-                for (var i = 0; i < serie.Values.Count; i++)
-                {
-                    using var pyObject = serie.Values[i].ToPython();
-                    pyvalues.Append(pyObject);
-                }
+                using var pyvalues = serie.ToPython();
                 using var series = _seriesFactory.Invoke(pyvalues, index);
                 using var pyStrKey = seriesName.ToPython();
                 using var pyKey = _pandasColumn.Invoke(pyStrKey);
@@ -419,10 +446,10 @@ namespace QuantConnect.Python
                         value = valuesPerSeries[kvp.Key] = new PyList();
                     }
 
-                    if (kvp.Value.Values.Count > 0)
+                    if (kvp.Value.Count > 0)
                     {
                         // taking only 1 value per symbol
-                        using var valueOfSymbol = kvp.Value.Values[0].ToPython();
+                        using var valueOfSymbol = kvp.Value.GetValue(0).ToPython();
                         value.Append(valueOfSymbol);
                     }
                     else
@@ -484,6 +511,12 @@ namespace QuantConnect.Python
 
                 _members[type] = members;
 
+                if (_fields != null)
+                {
+                    columnNames.RemoveWhere(x => !_fields.Contains(x.ToLowerInvariant()));
+                    AddSkippedMembers(members);
+                }
+
                 if (_timeAsColumn)
                 {
                     columnNames.Add("time");
@@ -498,6 +531,31 @@ namespace QuantConnect.Python
             return members;
         }
 
+        /// <summary>
+        /// Adds the members that have no column in the requested fields to <see cref="_skippedMembers"/>, so their values are never read.
+        /// Unwrapped members are skipped if none of their children are requested
+        /// </summary>
+        private void AddSkippedMembers(IEnumerable<DataTypeMember> members)
+        {
+            foreach (var member in members)
+            {
+                // open interest ticks store their last price in the openinterest column
+                if (member.IsTickLastPrice && _fields.Contains("openinterest"))
+                {
+                    continue;
+                }
+
+                if (!member.GetMemberNames().Any(_fields.Contains))
+                {
+                    _skippedMembers.Add(member);
+                }
+                else if (member.ShouldBeUnwrapped)
+                {
+                    AddSkippedMembers(member.Children);
+                }
+            }
+        }
+
         /// <summary>
         /// Gets or create/adds the <see cref="DataTypeMember"/> instances corresponding to the members of the given type,
         /// and returns the names of the members.
@@ -583,6 +641,11 @@ namespace QuantConnect.Python
         {
             foreach (var member in members)
             {
+                if (_skippedMembers != null && _skippedMembers.Contains(member))
+                {
+                    continue;
+                }
+
                 if (!member.ShouldBeUnwrapped)
                 {
                     AddMemberToSeries(instance, endTime, member, overrideValues);
@@ -598,6 +661,23 @@ namespace QuantConnect.Python
             }
         }
 
+        /// <summary>
+        /// Converts the values to a numpy float64 array, copied through the buffer protocol without a python object per value
+        /// </summary>
+        internal static PyObject ToNumpyArray(double[] values)
+        {
+            return Serie.ToNumpy(values);
+        }
+
+        /// <summary>
+        /// Converts the times to a numpy datetime64[ns] array
+        /// </summary>
+        /// <returns>The numpy array, null if any of the times can't be represented in nanoseconds</returns>
+        internal static PyObject ToNumpyDateTimes(List<DateTime> times)
+        {
+            return Serie.ToNumpyDateTimes(times);
+        }
+
         /// <summary>
         /// Only dipose of the PyObject if it was set to something different than empty
         /// </summary>
@@ -628,6 +708,52 @@ namespace QuantConnect.Python
             return args.SkipLast(args.Length > 1 && _timeAsColumn ? 1 : 0).Select(x => x?.ToPython() ?? _empty).ToArray();
         }
 
+        /// <summary>
+        /// Creates the index of the serie from numpy arrays, without a python tuple and datetime per row.
+        /// Every level but time holds a single value so their codes are zeros, the times are factorized by pandas
+        /// </summary>
+        /// <returns>The index, null if the times can't be represented by numpy</returns>
+        private PyObject CreateColumnarIndex(Serie serie, PyObject[] indexTemplate, PyList names)
+        {
+            using var pyCount = serie.Count.ToPython();
+            if (indexTemplate.Length == 1)
+            {
+                using var level = new PyList(new[] { indexTemplate[0] });
+                using var nameDic = Py.kw("name", names[0]);
+                using var symbolIndex = _indexFactory.Invoke(new[] { level }, nameDic);
+                return symbolIndex.InvokeMethod("repeat", pyCount);
+            }
+
+            var hasTimeLevel = !_timeAsColumn;
+            using var levels = new PyList();
+            using var codes = new PyList();
+            using var zeros = _numpyZeros.Invoke(pyCount, _numpyInt8);
+            for (var i = 0; i < indexTemplate.Length - (hasTimeLevel ? 1 : 0); i++)
+            {
+                using var level = new PyList(new[] { indexTemplate[i] });
+                levels.Append(level);
+                codes.Append(zeros);
+            }
+
+            if (hasTimeLevel)
+            {
+                using var times = Serie.ToNumpyDateTimes(serie.Times);
+                if (times == null)
+                {
+                    return null;
+                }
+                using var sortKwargs = Py.kw("sort", true);
+                using var factorized = _factorize.Invoke(new[] { times }, sortKwargs);
+                using var timeCodes = factorized[0];
+                using var timeLevel = factorized[1];
+                codes.Append(timeCodes);
+                levels.Append(timeLevel);
+            }
+
+            using var kwargs = Py.kw("levels", levels, "codes", codes, "names", names, "verify_integrity", false);
+            return _multiIndex.Invoke(Array.Empty<PyObject>(), kwargs);
+        }
+
         /// <summary>
         /// Create a new tuple index
         /// </summary>
@@ -657,84 +783,15 @@ namespace QuantConnect.Python
         {
             if (!_series.TryGetValue(key, out var serie))
             {
-                throw new ArgumentException($"PandasData.AddToSeries(): {Messages.PandasData.KeyNotFoundInSeries(key)}");
-            }
-
-            serie.Add(time, input, overrideValues);
-        }
-
-        private class Serie
-        {
-            private static readonly IFormatProvider InvariantCulture = CultureInfo.InvariantCulture;
-
-            public bool ShouldFilter { get; private set; }
-            public List<DateTime> Times { get; }
-            public List<object> Values { get; }
-
-            public Serie(bool withTimeIndex = true)
-            {
-                ShouldFilter = true;
-                Values = new();
-                if (withTimeIndex)
+                if (_fields != null)
                 {
-                    Times = new();
+                    // not one of the requested fields
+                    return;
                 }
+                throw new ArgumentException($"PandasData.AddToSeries(): {Messages.PandasData.KeyNotFoundInSeries(key)}");
             }
 
-            public void Add(DateTime time, object input, bool overrideValues)
-            {
-                var value = input is decimal ? Convert.ToDouble(input, InvariantCulture) : input;
-                if (ShouldFilter)
-                {
-                    // we need at least 1 valid entry for the series not to get filtered
-                    if (value is double doubleValue)
-                    {
-                        if (!doubleValue.IsNaNOrZero())
-                        {
-                            ShouldFilter = false;
-                        }
-                    }
-                    else if (value is string stringValue)
-                    {
-                        if (!string.IsNullOrWhiteSpace(stringValue))
-                        {
-                            ShouldFilter = false;
-                        }
-                    }
-                    else if (value is bool boolValue)
-                    {
-                        if (boolValue)
-                        {
-                            ShouldFilter = false;
-                        }
-                    }
-                    else if (value != null)
-                    {
-                        if (value is ICollection enumerable)
-                        {
-                            if (enumerable.Count != 0)
-                            {
-                                ShouldFilter = false;
-                            }
-                        }
-                        else
-                        {
-                            ShouldFilter = false;
-                        }
-                    }
-                }
-
-                if (overrideValues && Times != null && Times.Count > 0 && Times[^1] == time)
-                {
-                    // If the time is the same as the last one, we overwrite the value
-                    Values[^1] = value;
-                }
-                else
-                {
-                    Values.Add(value);
-                    Times?.Add(time);
-                }
-            }
+            serie.Add(time, input, overrideValues);
         }
 
         private class FixedTimeProvider : ITimeProvider
@@ -18,6 +18,7 @@ using System;
 using System.Linq;
 using System.Collections.Generic;
 using System.Runtime.CompilerServices;
+using System.Threading;
 
 namespace QuantConnect
 {
@@ -31,6 +32,13 @@ namespace QuantConnect
         // we aggregate the two maps into a class so we can assign a new one as an atomic operation
         private static readonly Dictionary<string, Symbol> Symbols = new(StringComparer.OrdinalIgnoreCase);
         private static readonly Dictionary<Symbol, string> Tickers = new();
+        private static int _version;
+
+        /// <summary>
+        /// Gets the version of the cache, incremented every time a mapping is added or removed.
+        /// Allows consumers, like the python pandas mapper, to cache the resolved tickers until the cache changes
+        /// </summary>
+        public static int Version => Volatile.Read(ref _version);
 
         /// <summary>
         /// Adds a mapping for the specified ticker
@@ -43,6 +51,7 @@ namespace QuantConnect
             {
                 Symbols[ticker] = symbol;
                 Tickers[symbol] = ticker;
+                Interlocked.Increment(ref _version);
 
                 var index = ticker.IndexOf('.');
                 if (index != -1)
@@ -84,6 +93,28 @@ namespace QuantConnect
             return result.Item1;
         }
 
+        /// <summary>
+        /// Gets the Symbol objects that are mapped to the specified string ticker symbols in a single call,
+        /// allowing consumers like the python pandas mapper to resolve many tickers without a call per ticker
+        /// </summary>
+        /// <param name="tickers">The string ticker symbols</param>
+        /// <returns>The symbol objects that map to the tickers, in the same order. Null for the tickers that can't be resolved</returns>
+        public static Symbol[] TryGetSymbols(string[] tickers)
+        {
+            var symbols = new Symbol[tickers.Length];
+            lock (Symbols)
+            {
+                for (var i = 0; i < tickers.Length; i++)
+                {
+                    if (tickers[i] != null)
+                    {
+                        symbols[i] = TryGetSymbol(tickers[i]).Item2;
+                    }
+                }
+            }
+            return symbols;
+        }
+
         /// <summary>
         /// Gets the string ticker symbol that is mapped to the specified Symbol
         /// </summary>
@@ -121,6 +152,7 @@ namespace QuantConnect
         {
             lock (Symbols)
             {
+                Interlocked.Increment(ref _version);
                 return Tickers.Remove(symbol, out var ticker) && Symbols.Remove(ticker, out symbol);
             }
         }
@@ -135,6 +167,7 @@ namespace QuantConnect
         {
             lock (Symbols)
             {
+                Interlocked.Increment(ref _version);
                 return Symbols.Remove(ticker, out var symbol) && Tickers.Remove(symbol, out ticker);
             }
         }
@@ -149,6 +182,7 @@ namespace QuantConnect
             {
                 Symbols.Clear();
                 Tickers.Clear();
+                Interlocked.Increment(ref _version);
             }
         }
 
@@ -186,6 +186,12 @@ namespace QuantConnect.Report
                 statistics[reportElement.JsonKey] = reportElement.Result;
             }
 
+            var chartCacheStatistics = ChartReportElement.GetCacheStatistics();
+            if (chartCacheStatistics != null)
+            {
+                Log.Trace($"QuantConnect.Report.Compile(): Chart cache statistics: {chartCacheStatistics}");
+            }
+
             reportStatistics = JsonConvert.SerializeObject(statistics, Formatting.None);
         }
 
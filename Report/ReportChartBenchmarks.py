@@ -0,0 +1,224 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# You can run these benchmarks by first running `nPython.exe` (with mono or otherwise):
+# $ ./nPython.exe ReportChartBenchmarks.py --output chart_benchmark_results.json
+# and compare a new run against those results, failing if any chart got more than 10% slower:
+# $ ./nPython.exe ReportChartBenchmarks.py --output new_chart_benchmark_results.json --compare chart_benchmark_results.json
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tracemalloc
+import numpy as np
+import pandas as pd
+from ReportCharts import ReportCharts, _load_matplotlib
+
+# Name: (periods, frequency) of the synthetic equity curves
+scales = {
+    'daily-1y': (252, 'D'),
+    'minute-1y': (252 * 390, 'min'),
+    'minute-20y': (20 * 252 * 390, 'min')
+}
+
+def get_chart_inputs(scale):
+    '''Gets the arguments of every chart method for synthetic results of the given scale, the last 20% being live trading'''
+    periods, frequency = scales[scale]
+    random = np.random.RandomState(0)
+    time = pd.date_range('2004-01-02', periods=periods, freq=frequency).values.astype('datetime64[ns]')
+    equity = np.cumprod(1 + random.normal(2e-4, 1e-2, periods) / np.sqrt(periods / 252))
+    benchmark = np.cumprod(1 + random.normal(1e-4, 1e-2, periods) / np.sqrt(periods / 252))
+    live = int(periods * 0.8)
+
+    cumulative = (equity / equity[0] - 1) * 100
+    cumulative_benchmark = (benchmark / benchmark[0] - 1) * 100
+    drawdown = equity / np.maximum.accumulate(equity) - 1
+    worst_indices = np.sort(np.argsort(drawdown)[:5])
+    worst = [{'Begin': time[max(i - 10, 0)], 'End': time[i]} for i in worst_indices]
+    rolling = random.uniform(-1, 2, periods)
+    rolling[:periods // 4] = np.nan
+
+    # Daily, monthly and annual aggregates
+    daily = pd.Series(equity, index=time).resample('D').last().dropna()
+    daily_returns = daily.pct_change().fillna(0)
+    years = [str(x) for x in sorted(set(pd.DatetimeIndex(time).year))]
+    monthly = random.normal(0.5, 3, (len(years), 12))
+    annual = random.normal(5, 15, len(years))
+    trades = random.normal(0, 0.02, max(len(daily) // 2, 10))
+
+    securities = list(ReportCharts.color_map.keys())
+    long_exposure = [random.uniform(0, 0.1, periods) for _ in securities]
+    short_exposure = [-random.uniform(0, 0.1, periods) for _ in securities]
+
+    return {
+        'GetReturnsPerTrade': [trades, trades[-len(trades) // 5:]],
+        'GetCumulativeReturns': [[time[:live], cumulative[:live], time[:live], cumulative_benchmark[:live]],
+                                 [time[live:], cumulative[live:], time[live:], cumulative_benchmark[live:]]],
+        'GetDailyReturns': [[daily_returns.index.values, daily_returns.values], [[], []]],
+        'GetMonthlyReturns': [monthly, [], 7, 5, 'monthly-returns.png', years],
+        'GetAnnualReturns': [[years, annual]],
+        'GetDrawdown': [[time[:live], drawdown[:live]], [time[live:], drawdown[live:]], worst],
+        'GetCrisisEventsPlots': [[time, equity / equity[0] - 1, benchmark / benchmark[0] - 1], 'crisis'],
+        'GetRollingBeta': [[time[:live], rolling[:live], time[:live], rolling[:live]],
+                           [time[live:], rolling[live:], time[live:], rolling[live:]]],
+        'GetRollingSharpeRatio': [[time[:live], rolling[:live], time[:live], rolling[:live]],
+                                  [time[live:], rolling[live:], time[live:], rolling[live:]]],
+        'GetAssetAllocation': [[['SPY', 'IBM', 'AAPL', 'NFLX', 'GOOG', 'MSFT', 'AMZN', 'TSLA'],
+                                [0.3, 0.2, 0.1, 0.1, 0.1, 0.05, 0.05, 0.05]], [[], []]],
+        'GetLeverage': [[time[:live], 1 + rolling[:live] / 4], [time[live:], 1 + rolling[live:] / 4]],
+        'GetExposure': [time[:live], securities, securities, [x[:live] for x in long_exposure], [x[:live] for x in short_exposure],
+                        time[live:], securities, securities, [x[live:] for x in long_exposure], [x[live:] for x in short_exposure]]
+    }
+
+def get_output_size(result):
+    '''Gets the size of the encoded chart, or the sum of all of them if the method returns several'''
+    if isinstance(result, dict):
+        return sum(len(x) for x in result.values())
+    return len(result)
+
+def benchmark_chart(charts, method, args, samples):
+    '''Renders the chart the given number of times, then once more tracing the memory allocations'''
+    times = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        result = getattr(charts, method)(*args)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    getattr(charts, method)(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'average-time': statistics.mean(times), 'samples': times, 'peak-memory': peak, 'output-size': get_output_size(result)}
+
+def benchmark_import():
+    '''Measures the import of ReportCharts and its first chart in a fresh interpreter'''
+    script = ('import time; start = time.perf_counter(); from ReportCharts import ReportCharts; imported = time.perf_counter(); '
+              'ReportCharts().GetAnnualReturns([["2012"], [1.0]]); print(imported - start, time.perf_counter() - imported)')
+    output = subprocess.run([sys.executable, '-c', script], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True).stdout.split()
+    import_time, first_chart_time = float(output[-2]), float(output[-1])
+    print(f'startup import: {import_time:.3f}s first chart: {first_chart_time:.3f}s')
+    return {'import': {'average-time': import_time, 'samples': [import_time]},
+            'first-chart': {'average-time': first_chart_time, 'samples': [first_chart_time]}}
+
+def run(scale_names, samples, methods = None, downsample = None):
+    '''Benchmarks every chart method at every scale. Returns {scale: {method: results}} like benchmark_results.json'''
+    charts = ReportCharts(downsample=downsample)
+    _load_matplotlib()
+
+    results = {'startup': benchmark_import()}
+    for scale in scale_names:
+        results[scale] = {}
+        for method, args in get_chart_inputs(scale).items():
+            if methods and method not in methods:
+                continue
+            result = benchmark_chart(charts, method, args, samples)
+            results[scale][method] = result
+            print(f'{scale} {method}: {result["average-time"]:.3f}s peak memory: {result["peak-memory"] / 1024 ** 2:.1f}MB '
+                  f'output size: {result["output-size"] / 1024:.1f}KB')
+    return results
+
+def compare(reference, results, margin = 0.10):
+    '''Compares the results against the reference ones. Returns false if any chart got slower than the margin allows'''
+    failed = False
+    for scale, reference_results in reference.items():
+        for method, value in reference_results.items():
+            if method not in results.get(scale, {}):
+                print(f'Chart benchmark {method} at scale {scale} was not found in new results')
+                continue
+            new_result = results[scale][method]
+            expected = value['average-time'] * (1 + margin)
+            if new_result['average-time'] > expected:
+                failed = True
+                print(f'Chart benchmark Failed for {method} at scale {scale}. Was {new_result["average-time"]:.3f}s expected as high as {expected:.3f}s')
+            else:
+                print(f'Chart benchmark Passed for {method} at scale {scale}. Was {new_result["average-time"]:.3f}s expected as high as {expected:.3f}s')
+    return not failed
+
+def legacy_step_series(time, data):
+    '''Step series construction used by GetExposure before it was vectorized, kept as reference'''
+    time_copy = []
+    data_copy = []
+    for j, values in enumerate(data):
+        data_copy.append([])
+        length = len(values)
+        for i in range(1, length + 1):
+            if i == length:
+                time_copy.append(time[i - 1])
+                data_copy[j].append(values[i - 1])
+            else:
+                time_copy.append(time[i - 1])
+                time_copy.append(time[i])
+                data_copy[j].append(values[i - 1])
+                data_copy[j].append(values[i - 1])
+    return time_copy, np.vstack(data_copy)
+
+def run_micro_benchmarks():
+    '''Compares optimized chart internals against their previous implementations'''
+    def benchmark(name, function, *args):
+        start = time.perf_counter()
+        result = function(*args)
+        print(f'{name}: {time.perf_counter() - start:.3f}s')
+        return result
+
+    charts = ReportCharts()
+
+    # GetExposure step series: 10 years of minute data for 10 asset classes
+    exposure_time = pd.date_range('2010-01-01', periods=10 * 252 * 390, freq='min').values.astype('datetime64[ns]')
+    exposure_data = [np.random.uniform(0, 0.5, len(exposure_time)) for _ in range(10)]
+
+    legacy = benchmark('GetExposure step series (legacy)', legacy_step_series, list(exposure_time), exposure_data)
+    vectorized = benchmark('GetExposure step series', charts._get_step_series, exposure_time, exposure_data)
+    assert np.array_equal(legacy[1], vectorized[1])
+    assert np.array_equal(np.array(legacy[0][:vectorized[0].size]), vectorized[0])
+
+    # Downsampling: 20 years of minute data
+    cumulative_time = pd.date_range('2004-01-01', periods=20 * 252 * 390, freq='min').values
+    cumulative_returns = np.cumsum(np.random.normal(0, 1e-3, len(cumulative_time)))
+    benchmark('GetCumulativeReturns', charts.GetCumulativeReturns, [cumulative_time, cumulative_returns, [], []])
+    for downsample in ReportCharts.downsample_methods:
+        benchmark(f'GetCumulativeReturns ({downsample})', ReportCharts(downsample=downsample).GetCumulativeReturns,
+                  [cumulative_time, cumulative_returns, [], []])
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks the ReportCharts chart methods at realistic scales')
+    parser.add_argument('--scales', nargs='+', choices=list(scales), default=list(scales), help='Scales of the synthetic results')
+    parser.add_argument('--methods', nargs='+', help='Chart methods to benchmark. Defaults to every Get* method')
+    parser.add_argument('--samples', type=int, default=3, help='Number of timed renders of each chart')
+    parser.add_argument('--downsample', choices=ReportCharts.downsample_methods, help='Downsampling of the long time series')
+    parser.add_argument('--output', default='chart_benchmark_results.json', help='File the results are written to')
+    parser.add_argument('--compare', help='Reference results to compare against. Exits with 1 if any chart is more than 10%% slower')
+    parser.add_argument('--micro', action='store_true', help='Also run the micro benchmarks of the chart internals')
+    arguments = parser.parse_args()
+
+    # Read before running, the reference could be the output file of a previous run
+    reference = None
+    if arguments.compare:
+        print(f'Will compare chart benchmark results against reference {arguments.compare}')
+        with open(arguments.compare) as fp:
+            reference = json.load(fp)
+
+    if arguments.micro:
+        run_micro_benchmarks()
+
+    results = run(arguments.scales, arguments.samples, arguments.methods, arguments.downsample)
+    with open(arguments.output, 'w') as fp:
+        json.dump(results, fp, indent=4)
+
+    if reference is not None and not compare(reference, results):
+        exit(1)
@@ -99,6 +99,11 @@ result = charts.GetDrawdown(empty, empty, {})
 result = charts.GetDrawdown(backtest, empty, worst)
 result = charts.GetDrawdown(backtest, live, worst)
 
+# More worst periods than colors, with sorted numpy datetime arrays
+backtest = [pd.date_range('2012-10-01', periods=365).values, np.random.uniform(-5, 0, 365)]
+worst = [{'Begin': datetime(2012, 10, 1) + pd.Timedelta(days=20 * i), 'End': datetime(2012, 10, 15) + pd.Timedelta(days=20 * i)} for i in range(12)]
+result = charts.GetDrawdown(backtest, empty, worst)
+
 ## Test GetCrisisPlots  (backtest only)
 equity = list(np.linspace(1, 25, 365))
 benchmark = list(np.linspace(2, 26, 365))
@@ -181,3 +186,118 @@ result = charts.GetExposure(time, long_securities, short_securities, long, short
 result = charts.GetExposure(time, long_securities, short_securities, long, short,
                                 live_time, live_long_securities, live_short_securities,
                                 live_long, live_short)
+
+## Test RenderCharts
+# Guarded since the worker processes might import this script again
+if __name__ == '__main__':
+    equity = list(np.linspace(1, 25, 365))
+    benchmark = list(np.linspace(2, 26, 365))
+    time = [pd.Timestamp(x).to_pydatetime() for x in pd.date_range('2012-10-01 00:00:00', periods=365)]
+    backtest = [time, equity, benchmark]
+    requests = [['GetCrisisEventsPlots', [backtest, 'dummy_crisis']],
+                ['GetCrisisEventsPlots', [[[], [], []]], {'name': 'empty_crisis'}],
+                ['GetReturnsPerTrade', [list(np.random.normal(0, 1, 1000))]]]
+
+    results = charts.RenderCharts(requests)
+    assert len(results) == len(requests)
+    assert results[0] == charts.GetCrisisEventsPlots(backtest, 'dummy_crisis')
+    assert results == charts.RenderCharts(requests, max_workers=1)
+
+## Test image formats
+for image_format in ['png', 'svg', 'webp']:
+    result = ReportCharts(image_format=image_format, dpi=100).GetAnnualReturns([['2012', '2013'], [1.0, -2.0]])
+    assert result.startswith(f'data:{ReportCharts.mime_types[image_format]};base64,')
+
+## Test chart cache
+import tempfile
+with tempfile.TemporaryDirectory() as cache_directory:
+    cached_charts = ReportCharts(cache_directory=cache_directory)
+    equity = list(np.linspace(1, 25, 365))
+    benchmark = list(np.linspace(2, 26, 365))
+    time = [pd.Timestamp(x).to_pydatetime() for x in pd.date_range('2012-10-01 00:00:00', periods=365)]
+    backtest = [time, equity, benchmark]
+    first = cached_charts.GetCrisisEventsPlots(backtest, 'dummy_crisis')
+    second = cached_charts.GetCrisisEventsPlots(backtest, 'dummy_crisis')
+    assert first == second
+    assert cached_charts.cache.stats()['hits'] == 1 and cached_charts.cache.stats()['misses'] == 1
+    assert cached_charts.RenderCharts([['GetCrisisEventsPlots', [backtest, 'dummy_crisis']]]) == [first]
+    assert cached_charts.cache.stats()['hits'] == 2
+
+    # Evicts the least recently used charts once the cache is full
+    cached_charts.cache.max_size = 1
+    cached_charts.GetCrisisEventsPlots([time, benchmark, equity], 'dummy_crisis')
+    assert cached_charts.cache.stats()['evictions'] > 0
+
+    # Evicts down to the low water mark, so the directory isn't scanned again on every write
+    from ReportCharts import ChartCache
+    cache = ChartCache(f'{cache_directory}/batch', max_size=10000)
+    scans = []
+    get_entries = cache._get_entries
+    cache._get_entries = lambda: scans.append(1) or get_entries()
+    for i in range(40):
+        cache.set(str(i), 'x' * 400)
+    assert cache.size <= 10000 and cache.evictions > 0 and len(scans) <= 3
+
+## Test downsampling
+from ReportCharts import _get_lttb_indices, _get_minmax_indices
+x = np.arange(10000, dtype=float)
+y = np.sin(x / 100)
+y[5000] = -10
+assert len(_get_lttb_indices(x, y, 100)) == 100
+assert 5000 in _get_lttb_indices(x, y, 100) and 5000 in _get_minmax_indices(x, y, 100)
+
+time = pd.date_range('2012-10-01', periods=10000, freq='min').values
+drawdown = np.minimum(y, 0)
+worst = [{'Begin': pd.Timestamp(time[4000]).to_pydatetime(), 'End': pd.Timestamp(time[6000]).to_pydatetime()}]
+for downsample in ReportCharts.downsample_methods:
+    downsampled_charts = ReportCharts(downsample=downsample, downsample_points=100)
+    downsampled_time, downsampled_drawdown = downsampled_charts._downsample(time, drawdown, keep=[5000])
+    assert len(downsampled_time) <= 101 and downsampled_drawdown.min() == -10
+    result = downsampled_charts.GetDrawdown([time, drawdown], [[], []], worst)
+    result = downsampled_charts.GetCumulativeReturns([time, y, time, y])
+    result = downsampled_charts.GetLeverage([time, y], [[], []], downsample=False)
+
+## Test columnar inputs
+# int64 unix timestamps in nanoseconds and float64 arrays, e.g. .NET arrays, render the same charts as lists of datetimes
+from clr import AddReference
+AddReference("System")
+from System import Array, Double, Int64
+time = [pd.Timestamp(x).to_pydatetime() for x in pd.date_range('2012-10-01', periods=365)]
+epoch_time = pd.date_range('2012-10-01', periods=365).values.astype('datetime64[ns]').view(np.int64)
+data = list(np.random.uniform(-5, 0, 365))
+expected = charts.GetDrawdown([time, data], [[], []], [])
+assert charts.GetDrawdown([epoch_time, np.array(data)], [[], []], []) == expected
+assert charts.GetDrawdown([Array[Int64](epoch_time.tolist()), Array[Double](data)], [[], []], []) == expected
+assert charts.GetCumulativeReturns([epoch_time, np.array(data), epoch_time, np.array(data)]) == charts.GetCumulativeReturns([time, data, time, data])
+assert charts.GetLeverage([memoryview(epoch_time), memoryview(np.array(data))]) == charts.GetLeverage([time, data])
+
+with tempfile.TemporaryDirectory() as cache_directory:
+    cached_charts = ReportCharts(cache_directory=cache_directory)
+    cached_charts.GetLeverage([Array[Int64](epoch_time.tolist()), Array[Double](data)])
+    cached_charts.GetLeverage([Array[Int64](epoch_time.tolist()), Array[Double](data[::-1])])
+    assert cached_charts.cache.stats()['misses'] == 2
+
+    # .NET lists don't support the buffer protocol, they are keyed by their items
+    from System.Collections.Generic import List
+    settings = cached_charts._get_cache_settings()
+    first_key = cached_charts.cache.get_key('GetCrisisEventsPlots', [[List[Double]([1.0, 2.0])], 'crisis'], {}, settings)
+    second_key = cached_charts.cache.get_key('GetCrisisEventsPlots', [[List[Double]([9.0, 9.0, 9.0])], 'crisis'], {}, settings)
+    assert first_key != second_key
+
+# .NET collections are converted before they are sent to the worker processes
+if __name__ == '__main__':
+    clr_backtest = [Array[Int64](epoch_time.tolist()), List[Double](data), List[Double](data[::-1])]
+    requests = [['GetCrisisEventsPlots', [clr_backtest, 'clr_crisis']],
+                ['GetCrisisEventsPlots', [[epoch_time, np.array(data), np.array(data[::-1])], 'numpy_crisis']]]
+    results = charts.RenderCharts(requests, max_workers=2)
+    assert results == charts.RenderCharts(requests, max_workers=1)
+    assert results[0] == charts.GetCrisisEventsPlots([epoch_time, np.array(data), np.array(data[::-1])], 'clr_crisis')
+
+## Test GetMonthlyReturns with year by month matrices
+backtest = {'2016': [0.5, 0.7, 0.2, 0.23, 1.3, 1.45, 1.67, -2.3, -0.5, 1.23, 1.23, -3.5],
+            '2017': [1.5, 2.7, -3.2, -0.23, 4.3, -2.45, -1.67, 2.3, np.nan, np.nan, np.nan, np.nan]}
+live = {'2018': [0.5, 0.7, 0.2, 0.23, 1.3, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan]}
+expected = charts.GetMonthlyReturns(backtest, live)
+assert charts.GetMonthlyReturns(np.array(list(backtest.values())), np.array(list(live.values())).ravel(),
+                                 years=list(backtest.keys()), live_years=list(live.keys())) == expected
+assert charts.GetMonthlyReturns(np.array(list(backtest.values())), years=list(backtest.keys())) == charts.GetMonthlyReturns(backtest)
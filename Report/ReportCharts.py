@@ -11,33 +11,349 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import re
-import matplotlib
+import sys
+import json
+import pickle
+import hashlib
+import logging
+import functools
+import multiprocessing
 import numpy as np
 import pandas as pd
 from base64 import b64encode
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import date, datetime, timedelta
-from pandas.plotting import register_matplotlib_converters
-from clr import AddReference
-AddReference("System")
-from System import *
-
-register_matplotlib_converters()
-
 
+# Loaded on the first rendered chart by _load_matplotlib, so importing this module stays cheap
+matplotlib = plt = ticker = mcolors = DateFormatter = MaxNLocator = None
+
+@functools.lru_cache(maxsize=None)
+def _load_matplotlib():
+    '''Loads pyplot and the pandas converters. The fonts come from the font list matplotlib caches on disk'''
+    global matplotlib, plt, ticker, mcolors, DateFormatter, MaxNLocator
+    import matplotlib
+    from pandas.plotting import register_matplotlib_converters
+    register_matplotlib_converters()
+
+    matplotlib.use('Agg')
+    font = {'family': 'DejaVu Sans'}
+    matplotlib.rc('font',**font)
+    matplotlib.rc('axes', edgecolor='#d5d5d5')
+
+    import matplotlib.pyplot as plt
+    import matplotlib.ticker as ticker
+    import matplotlib.colors as mcolors
+    from matplotlib.dates import DateFormatter
+    from matplotlib.ticker import MaxNLocator
+
+def _render_chart(settings, method, args, kwargs):
+    '''Renders a single chart in a worker process. Every process owns its own pyplot state'''
+    return getattr(ReportCharts(**settings), method)(*args, **kwargs)
+
+def _log_error(message):
+    '''Logs the error to the Lean log when running in the report generator, or to the python logging otherwise'''
+    try:
+        from QuantConnect.Logging import Log
+    except ImportError:
+        logging.getLogger(__name__).error(message)
+        return
+    Log.Error(message)
+
+def _get_python_executable():
+    '''Gets the Python interpreter used to spawn the chart worker processes.
+    When Python is embedded (e.g. the C# report generator) sys.executable is the host process, not an interpreter
+    '''
+    executable = sys.executable
+    if executable and os.path.basename(executable).lower().startswith('python'):
+        return executable
+
+    for directory in [sys.exec_prefix, os.path.join(sys.exec_prefix, 'bin')]:
+        for name in ['python.exe', 'python3', 'python']:
+            candidate = os.path.join(directory, name)
+            if os.path.isfile(candidate):
+                return candidate
+    return None
+
+class ChartCache:
+    '''
+    Content addressed cache of rendered charts, stored in a local directory.
+    Entries are keyed by the hash of the chart method, its inputs and the image settings,
+    and are evicted in least recently used order once the directory grows over the maximum size.
+    Eviction scans the whole directory, so it removes entries down to a low water mark below the maximum size,
+    and the next scan only happens once that much more has been written.
+    '''
+    def __init__(self, directory, max_size = 512 * 1024 * 1024, low_water_mark = 0.8):
+        '''
+        directory: Directory where the rendered charts are stored. Can be shared by several report jobs
+        max_size: Maximum size of the cache directory in bytes
+        low_water_mark: Fraction of the maximum size the cache is reduced to when it's full
+        '''
+        self.directory = directory
+        self.max_size = max_size
+        self.low_water_mark = low_water_mark
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+        self.size = sum(size for _, _, size in self._get_entries())
+
+    def get_key(self, method, args, kwargs, settings):
+        '''Gets the hash of a chart request'''
+        hasher = hashlib.sha256()
+        hasher.update(_get_code_version().encode())
+        _hash_value(hasher, [method, args, kwargs, settings])
+        return hasher.hexdigest()
+
+    def get(self, key):
+        '''Gets the cached chart for the given key, None if not found'''
+        path = self._get_path(key)
+        try:
+            with open(path, 'r') as fp:
+                value = json.load(fp)
+            # Touch the entry so it's the last one to be evicted
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        '''Stores the chart for the given key, evicting the least recently used entries if the cache is full'''
+        path = self._get_path(key)
+        # Write to a temporary file first so concurrent report jobs never read partial entries
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+        with open(temporary_path, 'w') as fp:
+            json.dump(value, fp)
+        size = os.path.getsize(temporary_path)
+        try:
+            # Replacing an entry doesn't grow the cache by its whole size
+            size -= os.path.getsize(path)
+        except OSError:
+            pass
+        os.replace(temporary_path, path)
+
+        # Only the writes of this job are counted, the size is synchronized with the directory when evicting
+        self.size += size
+        if self.size > self.max_size:
+            self.evict()
+
+    def evict(self):
+        '''Removes the least recently used entries until the cache size is under the low water mark of the maximum size.
+        The size of the cache is taken from the directory, which includes the entries of other report jobs'''
+        entries = sorted(self._get_entries())
+        self.size = sum(size for _, _, size in entries)
+        target_size = self.max_size * self.low_water_mark
+
+        for _, path, size in entries:
+            if self.size <= target_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # Already removed by another report job
+                pass
+            self.size -= size
+            self.evictions += 1
+
+    def stats(self):
+        '''Gets the hit and miss statistics of the cache'''
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit-rate': self.hits / total if total > 0 else 0,
+            'evictions': self.evictions,
+            'size': self.size
+        }
 
-matplotlib.use('Agg')
-font = {'family': 'DejaVu Sans'}
-matplotlib.rc('font',**font)
-matplotlib.rc('axes', edgecolor='#d5d5d5')
+    def _get_path(self, key):
+        return os.path.join(self.directory, f'{key}.json')
 
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
-import matplotlib.colors as mcolors
-from matplotlib.dates import DateFormatter
-from matplotlib.ticker import MaxNLocator, NullFormatter, ScalarFormatter, FormatStrFormatter
-la = matplotlib.font_manager.FontManager()
-lu = matplotlib.font_manager.FontProperties(family = "Open Sans Condensed")
+    def _get_entries(self):
+        '''Gets the (last access time, path, size) of every entry of the cache'''
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+@functools.lru_cache(maxsize=None)
+def _get_code_version():
+    '''Gets the hash of this module source, so cached charts are invalidated when the chart code changes'''
+    with open(__file__, 'rb') as fp:
+        return hashlib.sha256(fp.read()).hexdigest()
+
+def _hash_value(hasher, value):
+    '''Feeds a chart input into the hasher. Arrays are hashed by their raw bytes'''
+    if isinstance(value, (list, tuple)):
+        hasher.update(f'list{len(value)}'.encode())
+        for item in value:
+            _hash_value(hasher, item)
+    elif isinstance(value, dict):
+        hasher.update(f'dict{len(value)}'.encode())
+        for key in sorted(value, key=str):
+            _hash_value(hasher, str(key))
+            _hash_value(hasher, value[key])
+    elif isinstance(value, (pd.Series, pd.DataFrame)):
+        _hash_value(hasher, [value.index.values, value.values])
+    elif isinstance(value, (np.ndarray, memoryview)):
+        value = np.asarray(value)
+        if value.dtype == object:
+            _hash_value(hasher, value.tolist())
+        else:
+            hasher.update(f'array{value.dtype.str}{value.shape}'.encode())
+            hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (datetime, date)):
+        hasher.update(f'date{value.isoformat()}'.encode())
+    elif isinstance(value, (float, np.floating)):
+        hasher.update(f'float{float(value)!r}'.encode())
+    elif isinstance(value, (str, int, bool, np.integer)) or value is None:
+        hasher.update(f'{type(value).__name__}{value}'.encode())
+    else:
+        # Other buffer-protocol objects, like .NET primitive arrays, are hashed by their raw bytes too
+        try:
+            buffer = memoryview(value)
+        except TypeError:
+            pass
+        else:
+            _hash_value(hasher, buffer)
+            return
+
+        # Other collections, like .NET lists, are hashed by their items. Their string is only their type name
+        try:
+            items = list(value)
+        except TypeError:
+            hasher.update(f'{type(value).__name__}{value}'.encode())
+        else:
+            _hash_value(hasher, items)
+
+def _to_picklable(value):
+    '''Converts a chart input to numpy arrays and Python objects, so it can be sent to the worker processes.
+    .NET arrays and lists can't be pickled'''
+    if isinstance(value, (list, tuple)):
+        return [_to_picklable(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_picklable(item) for key, item in value.items()}
+    if isinstance(value, (str, bytes, int, float, bool, np.generic, np.ndarray, pd.Series, pd.DataFrame, datetime, date)) or value is None:
+        return value
+    try:
+        # Copied, a view would keep a reference to the .NET memory
+        return np.array(memoryview(value))
+    except TypeError:
+        pass
+    try:
+        return [_to_picklable(item) for item in value]
+    except TypeError:
+        return value
+
+def _to_array(values):
+    '''Converts the values to a numpy array, without copying buffer-protocol objects like .NET primitive arrays'''
+    if isinstance(values, np.ndarray):
+        return values
+    try:
+        return np.asarray(memoryview(values))
+    except TypeError:
+        return np.asarray(values)
+
+def _to_times(values):
+    '''
+    Converts the times to a datetime64[ns] array. Accepts datetimes, datetime64 values,
+    or int64 unix timestamps in nanoseconds from any buffer-protocol object
+    '''
+    values = _to_array(values)
+    if values.size == 0:
+        return np.array([], dtype='datetime64[ns]')
+    if values.dtype.kind in 'iu':
+        return values.astype(np.int64, copy=False).view('datetime64[ns]')
+    return values.astype('datetime64[ns]', copy=False)
+
+def _to_values(values):
+    '''Converts the values to a float64 array. Accepts lists, numpy arrays or any buffer-protocol object'''
+    return _to_array(values).astype(float, copy=False)
+
+def _to_time_series(data):
+    '''Converts a list of alternating times and values, e.g. [time, values, benchmark time, benchmark values], to arrays'''
+    return [_to_times(x) if i % 2 == 0 else _to_values(x) for i, x in enumerate(data)]
+
+def _get_ordinal(number):
+    '''Gets the english ordinal of the number, e.g. 1st, 2nd, 11th, 23rd'''
+    suffix = 'th' if 10 <= number % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(number % 10, 'th')
+    return f'{number}{suffix}'
+
+def _get_lttb_indices(x, y, threshold):
+    '''Gets the indices of the points selected by the Largest-Triangle-Three-Buckets algorithm'''
+    length = len(y)
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+
+    # The first and last points are always selected. Each bucket in between selects the point that forms
+    # the largest triangle with the point selected in the previous bucket and the average of the next bucket
+    edges = (np.arange(threshold - 1) * (length - 2) / (threshold - 2)).astype(np.int64) + 1
+    edges[-1] = length - 1
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0], indices[-1] = 0, length - 1
+
+    selected = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else length
+        average_x = x[end:next_end].mean()
+        average_y = y[end:next_end].mean()
+        areas = np.abs((x[selected] - average_x) * (y[start:end] - y[selected]) -
+                       (x[selected] - x[start:end]) * (average_y - y[selected]))
+        selected = start + areas.argmax()
+        indices[i + 1] = selected
+
+    return indices
+
+def _get_minmax_indices(x, y, threshold):
+    '''Gets the indices of the minimum and maximum points of buckets of the series, which keeps every peak and trough visible'''
+    length = len(y)
+    buckets = threshold // 2
+    if buckets >= length or buckets < 1:
+        return np.arange(length)
+
+    edges = np.linspace(0, length, buckets + 1).astype(np.int64)
+    indices = [0, length - 1]
+    for start, end in zip(edges[:-1], edges[1:]):
+        bucket = y[start:end]
+        indices += [start + bucket.argmin(), start + bucket.argmax()]
+
+    return np.unique(indices)
+
+def _chart(method):
+    '''
+    Decorates a chart method so matplotlib is only loaded when a chart is rendered,
+    and its result is reused when called again with the same inputs
+    '''
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Cached charts wouldn't be written to the output directory
+        key = None
+        if self.cache is not None and not self.output_directory:
+            key = self.cache.get_key(method.__name__, args, kwargs, self._get_cache_settings())
+            result = self.cache.get(key)
+            if result is not None:
+                return result
+
+        _load_matplotlib()
+        result = method(self, *args, **kwargs)
+        if key is not None:
+            self.cache.set(key, result)
+        return result
+    return wrapper
 
 class ReportCharts:
     color_map = {
@@ -53,17 +369,189 @@ class ReportCharts:
             "CryptoFuture": "#E55812"
         }
 
-    def fig_to_base64(self, filename = '', fig = None, dpi = 200):
-        base64 = 'data:image/png;base64,'
-        if fig is not None:
-            fig.savefig(filename, dpi=dpi, bbox_inches='tight')
-            with open(filename, "rb") as fp:
-                base64 += b64encode(fp.read()).decode('utf-8').replace('\n', '')
-            return base64
+    # Short exposure uses the inverted color of the security type
+    short_color_map = {k: '#' + hex(int(v[1:], 16) ^ 0xffffff)[2:].zfill(6) for k, v in color_map.items()}
+    exposure_color_map = {**color_map, **{k + ' - Short': v for k, v in short_color_map.items()}}
+
+    mime_types = {
+            "png": "image/png",
+            "svg": "image/svg+xml",
+            "webp": "image/webp"
+        }
+
+    downsample_methods = ['lttb', 'minmax']
+
+    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+    def __init__(self, image_format = 'png', dpi = 200, output_directory = None, cache_directory = None, cache_size = 512 * 1024 * 1024,
+                 downsample = None, downsample_points = None):
+        '''
+        image_format: Format of the encoded images: 'png', 'svg' or 'webp' (lossless)
+        dpi: Resolution of the raster images in dots per inch
+        output_directory: If set, the images are also saved to this directory. Otherwise they are only encoded in memory
+        cache_directory: If set, rendered charts are cached in this directory and reused when rendered again with the same inputs
+        cache_size: Maximum size of the cache directory in bytes
+        downsample: Default downsampling of the long time series charts: 'lttb', 'minmax' or None to plot every point.
+                    Each chart method can override it with its downsample argument
+        downsample_points: Number of points the time series are downsampled to. Defaults to the width of the image in pixels
+        '''
+        image_format = str(image_format).lower()
+        if image_format not in self.mime_types:
+            raise ValueError(f'ReportCharts(): Unsupported image format: {image_format}. Supported formats: {", ".join(self.mime_types)}')
+        self._validate_downsample(downsample)
+
+        self.image_format = image_format
+        self.dpi = dpi
+        self.output_directory = output_directory
+        self.cache = ChartCache(cache_directory, cache_size) if cache_directory else None
+        self.downsample = downsample
+        self.downsample_points = downsample_points
+
+    def _get_settings(self):
+        '''Gets the settings required to create an equivalent ReportCharts instance, without cache'''
+        return {'image_format': self.image_format, 'dpi': self.dpi, 'output_directory': self.output_directory,
+                'downsample': self.downsample, 'downsample_points': self.downsample_points}
+
+    def _get_cache_settings(self):
+        '''Gets the settings that change the rendered charts, so they are part of the cache keys'''
+        return [self.image_format, self.dpi, self.downsample, self.downsample_points]
+
+    def _validate_downsample(self, downsample):
+        if downsample and downsample not in self.downsample_methods:
+            raise ValueError(f'ReportCharts(): Unsupported downsample method: {downsample}. Supported methods: {", ".join(self.downsample_methods)}')
+
+    def _downsample(self, time, values, downsample = None, width = 11.5, keep = None):
+        '''
+        Downsamples a time series to about one point per pixel of the image, preserving its shape
+        time: Times of the series
+        values: Values of the series
+        downsample: 'lttb', 'minmax', False to plot every point, or None to use the default of this instance
+        width: Width of the image in inches
+        keep: Indices of points that must be kept, e.g. drawdown troughs
+        Returns the downsampled times and values, or the same series if it is short enough
+        '''
+        downsample = self.downsample if downsample is None else downsample
+        self._validate_downsample(downsample)
+        threshold = self.downsample_points or int(width * self.dpi)
+        if not downsample or len(values) <= threshold:
+            return time, values
+
+        time = np.asarray(time, dtype='datetime64[ns]')
+        values = np.asarray(values, dtype=float)
+
+        # Missing values are kept as they are since they break the plotted lines
+        finite = np.isfinite(values)
+        positions = np.flatnonzero(finite)
+        downsampler = _get_lttb_indices if downsample == 'lttb' else _get_minmax_indices
+        indices = positions[downsampler(time[positions].astype(np.int64).astype(float), values[positions], threshold)]
+        indices = np.union1d(indices, np.flatnonzero(~finite))
+        if keep is not None and len(keep) > 0:
+            indices = np.union1d(indices, keep)
+
+        return time[indices], values[indices]
+
+    def RenderCharts(self, requests, max_workers = None):
+        '''
+        Renders a batch of charts in a pool of worker processes, so the charts of a report don't render one after another.
+        requests: [ [method, [args], {kwargs}] ] where method is the name of one of the Get* methods, e.g. 'GetDrawdown'
+        max_workers: Number of worker processes. Defaults to the number of processors. If 1, renders in the current process
+        Returns the list of results of each request, in the same order as the requests
+        '''
+        requests = [self._get_chart_request(request) for request in requests]
+        results = [None] * len(requests)
+
+        # Only the charts that aren't cached need to be rendered
+        keys = [None] * len(requests)
+        if self.cache is not None and not self.output_directory:
+            for i, (method, args, kwargs) in enumerate(requests):
+                keys[i] = self.cache.get_key(method, args, kwargs, self._get_cache_settings())
+                results[i] = self.cache.get(keys[i])
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(pending))
+
+        rendered = None
+        context = self._get_multiprocessing_context() if max_workers > 1 else None
+        if context is not None:
+            try:
+                # Inputs the conversion didn't handle would only fail when pickled by the executor, as a TypeError
+                pickle.dumps([requests[i] for i in pending])
+            except (TypeError, AttributeError, pickle.PickleError) as e:
+                _log_error(f'ReportCharts.RenderCharts(): Failed to send the charts to the worker processes, rendering sequentially. {e}')
+                context = None
+        if context is not None:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+                    futures = [executor.submit(_render_chart, self._get_settings(), *requests[i]) for i in pending]
+                    rendered = [future.result() for future in futures]
+            except (BrokenProcessPool, OSError, pickle.PickleError) as e:
+                # Errors of the charts themselves are raised, only the failures to run the workers fall back
+                _log_error(f'ReportCharts.RenderCharts(): Failed to render in worker processes, rendering sequentially. {e}')
+
+        if rendered is None:
+            rendered = [_render_chart(self._get_settings(), *requests[i]) for i in pending]
+
+        for i, result in zip(pending, rendered):
+            results[i] = result
+            if keys[i] is not None:
+                self.cache.set(keys[i], result)
+
+        return results
+
+    def _get_chart_request(self, request):
+        '''Converts a chart request into a (method, args, kwargs) tuple of numpy arrays and Python objects'''
+        request = list(request)
+        method = str(request[0])
+        if not method.startswith('Get') or not hasattr(self, method):
+            raise ValueError(f'ReportCharts.RenderCharts(): Unknown chart method: {method}')
+        args = [_to_picklable(arg) for arg in request[1]] if len(request) > 1 and request[1] is not None else []
+        kwargs = {str(k): _to_picklable(v) for k, v in dict(request[2]).items()} if len(request) > 2 and request[2] is not None else {}
+        return method, args, kwargs
+
+    def _get_multiprocessing_context(self):
+        '''Gets the multiprocessing context for the worker processes.
+        An embedded interpreter can't be forked safely, so we spawn new interpreters instead. None if there's no interpreter to spawn'''
+        executable = _get_python_executable()
+        if executable is None:
+            _log_error('ReportCharts.RenderCharts(): No Python interpreter found to spawn the worker processes, rendering sequentially')
+            return None
+        if executable == sys.executable:
+            return multiprocessing.get_context()
+        context = multiprocessing.get_context('spawn')
+        context.set_executable(executable)
+        return context
+
+    def fig_to_base64(self, filename = '', fig = None, dpi = None, image_format = None):
+        '''
+        Encodes the figure as a base64 data URI straight from a memory buffer.
+        The image is only written to disk, named after the chart, when an output directory was set
+        '''
+        if fig is None:
+            return None
+
+        image_format = (image_format or self.image_format).lower()
+        # WebP is lossy by default, charts must stay sharp
+        kwargs = {'pil_kwargs': {'lossless': True}} if image_format == 'webp' else {}
+
+        buffer = BytesIO()
+        fig.savefig(buffer, format=image_format, dpi=dpi or self.dpi, bbox_inches='tight', **kwargs)
+        image = buffer.getvalue()
+
+        if self.output_directory and filename:
+            name = f'{os.path.splitext(os.path.basename(filename))[0]}.{image_format}'
+            with open(os.path.join(self.output_directory, name), 'wb') as fp:
+                fp.write(image)
+
+        return f'data:{self.mime_types[image_format]};base64,' + b64encode(image).decode('utf-8')
 
+    @_chart
     def GetReturnsPerTrade(self, returns_per_trade = [], live_returns_per_trade = [],
                            name = "returns-per-trade.png", width = 7, height = 5,
                            live_color = "#ff9914", backtest_color = "#71c3fc"):
+        returns_per_trade = _to_values(returns_per_trade)
+        live_returns_per_trade = _to_values(live_returns_per_trade)
 
         if len(returns_per_trade) == 0:
             fig = plt.figure()
@@ -135,12 +623,14 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @_chart
     def GetCumulativeReturns(self, data = None, live_data = None, benchmark_symbol = 'SPY',
                                  name = "cumulative-return.png", width = 11.5, height = 2.5, live_color = "#ff9914",
-                                 backtest_color = "#71c3fc", gray = "#b3bcc0"):
+                                 backtest_color = "#71c3fc", gray = "#b3bcc0", downsample = None):
         '''
         data: [ [strategyTime], [strategyPoints], [benchTime], [benchResults] ]
         live_data: [ [strategyTime], [strategyPoints], [benchTime], [benchResults] ]
+        downsample: 'lttb', 'minmax', False to plot every point, or None to use the default of this instance
         '''
 
         # Initialize lists here instead of method signature to avoid
@@ -149,6 +639,8 @@ class ReportCharts:
             data = [[],[],[],[]]
         if live_data is None:
             live_data = [[],[],[],[]]
+        data = _to_time_series(data)
+        live_data = _to_time_series(live_data)
 
         if len(data[0]) == 0:
             fig = plt.figure()
@@ -187,8 +679,8 @@ class ReportCharts:
         values = [[data[0], data[1]], [data[2], data[3]]]
 
         for i, array in enumerate(values):
-            if any(array[0]):
-                ax.plot(array[0], array[1], linewidth=0.5, color=colors[i], drawstyle='steps-post')
+            if len(array[0]) > 0:
+                ax.plot(*self._downsample(array[0], array[1], downsample, width), linewidth=0.5, color=colors[i], drawstyle='steps-post')
             else:
                 # We have nothing for this graph. Wipe any mention of it
                 labels_removed.append(labels[i])
@@ -235,8 +727,8 @@ class ReportCharts:
             values = [[live_data[0], live_data[1]], [live_data[2], live_data[3]]]
 
             for i, array in enumerate(values):
-                if any(array[0]):
-                    ax.plot(array[0], array[1], linewidth=0.5, color=colors[i], drawstyle='steps-post')
+                if len(array[0]) > 0:
+                    ax.plot(*self._downsample(array[0], array[1], downsample, width), linewidth=0.5, color=colors[i], drawstyle='steps-post')
                     rectangles.append(plt.Rectangle((0, 0), 1, 1, fc=colors[i]))
 
         ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
@@ -262,9 +754,13 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @_chart
     def GetDailyReturns(self, returns = [[],[]], live_returns = [[],[]],
                             name = "daily-returns.png", width = 11.5, height = 2.5,
                             live_color = "#ff9914", backtest_color = "#71c3fc", gray = "#b3bcc0"):
+        returns = _to_time_series(returns)
+        live_returns = _to_time_series(live_returns)
+
         if len(returns[0]) == 0:
             fig = plt.figure()
             fig.set_size_inches(width, height)
@@ -292,11 +788,6 @@ class ReportCharts:
             plt.close('all')
             return base64
 
-        returns[0] = list(returns[0])
-        returns[1] = list(returns[1])
-        live_returns[0] = list(live_returns[0])
-        live_returns[1] = list(live_returns[1])
-
         plt.figure()
         ax = plt.gca()
 
@@ -345,12 +836,16 @@ class ReportCharts:
         plt.clf()
         return base64
 
-    def GetMonthlyReturns(self, returns = {}, live_returns = {}, width=7, height=5, name='monthly-returns.png'):
+    @_chart
+    def GetMonthlyReturns(self, returns = {}, live_returns = {}, width=7, height=5, name='monthly-returns.png',
+                          years = None, live_years = None):
         '''
         Expects monthly returns in dictionary keyed by year containing a list of monthly returns (as percentage values, i.e. 1% is 1.0 in the list).
         Example: {'2019': [10.0, 15.25, -20.05, NaN, NaN, NaN, NaN, NaN, NaN, NaN, NaN, NaN]}
+        The returns can also be a precomputed year by month matrix, as a numpy array or any buffer with 12 values per year,
+        with the years labeling its rows in years and live_years
         '''
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+        months = self.months
 
         # Populate the list with np.nan so that we can successfully
         # convert this dict into a DataFrame
@@ -385,8 +880,7 @@ class ReportCharts:
             plt.close('all')
             return base64
 
-        # Make data frame
-        returns = pd.DataFrame(returns, index = months).transpose()
+        returns, years = self._get_monthly_returns(returns, years)
 
         c = mcolors.ColorConverter().to_rgb
         colors = [c('#CC0000'), c('#FF0000'), c('#FF3333'),
@@ -398,7 +892,7 @@ class ReportCharts:
         norm = plt.Normalize(-10, 10)
 
         if len(live_returns) > 0:
-            live_returns = pd.DataFrame(live_returns, index=months).transpose()
+            live_returns, live_years = self._get_monthly_returns(live_returns, live_years)
 
             fig, ax = plt.subplots(2, 1, gridspec_kw={'height_ratios': [6, 1]})
             #ax[0].matshow(returns, aspect='auto', cmap=c_map, interpolation='none', vmin=-10, vmax=10)
@@ -406,29 +900,21 @@ class ReportCharts:
             ax[0].matshow(returns, aspect='auto', cmap=abs_cmap, norm=norm, interpolation='none')
             ax[1].matshow(live_returns, aspect='auto', cmap=abs_cmap, norm=norm, interpolation='none')
 
-            ax[0].xaxis.set_major_locator(ticker.MaxNLocator(min(12, len(returns.columns))))
-            ax[0].yaxis.set_major_locator(ticker.MaxNLocator(len(returns.index.values)))
-            ax[0].set_yticklabels([''] + list(returns.index.values))
-            ax[0].set_xticklabels([''] + [x for x in returns.columns])
+            ax[0].xaxis.set_major_locator(ticker.MaxNLocator(12))
+            ax[0].yaxis.set_major_locator(ticker.MaxNLocator(len(years)))
+            ax[0].set_yticklabels([''] + years)
+            ax[0].set_xticklabels([''] + months)
             ax[0].tick_params(labelsize=8, bottom=True, labelbottom=True, top=False, labeltop=False)
             ax[0].set_ylabel('Backtest', rotation='vertical', fontweight='black')
-            for (j, i), label in np.ndenumerate(returns):
-                if np.isnan(label):
-                    ax[0].text(i, j, "", ha='center', va='center', fontsize=7)
-                else:
-                    ax[0].text(i, j, round(label, 1), ha='center', va='center', fontsize=7)
-
-            ax[1].xaxis.set_major_locator(ticker.MaxNLocator(min(12, len(live_returns.columns))))
-            ax[1].yaxis.set_major_locator(ticker.MaxNLocator(len(live_returns.index.values)))
-            ax[1].set_xticklabels([''] + [x for x in live_returns.columns])  ## will need to be fixed for more than 1 year
-            ax[1].set_yticklabels([''] + list(live_returns.index.values))
+            self._annotate_heatmap(ax[0], returns)
+
+            ax[1].xaxis.set_major_locator(ticker.MaxNLocator(12))
+            ax[1].yaxis.set_major_locator(ticker.MaxNLocator(len(live_years)))
+            ax[1].set_xticklabels([''] + months)  ## will need to be fixed for more than 1 year
+            ax[1].set_yticklabels([''] + live_years)
             ax[1].tick_params(labelsize=8, bottom=True, labelbottom=True, top=False, labeltop=False)
             ax[1].set_ylabel('Live', rotation='vertical', fontweight='black')
-            for (j, i), label in np.ndenumerate(live_returns):
-                if np.isnan(label):
-                    ax[1].text(i, j, "", ha='center', va='center', fontsize=7)
-                else:
-                    ax[1].text(i, j, round(label, 1), ha='center', va='center', fontsize=7)
+            self._annotate_heatmap(ax[1], live_returns)
 
             ax[0].tick_params(axis='x', color='#d5d5d5')
             ax[0].tick_params(axis='y', color='#d5d5d5')
@@ -442,13 +928,9 @@ class ReportCharts:
             plt.ylabel('')
             plt.gca().tick_params(axis='x', color='#d5d5d5')
             plt.gca().tick_params(axis='y', color='#d5d5d5')
-            plt.yticks(range(len(returns.index.values)), returns.index.values, fontsize=8)
-            plt.xticks(range(12), ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])
-            for (j, i), label in np.ndenumerate(returns):
-                if np.isnan(label):
-                    plt.text(i, j, "", ha='center', va='center', fontsize=7)
-                else:
-                    plt.text(i, j, str(round(label, 1)), ha='center', va='center', fontsize=7)
+            plt.yticks(range(len(years)), years, fontsize=8)
+            plt.xticks(range(12), months)
+            self._annotate_heatmap(plt.gca(), returns)
 
         fig.set_size_inches(width, height)
         base64 = self.fig_to_base64(name, fig)
@@ -457,6 +939,29 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    def _get_monthly_returns(self, returns, years = None):
+        '''
+        Gets the year by month matrix of the monthly returns and the labels of its rows
+        returns: Dictionary of monthly returns keyed by year, DataFrame or year by month matrix
+        years: Labels of the rows of the matrix. Defaults to the row numbers
+        '''
+        if isinstance(returns, dict):
+            return np.array(list(returns.values()), dtype=float).reshape(-1, 12), list(returns.keys())
+        if isinstance(returns, pd.DataFrame):
+            returns = pd.DataFrame(returns, index=self.months).transpose()
+            return returns.to_numpy(dtype=float), list(returns.index.values)
+
+        returns = _to_values(returns).reshape(-1, 12)
+        return returns, list(years) if years is not None else list(range(len(returns)))
+
+    def _annotate_heatmap(self, ax, returns):
+        '''Writes the rounded returns on the cells of the heatmap, skipping the missing months'''
+        rows, columns = np.nonzero(np.isfinite(returns))
+        labels = np.round(returns[rows, columns], 1)
+        for j, i, label in zip(rows, columns, labels):
+            ax.text(i, j, str(label), ha='center', va='center', fontsize=7)
+
+    @_chart
     def GetAnnualReturns(self, data = None, live_data = None, name = "annual-returns.png",width = 3.5*2, height = 2.5*2):
 
         live_color = "#ff9914"
@@ -496,7 +1001,7 @@ class ReportCharts:
 
         # Cast to list just in case
         time = list(data[0]) + list(live_data[0])
-        returns = list(data[1]) + list(live_data[1])
+        returns = np.concatenate([_to_values(data[1]), _to_values(live_data[1])])
 
         plt.figure()
         ax = plt.gca()
@@ -528,8 +1033,11 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @_chart
     def GetDrawdown(self, data = [[],[]], live_data = [[],[]], worst = [{}], name = "drawdowns.png",
-                        width = 11.5, height = 2.5, gray = "#b3bcc0"):
+                        width = 11.5, height = 2.5, gray = "#b3bcc0", downsample = None):
+        data = _to_time_series(data)
+        live_data = _to_time_series(live_data)
 
         if len(data[0]) == 0:
             fig = plt.figure()
@@ -558,42 +1066,44 @@ class ReportCharts:
             plt.close('all')
             return base64
 
-        time = list(data[0]) + list(live_data[0])
-        drawdown = list(data[1]) + list(live_data[1])
+        # Sorted datetime64 times let us find the worst periods with binary searches
+        time = np.concatenate([data[0], live_data[0]])
+        drawdown = np.concatenate([data[1], live_data[1]])
+        min_drawdown = drawdown.min()
 
         colors = ["#FFCCCCCC", "#FFE5CCCC", "#FFFFCCCC", "#E5FFCCCC", "#CCFFCCCC"]
-        labels = ["1st Worst", "2nd Worst", "3rd Worst", "4th Worst", "5th Worst"]
         plt.figure()
         ax = plt.gca()
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
 
+        # The worst points are found at full resolution and kept when downsampling, so the troughs stay in the plot
+        worst_indices = []
+        for values in worst:
+            begin_index, end_index = np.searchsorted(time, np.array([values['Begin'], values['End']], dtype='datetime64[ns]'))
+            worst_indices.append(begin_index + drawdown[begin_index:end_index].argmin() if begin_index < end_index else None)
+
         # Backtest
         #ax.plot(time, drawdown, color=gray, zorder=2)
-        ax.fill_between(time, drawdown, 0, color=gray, zorder=3, step='post')
+        ax.fill_between(*self._downsample(time, drawdown, downsample, width, [i for i in worst_indices if i is not None]),
+                        0, color=gray, zorder=3, step='post')
 
-        for index, values in enumerate(worst):
+        for index, (values, worst_index) in enumerate(zip(worst, worst_indices)):
             start = values['Begin']
             end = values['End']
+            worst_point = start if worst_index is None else time[worst_index]
 
-            if start == end:
-                worst_point = start
-            else:
-                sub_data = drawdown[time.index(start):time.index(end)]
-                worst_point = time[drawdown.index(min(sub_data))]
-
-            plt.axvspan(start, end, 0, 0.95, color = colors[index], zorder = 1)
+            plt.axvspan(start, end, 0, 0.95, color = colors[index % len(colors)], zorder = 1)
             plt.axvline(worst_point, 0, 0.95, ls = 'dashed', color = 'black', zorder = 4, linewidth = 0.5)
-            ax.text(worst_point, min(drawdown) * 0.75, labels[index], rotation = 90, zorder = 4, va='bottom')
+            ax.text(worst_point, min_drawdown * 0.75, f'{_get_ordinal(index + 1)} Worst', rotation = 90, zorder = 4, va='bottom')
 
         # Live
         live_time = live_data[0]
-        live_drawdown = live_data[1]
 
         # No need to draw the live mode stuff since we've already taken care of it.
         # We're just after the Live trading dotted plot in case it exists
 
         plt.axvline(live_time[0], 0, 0.95, ls='dotted', color='red', zorder=4) if len(live_time) > 0 else None
-        plt.text(live_time[0], min(min(drawdown), min(live_drawdown)) * 0.75, "Live Trading", rotation=90, zorder=4, fontsize=7) if len(live_time) > 0 else None
+        plt.text(live_time[0], min_drawdown * 0.75, "Live Trading", rotation=90, zorder=4, fontsize=7) if len(live_time) > 0 else None
 
         fig = ax.get_figure()
         plt.xticks(rotation=0, ha='center', fontsize=8)
@@ -613,8 +1123,11 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @_chart
     def GetCrisisEventsPlots(self, data = [[],[],[]], name = '', width = 7, height = 5,
                              backtest_color = "#71c3fc", gray = "#b3bcc0"):
+        data = [_to_times(data[0])] + [_to_values(x) for x in data[1:]]
+
         if len(data[0]) == 0:
             fig = plt.figure()
             fig.set_size_inches(width, height)
@@ -653,9 +1166,13 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @_chart
     def GetRollingBeta(self, data = [[],[],[],[]], live_data = [[],[],[],[]], name = "rolling-portfolio-beta-to-equity.png",
                         width = 11.5, height = 2.5, live_six_months_color = "#ff9914", live_twelve_months_color = "#ffd700",
-                        backtest_six_months_color = "#71c3fc", backtest_twelve_months_color = "#1d7dc1"):
+                        backtest_six_months_color = "#71c3fc", backtest_twelve_months_color = "#1d7dc1",
+                        downsample = None):
+        data = _to_time_series(data)
+        live_data = _to_time_series(live_data)
 
         if len(data[0]) == 0 and len(live_data[0]) == 0:
             fig = plt.figure()
@@ -715,15 +1232,15 @@ class ReportCharts:
 
         # Backtest
         if len(backtest_six_month_beta) > 0:
-            ax.plot(backtest_six_month_beta_dates, backtest_six_month_beta, linewidth=0.5, color=backtest_six_months_color)
+            ax.plot(*self._downsample(backtest_six_month_beta_dates, backtest_six_month_beta, downsample, width), linewidth=0.5, color=backtest_six_months_color)
         if len(backtest_twelve_month_beta) > 0:
-            ax.plot(backtest_twelve_month_beta_dates, backtest_twelve_month_beta, linewidth=0.5, color=backtest_twelve_months_color)
+            ax.plot(*self._downsample(backtest_twelve_month_beta_dates, backtest_twelve_month_beta, downsample, width), linewidth=0.5, color=backtest_twelve_months_color)
 
         # Live
         if len(live_six_month_beta) > 0:
-            ax.plot(live_six_month_beta_dates, live_six_month_beta, linewidth=0.5, color=live_six_months_color)
+            ax.plot(*self._downsample(live_six_month_beta_dates, live_six_month_beta, downsample, width), linewidth=0.5, color=live_six_months_color)
         if len(live_twelve_month_beta) > 0:
-            ax.plot(live_twelve_month_beta_dates, live_twelve_month_beta, linewidth=0.5, color=live_twelve_months_color)
+            ax.plot(*self._downsample(live_twelve_month_beta_dates, live_twelve_month_beta, downsample, width), linewidth=0.5, color=live_twelve_months_color)
 
         leg = ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
                         frameon=False, fontsize=8, ncol=2)
@@ -745,9 +1262,14 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @_chart
     def GetRollingSharpeRatio(self, data = [[],[]], live_data = [[],[]], name = "rolling-sharpe-ratio.png",
                                 width = 11.5, height = 2.5, live_six_months_color = "#ff9914", live_twelve_months_color = "#ffd700",
-                                backtest_six_months_color = "#71c3fc", backtest_twelve_months_color = "#1d7dc1"):
+                                backtest_six_months_color = "#71c3fc", backtest_twelve_months_color = "#1d7dc1",
+                                downsample = None):
+        data = _to_time_series(data)
+        live_data = _to_time_series(live_data)
+
         if len(data[0]) == 0:
             fig = plt.figure()
             fig.set_size_inches(width, height)
@@ -804,15 +1326,15 @@ class ReportCharts:
 
         # Backtest
         if len(backtest_six_month_rolling_sharpe) > 0:
-            ax.plot(backtest_six_month_rolling_sharpe_dates, backtest_six_month_rolling_sharpe, linewidth=0.5, color=backtest_six_months_color)
+            ax.plot(*self._downsample(backtest_six_month_rolling_sharpe_dates, backtest_six_month_rolling_sharpe, downsample, width), linewidth=0.5, color=backtest_six_months_color)
         if len(backtest_twelve_month_rolling_sharpe) > 0:
-            ax.plot(backtest_twelve_month_rolling_sharpe_dates, backtest_twelve_month_rolling_sharpe, linewidth=0.5, color=backtest_twelve_months_color)
+            ax.plot(*self._downsample(backtest_twelve_month_rolling_sharpe_dates, backtest_twelve_month_rolling_sharpe, downsample, width), linewidth=0.5, color=backtest_twelve_months_color)
 
         # Live
         if len(live_six_month_rolling_sharpe) > 0:
-            ax.plot(live_six_month_rolling_sharpe_dates, live_six_month_rolling_sharpe, linewidth=0.5, color=live_six_months_color)
+            ax.plot(*self._downsample(live_six_month_rolling_sharpe_dates, live_six_month_rolling_sharpe, downsample, width), linewidth=0.5, color=live_six_months_color)
         if len(live_twelve_month_rolling_sharpe) > 0:
-            ax.plot(live_twelve_month_rolling_sharpe_dates, live_twelve_month_rolling_sharpe, linewidth=0.5, color=live_twelve_months_color)
+            ax.plot(*self._downsample(live_twelve_month_rolling_sharpe_dates, live_twelve_month_rolling_sharpe, downsample, width), linewidth=0.5, color=live_twelve_months_color)
 
         leg = ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
                         frameon=False, fontsize=8)
@@ -835,6 +1357,7 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @_chart
     def GetAssetAllocation(self, data = [[],[]], live_data = [[],[]],
                               name="asset-allocation.png", width = 7, height = 5):
         if len(data[0]) == 0:
@@ -903,8 +1426,11 @@ class ReportCharts:
 
         return pies
 
+    @_chart
     def GetLeverage(self, data = [[],[]], live_data = [[],[]], name = "leverage.png",width = 11.5,
-                        height = 2.5, backtest_color = "#71c3fc", live_color = "#ff9914",):
+                        height = 2.5, backtest_color = "#71c3fc", live_color = "#ff9914", downsample = None):
+        data = _to_time_series(data)
+        live_data = _to_time_series(live_data)
 
         if len(data[0]) == 0:
             fig = plt.figure()
@@ -940,13 +1466,15 @@ class ReportCharts:
         fig = ax.get_figure()
 
         # Backtest
-        ax.fill_between(data[0], 0, data[1], color = backtest_color, alpha = 0.75, step='post')
+        leverage_time, leverage = self._downsample(data[0], data[1], downsample, width)
+        ax.fill_between(leverage_time, 0, leverage, color = backtest_color, alpha = 0.75, step='post')
 
         # Live
         if len(live_data[0]) != 0:
             labels.append('Live')
 
-        ax.fill_between(live_data[0], 0, live_data[1], color=live_color, alpha=0.75, step = 'post')
+        live_leverage_time, live_leverage = self._downsample(live_data[0], live_data[1], downsample, width)
+        ax.fill_between(live_leverage_time, 0, live_leverage, color=live_color, alpha=0.75, step = 'post')
 
         rectangles = [plt.Rectangle((0, 0), 1, 1, fc=backtest_color), plt.Rectangle((0, 0), 1, 1, fc=live_color)]
         ax.legend(rectangles, [label for label in labels], handlelength=0.8, handleheight=0.8,
@@ -970,6 +1498,24 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    def _get_step_series(self, time, data):
+        '''
+        Creates the step series for a stackplot by adding a value right before the next data point with the same previous value.
+        time: Times of the data points (size: N)
+        data: Values of every series, each one with a value per time (size: K x N)
+        Returns the step times (size: 2N - 1) and the stacked step values (size: K x 2N - 1)
+        '''
+        values = [_to_values(x) for x in data]
+        length = max([len(x) for x in values], default=0)
+        if length == 0:
+            return np.array([]), np.empty((1, 0))
+
+        # [t0, t1, t1, t2, t2, ...] and [v0, v0, v1, v1, v2, ...]
+        time = _to_times(time)[:length]
+        values = np.vstack(values)
+        return np.repeat(time, 2)[1:], np.repeat(values, 2, axis=1)[:, :-1]
+
+    @_chart
     def GetExposure(self, time = [], long_securities = [], short_securities = [], long_data = [[]], short_data = [[]],
                         live_time = [], live_long_securities = [], live_short_securities = [], live_long_data = [[]],
                         live_short_data = [[]], name = "exposure.png", width = 11.5, height = 2.5):
@@ -1000,130 +1546,52 @@ class ReportCharts:
             plt.close('all')
             return base64
 
-        for k, v in list(self.color_map.items()):
-            self.color_map[k + ' - Short'] = '#' + hex(int(v[1:], 16) ^ 0xffffff)[2:].zfill(6)
-
         # None if no colors can be mapped, so stackplot gets None and doesn't try to access this color list
         long_colors = [self.color_map[security] for security in long_securities] if len(long_securities) > 0 else None
         long_live_colors = [self.color_map[security] for security in live_long_securities] if len(live_long_securities) > 0 else None
-        short_colors = [self.color_map[security + ' - Short'] for security in short_securities] if len(short_securities) > 0 else None
-        short_live_colors = [self.color_map[security + ' - Short'] for security in live_short_securities] if len(live_short_securities) > 0 else None
+        short_colors = [self.short_color_map[security] for security in short_securities] if len(short_securities) > 0 else None
+        short_live_colors = [self.short_color_map[security] for security in live_short_securities] if len(live_short_securities) > 0 else None
 
         ax = plt.gca()
 
-        # Create step plot for the stackplot by adding a value
-        # right before the next data point with the same previous value
-        time_copy = []
-        long_data_copy = []
-        short_data_copy = []
-
-        j = 0
-        for time_idx, longs, shorts in zip(time, long_data, short_data):
-            long_data_copy.append([])
-            short_data_copy.append([])
-
-            long_len = len(longs)
-
-            for i in range(1, long_len + 1):
-                if i == long_len :
-                    time_copy.append(time[i - 1])
-                    long_data_copy[j].append(longs[i - 1])
-                    short_data_copy[j].append(shorts[i - 1])
-
-                else:
-                    time_copy.append(time[i - 1])
-                    time_copy.append(time[i])
-                    long_data_copy[j].append(longs[i - 1])
-                    long_data_copy[j].append(longs[i - 1])
-
-                    short_data_copy[j].append(shorts[i - 1])
-                    short_data_copy[j].append(shorts[i - 1])
-
-            j += 1
-
-        if len([x for x in long_data]) == 0:
-            long_data = [[]]
-        if len([x for x in short_data]) == 0:
-            short_data = [[]]
-        if len([x for x in live_long_data]) == 0:
-            live_long_data = [[]]
-        if len([x for x in live_short_data]) == 0:
-            live_short_data = [[]]
-
-        # Create step plot for the stackplot by adding a value
-        # right before the next data point with the same previous value
-        live_time_copy = []
-        live_long_data_copy = []
-        live_short_data_copy = []
-        j = 0
-        for time_idx, longs, shorts in zip(live_time, live_long_data, live_short_data):
-            live_long_data_copy.append([])
-            live_short_data_copy.append([])
-
-            long_len = len(longs)
-
-            for i in range(1, long_len + 1):
-                if i == long_len :
-                    live_time_copy.append(live_time[i - 1])
-                    live_long_data_copy[j].append(longs[i - 1])
-                    live_short_data_copy[j].append(shorts[i - 1])
-
-                else:
-                    live_time_copy.append(live_time[i - 1])
-                    live_time_copy.append(live_time[i])
-                    live_long_data_copy[j].append(longs[i - 1])
-                    live_long_data_copy[j].append(longs[i - 1])
-                    live_short_data_copy[j].append(shorts[i - 1])
-                    live_short_data_copy[j].append(shorts[i - 1])
-
-            j += 1
-
-        if not len(long_data_copy) > 0:
-            long_data_copy.append([])
-        if not len(short_data_copy) > 0:
-            short_data_copy.append([])
-        if not len(live_long_data_copy) > 0:
-            live_long_data_copy.append([])
-        if not len(live_short_data_copy) > 0:
-            live_short_data_copy.append([])
-        if not len(time_copy) > 0:
-            time_copy.append(float('nan'))
+        time_copy, long_data_copy = self._get_step_series(time, long_data)
+        _, short_data_copy = self._get_step_series(time, short_data)
+        live_time_copy, live_long_data_copy = self._get_step_series(live_time, live_long_data)
+        _, live_short_data_copy = self._get_step_series(live_time, live_short_data)
 
         # No need to check if live is empty or not, this will handle it, just needs to plot whichever has the longer time index first
-        if max([len(x) for x in long_data_copy]) > max([len(x) for x in short_data_copy]):
-            ax.stackplot(time_copy[:max([len(x) for x in long_data_copy])], np.vstack(long_data_copy), colors=long_colors, alpha = 0.75)
-            ax.stackplot(time_copy[:max([len(x) for x in short_data_copy])], np.vstack(short_data_copy), colors=short_colors, alpha=0.75)
+        if long_data_copy.shape[1] > short_data_copy.shape[1]:
+            ax.stackplot(time_copy[:long_data_copy.shape[1]], long_data_copy, colors=long_colors, alpha = 0.75)
+            ax.stackplot(time_copy[:short_data_copy.shape[1]], short_data_copy, colors=short_colors, alpha=0.75)
         else:
-            ax.stackplot(time_copy[:max([len(x) for x in short_data_copy])], np.vstack(short_data_copy), colors=short_colors, alpha=0.75)
-            ax.stackplot(time_copy[:max([len(x) for x in long_data_copy])], np.vstack(long_data_copy), colors=long_colors, alpha=0.75)
+            ax.stackplot(time_copy[:short_data_copy.shape[1]], short_data_copy, colors=short_colors, alpha=0.75)
+            ax.stackplot(time_copy[:long_data_copy.shape[1]], long_data_copy, colors=long_colors, alpha=0.75)
 
-        if max([len(x) for x in live_long_data_copy]) > max([len(x) for x in live_short_data_copy]):
-            ax.stackplot(live_time_copy[:max([len(x) for x in live_long_data_copy])], np.vstack(live_long_data_copy),
+        if live_long_data_copy.shape[1] > live_short_data_copy.shape[1]:
+            ax.stackplot(live_time_copy[:live_long_data_copy.shape[1]], live_long_data_copy,
                          colors=long_live_colors, alpha = 0.75)
-            ax.stackplot(live_time_copy[:max([len(x) for x in live_short_data_copy])], np.vstack(live_short_data_copy),
+            ax.stackplot(live_time_copy[:live_short_data_copy.shape[1]], live_short_data_copy,
                          colors=short_live_colors, alpha = 0.75)
         else:
-            ax.stackplot(live_time_copy[:max([len(x) for x in live_short_data_copy])], np.vstack(live_short_data_copy),
+            ax.stackplot(live_time_copy[:live_short_data_copy.shape[1]], live_short_data_copy,
                          colors=short_live_colors, alpha=0.75)
-            ax.stackplot(live_time_copy[:max([len(x) for x in live_long_data_copy])], np.vstack(live_long_data_copy),
+            ax.stackplot(live_time_copy[:live_long_data_copy.shape[1]], live_long_data_copy,
                          colors=long_live_colors, alpha=0.75)
 
-        labels = long_securities + short_securities
-        live_labels = live_long_securities + live_short_securities
+        labels = list(long_securities) + list(short_securities)
+        live_labels = list(live_long_securities) + list(live_short_securities)
 
-        for security in short_securities:
-            if not all([all([abs(y) == 0.0 for y in x]) for x in short_data]):
-                labels.append(security + ' - Short')
+        if np.any(short_data_copy != 0):
+            labels += [security + ' - Short' for security in short_securities]
 
-        for security in live_short_securities:
-            if not all([all([abs(y) == 0.0 for y in x]) for x in live_short_data]):
-                live_labels.append(security + ' - Short')
+        if np.any(live_short_data_copy != 0):
+            live_labels += [security + ' - Short' for security in live_short_securities]
 
         # use dict.fromkeys() instead of set() to remove duplicates and preserve order
         labels = list(dict.fromkeys(labels))
         live_labels = list(dict.fromkeys(live_labels))
-        rectangles = [plt.Rectangle((0, 0), 1, 1, fc=self.color_map[lab]) for lab in labels]
-        live_rectangles = [plt.Rectangle((0, 0), 1, 1, fc=self.color_map[lab]) for lab in live_labels]
+        rectangles = [plt.Rectangle((0, 0), 1, 1, fc=self.exposure_color_map[lab]) for lab in labels]
+        live_rectangles = [plt.Rectangle((0, 0), 1, 1, fc=self.exposure_color_map[lab]) for lab in live_labels]
         ax.legend(rectangles + live_rectangles, labels + [f'{lab} - Live' for lab in live_labels], handlelength=0.8,
                   handleheight=0.8, frameon=False, fontsize=8, ncol=len(labels), loc='upper right')
         fig = ax.get_figure()
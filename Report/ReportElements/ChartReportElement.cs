@@ -13,7 +13,11 @@
  * limitations under the License.
 */
 
+using System;
+using System.Collections.Generic;
+using System.Linq;
 using Python.Runtime;
+using QuantConnect.Configuration;
 using QuantConnect.Python;
 
 
@@ -35,7 +39,86 @@ namespace QuantConnect.Report.ReportElements
                 dynamic module = Py.Import("ReportCharts");
                 var classObj = module.ReportCharts;
 
-                Charting = classObj.Invoke();
+                // Images are encoded in memory, they are only saved to disk if an output directory is set
+                using var kwargs = Py.kw("image_format", Config.Get("report-chart-format", "png"), "dpi", Config.GetInt("report-chart-dpi", 200));
+                var outputDirectory = Config.Get("report-chart-output-directory");
+                if (!string.IsNullOrEmpty(outputDirectory))
+                {
+                    using var pyOutputDirectory = outputDirectory.ToPython();
+                    kwargs.SetItem("output_directory", pyOutputDirectory);
+                }
+
+                // Opt-in cache of the rendered charts, reused when a chart is rendered again with the same inputs
+                var cacheDirectory = Config.Get("report-chart-cache-directory");
+                if (!string.IsNullOrEmpty(cacheDirectory))
+                {
+                    using var pyCacheDirectory = cacheDirectory.ToPython();
+                    using var pyCacheSize = (Config.GetInt("report-chart-cache-size-mb", 512) * 1024L * 1024L).ToPython();
+                    kwargs.SetItem("cache_directory", pyCacheDirectory);
+                    kwargs.SetItem("cache_size", pyCacheSize);
+                }
+
+                // Opt-in downsampling of the long time series to about one point per pixel: 'lttb' or 'minmax'
+                var downsample = Config.Get("report-chart-downsample");
+                if (!string.IsNullOrEmpty(downsample))
+                {
+                    using var pyDownsample = downsample.ToPython();
+                    kwargs.SetItem("downsample", pyDownsample);
+
+                    var downsamplePoints = Config.GetInt("report-chart-downsample-points");
+                    if (downsamplePoints > 0)
+                    {
+                        using var pyDownsamplePoints = downsamplePoints.ToPython();
+                        kwargs.SetItem("downsample_points", pyDownsamplePoints);
+                    }
+                }
+
+                Charting = classObj.Invoke(Array.Empty<PyObject>(), kwargs);
+            }
+        }
+
+        /// <summary>
+        /// Converts the times to an array of unix timestamps in nanoseconds, which ReportCharts reads
+        /// through the buffer protocol in a single copy instead of one python datetime per point
+        /// </summary>
+        /// <param name="times">Times of the series</param>
+        /// <returns>Python object wrapping the Int64 array</returns>
+        protected static PyObject ToPythonTimes(IEnumerable<DateTime> times)
+        {
+            return times.Select(Time.DateTimeToUnixTimeStampNanoseconds).ToArray().ToPython();
+        }
+
+        /// <summary>
+        /// Converts the values to an array, which ReportCharts reads through the buffer protocol in a single copy
+        /// </summary>
+        /// <param name="values">Values of the series</param>
+        /// <returns>Python object wrapping the Double array</returns>
+        protected static PyObject ToPythonValues(IEnumerable<double> values)
+        {
+            return values.ToArray().ToPython();
+        }
+
+        /// <summary>
+        /// Gets the hit and miss statistics of the chart cache
+        /// </summary>
+        /// <returns>The statistics of the cache, null if the cache is disabled</returns>
+        internal static string GetCacheStatistics()
+        {
+            if (Charting == null)
+            {
+                return null;
+            }
+
+            using (Py.GIL())
+            {
+                PyObject cache = Charting.cache;
+                if (cache.IsNone())
+                {
+                    return null;
+                }
+
+                using var statistics = cache.InvokeMethod("stats");
+                return statistics.ToString();
             }
         }
     }
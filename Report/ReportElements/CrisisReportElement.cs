@@ -58,10 +58,14 @@ namespace QuantConnect.Report.ReportElements
             var backtestBenchmarkSeries = new Series<DateTime, double>(backtestBenchmarkPoints.Keys, backtestBenchmarkPoints.Values);
 
             var html = new List<string>();
+            var crisisFrames = new List<KeyValuePair<Crisis, Frame<DateTime, string>>>();
 
-            foreach (var crisisEvent in Crisis.Events)
+            using (Py.GIL())
             {
-                using (Py.GIL())
+                // Submit every crisis event plot together so they can be rendered in parallel
+                var requests = new PyList();
+
+                foreach (var crisisEvent in Crisis.Events)
                 {
                     var crisis = crisisEvent.Value;
                     var data = new PyList();
@@ -78,11 +82,29 @@ namespace QuantConnect.Report.ReportElements
                     // Pad out all missing values to start from 0 for nice plots
                     crisisFrame = crisisFrame.FillMissing(Direction.Forward).FillMissing(0.0);
 
-                    data.Append(crisisFrame.RowKeys.ToList().ToPython());
-                    data.Append(crisisFrame["BacktestPercent"].Values.ToList().ToPython());
-                    data.Append(crisisFrame["BenchmarkPercent"].Values.ToList().ToPython());
+                    data.Append(ToPythonTimes(crisisFrame.RowKeys));
+                    data.Append(ToPythonValues(crisisFrame["BacktestPercent"].Values));
+                    data.Append(ToPythonValues(crisisFrame["BenchmarkPercent"].Values));
+
+                    var arguments = new PyList();
+                    arguments.Append(data);
+                    arguments.Append(crisis.Name.Replace("/", "").Replace(".", "").Replace(" ", "").ToPython());
 
-                    var base64 = (string)Charting.GetCrisisEventsPlots(data, crisis.Name.Replace("/", "").Replace(".", "").Replace(" ", ""));
+                    var request = new PyList();
+                    request.Append("GetCrisisEventsPlots".ToPython());
+                    request.Append(arguments);
+                    requests.Append(request);
+
+                    crisisFrames.Add(new KeyValuePair<Crisis, Frame<DateTime, string>>(crisis, crisisFrame));
+                }
+
+                var results = Charting.RenderCharts(requests);
+
+                for (var i = 0; i < crisisFrames.Count; i++)
+                {
+                    var crisis = crisisFrames[i].Key;
+                    var crisisFrame = crisisFrames[i].Value;
+                    var base64 = (string)results[i];
 
                     if (base64 == _emptyChart)
                     {
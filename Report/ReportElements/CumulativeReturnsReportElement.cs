@@ -130,15 +130,15 @@ namespace QuantConnect.Report.ReportElements
                 var liveCumulativePercent = finalSeries.Where(kvp => kvp.Key >= liveStart);
                 var liveBenchmarkCumulativePercent = finalBenchSeries.Where(kvp => kvp.Key >= liveBenchStart);
 
-                backtestList.Append(backtestCumulativePercent.Keys.ToList().ToPython());
-                backtestList.Append(backtestCumulativePercent.Values.ToList().ToPython());
-                backtestList.Append(backtestBenchmarkCumulativePercent.Keys.ToList().ToPython());
-                backtestList.Append(backtestBenchmarkCumulativePercent.Values.ToList().ToPython());
-
-                liveList.Append(liveCumulativePercent.Keys.ToList().ToPython());
-                liveList.Append(liveCumulativePercent.Values.ToList().ToPython());
-                liveList.Append(liveBenchmarkCumulativePercent.Keys.ToList().ToPython());
-                liveList.Append(liveBenchmarkCumulativePercent.Values.ToList().ToPython());
+                backtestList.Append(ToPythonTimes(backtestCumulativePercent.Keys));
+                backtestList.Append(ToPythonValues(backtestCumulativePercent.Values));
+                backtestList.Append(ToPythonTimes(backtestBenchmarkCumulativePercent.Keys));
+                backtestList.Append(ToPythonValues(backtestBenchmarkCumulativePercent.Values));
+
+                liveList.Append(ToPythonTimes(liveCumulativePercent.Keys));
+                liveList.Append(ToPythonValues(liveCumulativePercent.Values));
+                liveList.Append(ToPythonTimes(liveBenchmarkCumulativePercent.Keys));
+                liveList.Append(ToPythonValues(liveBenchmarkCumulativePercent.Values));
 
                 base64 = Charting.GetCumulativeReturns(backtestList, liveList);
             }
@@ -18,6 +18,7 @@ using System.Collections.Generic;
 using System.Linq;
 using Deedle;
 using Python.Runtime;
+using QuantConnect.Configuration;
 using QuantConnect.Packets;
 using QuantConnect.Util;
 
@@ -56,7 +57,7 @@ namespace QuantConnect.Report.ReportElements
 
             var seriesUnderwaterPlot = DrawdownCollection.GetUnderwater(strategySeries).DropMissing();
             var liveUnderwaterPlot = backtestPoints.Count == 0 ? seriesUnderwaterPlot : seriesUnderwaterPlot.After(backtestPoints.Last().Key);
-            var drawdownCollection = DrawdownCollection.FromResult(_backtest, _live, periods: 5);
+            var drawdownCollection = DrawdownCollection.FromResult(_backtest, _live, periods: Config.GetInt("report-drawdown-periods", 5));
 
             var base64 = "";
             using (Py.GIL())
@@ -65,18 +66,19 @@ namespace QuantConnect.Report.ReportElements
 
                 if (liveUnderwaterPlot.IsEmpty)
                 {
-                    backtestList.Append(seriesUnderwaterPlot.Keys.ToList().ToPython());
-                    backtestList.Append(seriesUnderwaterPlot.Values.ToList().ToPython());
+                    backtestList.Append(ToPythonTimes(seriesUnderwaterPlot.Keys));
+                    backtestList.Append(ToPythonValues(seriesUnderwaterPlot.Values));
                 }
                 else
                 {
-                    backtestList.Append(seriesUnderwaterPlot.Before(liveUnderwaterPlot.FirstKey()).Keys.ToList().ToPython());
-                    backtestList.Append(seriesUnderwaterPlot.Before(liveUnderwaterPlot.FirstKey()).Values.ToList().ToPython());
+                    var backtestUnderwaterPlot = seriesUnderwaterPlot.Before(liveUnderwaterPlot.FirstKey());
+                    backtestList.Append(ToPythonTimes(backtestUnderwaterPlot.Keys));
+                    backtestList.Append(ToPythonValues(backtestUnderwaterPlot.Values));
                 }
 
                 var liveList = new PyList();
-                liveList.Append(liveUnderwaterPlot.Keys.ToList().ToPython());
-                liveList.Append(liveUnderwaterPlot.Values.ToList().ToPython());
+                liveList.Append(ToPythonTimes(liveUnderwaterPlot.Keys));
+                liveList.Append(ToPythonValues(liveUnderwaterPlot.Values));
 
                 var worstList = new PyList();
                 var previousDrawdownPeriods = new List<KeyValuePair<DateTime, DateTime>>();
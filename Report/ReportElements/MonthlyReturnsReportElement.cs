@@ -63,54 +63,41 @@ namespace QuantConnect.Report.ReportElements
             var base64 = "";
             using (Py.GIL())
             {
-                var backtestResults = new PyDict();
-                foreach (var kvp in backtestMonthlyReturns.GroupBy(kvp => kvp.Key.Year).GetObservations())
-                {
-                    var key = kvp.Key.ToStringInvariant();
-                    var monthlyReturns = kvp.Value * 100;
+                // Year by month matrices, passed as flat arrays of 12 values per year
+                var backtestResults = GetMonthlyReturnsMatrix(backtestMonthlyReturns, out var backtestYears);
+                var liveResults = GetMonthlyReturnsMatrix(liveMonthlyReturns, out var liveYears);
 
-                    var values = new List<double>();
-                    for (var i = 1; i <= 12; i++)
-                    {
-                        var returns = monthlyReturns.Where(row => row.Key.Month == i);
-                        if (!returns.IsEmpty)
-                        {
-                            values.Add(returns.FirstValue());
-                            continue;
-                        }
+                base64 = Charting.GetMonthlyReturns(ToPythonValues(backtestResults), ToPythonValues(liveResults),
+                    years: backtestYears, live_years: liveYears);
+            }
 
-                        values.Add(double.NaN);
-                    }
+            return base64;
+        }
 
-                    backtestResults.SetItem(key.ToPython(), values.ToPython());
-                }
+        /// <summary>
+        /// Gets the monthly returns as percentages, with 12 values per year and NaN for the missing months
+        /// </summary>
+        /// <param name="monthlyReturns">Returns of each month, keyed by the last day of the month</param>
+        /// <param name="years">Python list of the years labeling each row of the matrix</param>
+        /// <returns>The year by month matrix of returns, flattened by rows</returns>
+        private static List<double> GetMonthlyReturnsMatrix(Series<DateTime, double> monthlyReturns, out PyList years)
+        {
+            years = new PyList();
+            var values = new List<double>();
+            foreach (var kvp in monthlyReturns.GroupBy(kvp => kvp.Key.Year).GetObservations())
+            {
+                using var year = kvp.Key.ToStringInvariant().ToPython();
+                years.Append(year);
 
-                var liveResults = new PyDict();
-                foreach (var kvp in liveMonthlyReturns.GroupBy(kvp => kvp.Key.Year).GetObservations())
+                var yearReturns = kvp.Value * 100;
+                for (var i = 1; i <= 12; i++)
                 {
-                    var key = kvp.Key.ToStringInvariant();
-                    var monthlyReturns = kvp.Value * 100;
-
-                    var values = new List<double>();
-                    for (var i = 1; i <= 12; i++)
-                    {
-                        var returns = monthlyReturns.Where(row => row.Key.Month == i);
-                        if (!returns.IsEmpty)
-                        {
-                            values.Add(returns.FirstValue());
-                            continue;
-                        }
-
-                        values.Add(double.NaN);
-                    }
-
-                    liveResults.SetItem(key.ToPython(), values.ToPython());
+                    var returns = yearReturns.Where(row => row.Key.Month == i);
+                    values.Add(returns.IsEmpty ? double.NaN : returns.FirstValue());
                 }
-
-                base64 = Charting.GetMonthlyReturns(backtestResults, liveResults);
             }
 
-            return base64;
+            return values;
         }
     }
 }
\ No newline at end of file
@@ -3326,6 +3326,43 @@ def getHistory(algorithm, symbol, period):
             }
         }
 
+        [TestCase(1)]
+        [TestCase(5)]
+        [TestCase(30)]
+        public void PythonHistoryChunksMatchHistory(int chunkDays)
+        {
+            var start = new DateTime(2013, 10, 1);
+            var end = new DateTime(2013, 12, 31);
+            var algorithm = GetAlgorithm(end);
+            algorithm.AddEquity("SPY", Resolution.Daily);
+            algorithm.AddEquity("AAPL", Resolution.Daily);
+
+            using (Py.GIL())
+            {
+                PythonInitializer.Initialize();
+                algorithm.SetPandasConverter();
+
+                using var testModule = PyModule.FromString("PythonHistoryChunksMatchHistory",
+                    @"
+from AlgorithmImports import *
+
+def assertHistoryChunks(algorithm, start, end, chunk_days):
+    history = algorithm.history(['SPY', 'AAPL'], start, end, Resolution.DAILY)
+    chunks = list(algorithm.history_chunks(['SPY', 'AAPL'], start, end, Resolution.DAILY, chunk=timedelta(days=chunk_days)))
+
+    assert len(chunks) > 1, f'Expected several chunks, got {len(chunks)}'
+    for chunk in chunks:
+        times = chunk.index.get_level_values('time')
+        assert times.max() - times.min() < timedelta(days=chunk_days), f'Chunk spans from {times.min()} to {times.max()}'
+
+    merged = pd.concat(chunks).sort_index()
+    assert merged.equals(history.sort_index()), 'The chunks differ from the history data frame'
+    ");
+                dynamic assertHistoryChunks = testModule.GetAttr("assertHistoryChunks");
+                AssertDesNotThrowPythonException(() => assertHistoryChunks(algorithm, start, end, chunkDays));
+            }
+        }
+
         [Test]
         public void PythonUniverseHistoryDataFramesAreFlattened()
         {
@@ -265,6 +265,119 @@ class CustomPortfolioOptimizer:
             }
         }
 
+        [Test]
+        public void RollingMomentsMatchDataFrameMoments()
+        {
+            using (Py.GIL())
+            {
+                // Symbols with missing returns, joining and leaving the universe, compared against the data frame of their last returns
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"from AlgorithmImports import *
+from collections import deque
+from Portfolio.RollingMoments import RollingMoments
+
+def get_errors(period = 10):
+    random = np.random.RandomState(0)
+    moments = RollingMoments(period)
+    windows = {}
+    errors = []
+    for time in range(100):
+        if time % 15 == 0:
+            removed = next(iter(windows), None)
+            windows.pop(removed, None)
+            moments.remove(removed)
+        if time % 10 == 0:
+            windows[f'SYMBOL{time}'] = deque(maxlen=period)
+        for symbol, window in windows.items():
+            if random.uniform() < 0.8:
+                value = random.normal(0, 0.01)
+                window.append((time, value))
+                moments.update(symbol, time, value)
+
+        returns = pd.DataFrame({ symbol: pd.Series([x[1] for x in window], index=[x[0] for x in window], dtype=float) for symbol, window in windows.items() })
+        mean, covariance = moments.get_moments(list(windows))
+        errors.append(np.nanmax(np.abs(mean - returns.mean()), initial=0))
+        errors.append(np.nanmax(np.abs(covariance - returns.cov()).values, initial=0))
+        errors.append(int(not np.array_equal(np.isnan(covariance.values), np.isnan(returns.cov().values))))
+    return max(errors)");
+
+                var error = module.GetAttr("get_errors").Invoke().As<double>();
+                Assert.Less(error, 1e-12);
+            }
+        }
+
+        [Test]
+        public void RollingMomentsCovarianceMatchesNumpyForAlignedReturns()
+        {
+            using (Py.GIL())
+            {
+                // The risk parity model only uses the covariance of the moments when every symbol has a return at every time,
+                // where it must be the one of np.cov its optimizer computes
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"from AlgorithmImports import *
+from Portfolio.RollingMoments import RollingMoments
+
+def get_error(period = 10):
+    random = np.random.RandomState(0)
+    moments = RollingMoments(period)
+    symbols = ['A', 'B', 'C']
+    for time in range(3 * period):
+        for symbol in symbols:
+            moments.update(symbol, time, random.normal(0, 0.01))
+    returns = moments.get_returns(symbols)
+    _, covariance = moments.get_moments(symbols)
+    return np.max(np.abs(covariance.values - np.cov(returns.T)))");
+
+                var error = module.GetAttr("get_error").Invoke().As<double>();
+                Assert.Less(error, 1e-12);
+            }
+        }
+
+        [TestCase(false)]
+        [TestCase(true)]
+        public void RollingMomentsReturnsMatchDataFrame(bool outOfOrder)
+        {
+            using (Py.GIL())
+            {
+                // Symbols with missing returns, out of order times and joining and leaving the universe, compared against the data frame of their last returns
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"from AlgorithmImports import *
+from collections import deque
+from Portfolio.RollingMoments import RollingMoments
+
+def get_errors(out_of_order, period = 10):
+    random = np.random.RandomState(0)
+    moments = RollingMoments(period)
+    windows = {}
+    errors = []
+    for time in range(100):
+        if time % 15 == 0:
+            removed = next(iter(windows), None)
+            windows.pop(removed, None)
+            moments.remove(removed)
+        if time % 10 == 0:
+            windows[f'SYMBOL{time}'] = deque(maxlen=period)
+        for symbol, window in windows.items():
+            value_time = time - random.randint(0, 3) if out_of_order else time
+            if random.uniform() < 0.8 and all(x[0] != value_time for x in window):
+                value = random.normal(0, 0.01)
+                window.append((value_time, value))
+                moments.update(symbol, value_time, value)
+
+        for symbols in [list(windows), list(windows)[::-1], list(windows)[:2] + ['UNKNOWN']]:
+            expected = pd.DataFrame({ symbol: pd.Series([x[1] for x in windows[symbol]], index=[x[0] for x in windows[symbol]], dtype=float) for symbol in symbols if symbol in windows }, columns=symbols)
+            expected = expected.dropna(how='all').sort_index()
+            returns = moments.get_returns(symbols)
+            errors.append(int(list(returns.index) != list(expected.index) or list(returns.columns) != symbols))
+            errors.append(int(not np.array_equal(np.isnan(returns.values), np.isnan(expected.values.astype(float)))))
+            errors.append(np.nanmax(np.abs(returns.values - expected.values.astype(float)), initial=0))
+    return max(errors)");
+
+                var error = module.GetAttr("get_errors").Invoke(outOfOrder.ToPython()).As<double>();
+                Assert.AreEqual(0, error);
+            }
+        }
+
         protected void SetPortfolioConstruction(Language language, PortfolioBias bias)
         {
             var model = GetPortfolioConstructionModel(language, Resolution.Daily, bias);
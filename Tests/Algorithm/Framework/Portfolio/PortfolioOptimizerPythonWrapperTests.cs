@@ -73,4 +73,206 @@ class CustomPortfolioOptimizer:
             Assert.Throws<NotImplementedException>(() => new PortfolioOptimizerPythonWrapper(pyCustomOptimizer));
         }
     }
+
+    [TestCase("MinimumVariancePortfolioOptimizer")]
+    [TestCase("MaximumSharpeRatioPortfolioOptimizer")]
+    public void InitialGuessDropsRemovedColumnsAndPadsNewColumns(string optimizerName)
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @$"
+from AlgorithmImports import *
+from Portfolio.{optimizerName} import {optimizerName}
+
+optimizer = {optimizerName}(warm_start=True)
+optimizer._previous_weights = {{'A': 0.6, 'B': 0.2, 'C': 0.2}}
+guess = optimizer.get_initial_guess(pd.Index(['A', 'B', 'D']), np.array(3 * [1. / 3]))
+size = len(guess)
+total = float(np.sum(guess))
+a, b, d = [float(x) for x in guess]");
+
+            // C was removed and D is new: D starts from the equal weight, then the guess is rescaled to the budget
+            var total = 0.6 + 0.2 + 1.0 / 3;
+            Assert.AreEqual(3, module.GetAttr("size").As<int>());
+            Assert.AreEqual(1, module.GetAttr("total").As<double>(), 1e-12);
+            Assert.AreEqual(0.6 / total, module.GetAttr("a").As<double>(), 1e-12);
+            Assert.AreEqual(0.2 / total, module.GetAttr("b").As<double>(), 1e-12);
+            Assert.AreEqual(1.0 / 3 / total, module.GetAttr("d").As<double>(), 1e-12);
+        }
+    }
+
+    [Test]
+    public void RiskParityInitialGuessPadsNewColumnsWithTheAverageSolution()
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @$"
+from AlgorithmImports import *
+from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+
+optimizer = RiskParityPortfolioOptimizer(warm_start=True)
+optimizer._previous_solution = {{'A': 2.0, 'B': 4.0, 'C': 6.0}}
+guess = optimizer.get_initial_guess(pd.Index(['A', 'C', 'D']), np.array(3 * [1. / 3]))
+size = len(guess)
+a, c, d = [float(x) for x in guess]");
+
+            // The risk parity solution isn't normalized, so it isn't rescaled
+            Assert.AreEqual(3, module.GetAttr("size").As<int>());
+            Assert.AreEqual(2, module.GetAttr("a").As<double>(), 1e-12);
+            Assert.AreEqual(6, module.GetAttr("c").As<double>(), 1e-12);
+            Assert.AreEqual(4, module.GetAttr("d").As<double>(), 1e-12);
+        }
+    }
+
+    [TestCase("MinimumVariancePortfolioOptimizer", "_previous_weights")]
+    [TestCase("MaximumSharpeRatioPortfolioOptimizer", "_previous_weights")]
+    [TestCase("RiskParityPortfolioOptimizer", "_previous_solution")]
+    public void InitialGuessIsEqualWeightsByDefault(string optimizerName, string previousAttribute)
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @$"
+from AlgorithmImports import *
+from Portfolio.{optimizerName} import {optimizerName}
+
+optimizer = {optimizerName}()
+optimizer.{previousAttribute} = {{'A': 0.9, 'B': 0.1}}
+x0 = np.array(2 * [1. / 2])
+is_equal_weights = bool(np.array_equal(optimizer.get_initial_guess(pd.Index(['A', 'B']), x0), x0))");
+
+            Assert.IsTrue(module.GetAttr("is_equal_weights").As<bool>());
+        }
+    }
+
+    [TestCase("MinimumVariancePortfolioOptimizer", "_previous_weights", "target_return=0.002")]
+    [TestCase("MaximumSharpeRatioPortfolioOptimizer", "_previous_weights", "")]
+    [TestCase("RiskParityPortfolioOptimizer", "_previous_solution", "")]
+    public void FailedOptimizationKeepsThePreviousSolution(string optimizerName, string previousAttribute, string arguments)
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @$"
+from AlgorithmImports import *
+from scipy.optimize import OptimizeResult
+import Portfolio.{optimizerName} as optimizer_module
+from Portfolio.{optimizerName} import {optimizerName}
+
+random = np.random.RandomState(0)
+returns = pd.DataFrame(random.normal(0, 1e-2, (63, 3)) + [1e-3, 2e-3, 3e-3], columns=['A', 'B', 'C'])
+
+optimizer = {optimizerName}(warm_start=True, {arguments})
+optimizer.optimize(returns)
+previous = dict(optimizer.{previousAttribute})
+
+minimize = optimizer_module.minimize
+optimizer_module.minimize = lambda *args, **kwargs: OptimizeResult(x=np.array([0.5, 0.3, 0.2]), fun=1.0, success=False)
+try:
+    weights = optimizer.optimize(returns)
+finally:
+    optimizer_module.minimize = minimize
+
+has_previous = len(previous) == 3
+is_equal_weights = bool(np.allclose(weights, 1. / 3))
+is_unchanged = optimizer.{previousAttribute} == previous");
+
+            Assert.IsTrue(module.GetAttr("has_previous").As<bool>());
+            Assert.IsTrue(module.GetAttr("is_equal_weights").As<bool>());
+            Assert.IsTrue(module.GetAttr("is_unchanged").As<bool>());
+        }
+    }
+
+    [TestCase("MinimumVariancePortfolioOptimizer", -1, "target_return=0.001")]
+    [TestCase("MaximumSharpeRatioPortfolioOptimizer", -1, "")]
+    [TestCase("MaximumSharpeRatioPortfolioOptimizer", 0, "")]
+    public void QuadraticProgrammingSolverIsAtLeastAsOptimalAsSlsqp(string optimizerName, int minimumWeight, string arguments)
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @$"
+from AlgorithmImports import *
+from Portfolio.{optimizerName} import {optimizerName}
+
+random = np.random.RandomState(0)
+returns = pd.DataFrame(np.outer(random.normal(3e-4, 1e-2, 252), random.uniform(0.5, 1.5, 50)) + random.normal(2e-4, 1.5e-2, (252, 50)))
+covariance = returns.cov().values
+
+slsqp_weights = {optimizerName}(minimum_weight={minimumWeight}, {arguments}).optimize(returns)
+admm_weights = {optimizerName}(minimum_weight={minimumWeight}, solver='admm', {arguments}).optimize(returns)
+slsqp_variance = slsqp_weights @ covariance @ slsqp_weights
+admm_variance = admm_weights @ covariance @ admm_weights
+minimum_weight = admm_weights.min()
+maximum_weight = admm_weights.max()");
+
+            var slsqpVariance = module.GetAttr("slsqp_variance").As<double>();
+            var admmVariance = module.GetAttr("admm_variance").As<double>();
+
+            Assert.LessOrEqual(admmVariance, slsqpVariance * (1 + 1e-6));
+            Assert.GreaterOrEqual(module.GetAttr("minimum_weight").As<double>(), minimumWeight - 1e-9);
+            Assert.LessOrEqual(module.GetAttr("maximum_weight").As<double>(), 1 + 1e-9);
+        }
+    }
+
+    [TestCase("MinimumVariancePortfolioOptimizer", "target_return=0.001")]
+    [TestCase("MaximumSharpeRatioPortfolioOptimizer", "")]
+    public void QuadraticProgrammingSolverReturnsEqualWeightsForNaNCovariance(string optimizerName, string arguments)
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @$"
+from AlgorithmImports import *
+from Portfolio.{optimizerName} import {optimizerName}
+
+random = np.random.RandomState(0)
+returns = pd.DataFrame(random.normal(2e-4, 1e-2, (63, 3)))
+covariance = returns.cov()
+# a symbol without enough returns
+covariance.iloc[2, :] = np.nan
+covariance.iloc[:, 2] = np.nan
+
+weights = {optimizerName}(solver='admm', {arguments}).optimize(returns, covariance=covariance)
+is_equal_weights = bool(np.allclose(weights, 1. / 3))");
+
+            Assert.IsTrue(module.GetAttr("is_equal_weights").As<bool>());
+        }
+    }
+
+    [Test]
+    public void QuadraticProgrammingSolverIsAbstract()
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @$"
+from AlgorithmImports import *
+from Portfolio.QuadraticProgrammingSolver import QuadraticProgrammingSolver
+
+def create():
+    return QuadraticProgrammingSolver()");
+
+            Assert.Throws<PythonException>(() => module.GetAttr("create").Invoke());
+        }
+    }
+
+    [Test]
+    public void QuadraticProgrammingSolverThrowsForUnknownSolver()
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @$"
+from AlgorithmImports import *
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+
+def create():
+    return MinimumVariancePortfolioOptimizer(solver='unknown')");
+
+            Assert.Throws<PythonException>(() => module.GetAttr("create").Invoke());
+        }
+    }
 }
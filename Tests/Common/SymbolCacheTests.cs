@@ -225,5 +225,47 @@ namespace QuantConnect.Tests.Common
             Assert.IsFalse(SymbolCache.TryGetSymbol("SPY", out symbol));
             Assert.IsFalse(SymbolCache.TryGetTicker(Symbols.SPY, out ticker));
         }
+
+        [Test]
+        public void VersionChangesWhenMappingsChange()
+        {
+            var initialVersion = SymbolCache.Version;
+            SymbolCache.Set("SPY", Symbols.SPY);
+            var setVersion = SymbolCache.Version;
+            Assert.AreNotEqual(initialVersion, setVersion);
+
+            SymbolCache.TryRemove(Symbols.SPY);
+            var removedVersion = SymbolCache.Version;
+            Assert.AreNotEqual(setVersion, removedVersion);
+
+            SymbolCache.Clear();
+            Assert.AreNotEqual(removedVersion, SymbolCache.Version);
+        }
+
+        [Test]
+        public void VersionDoesNotChangeWhenResolvingTickers()
+        {
+            SymbolCache.Set("SPY", Symbols.SPY);
+            var version = SymbolCache.Version;
+
+            Assert.IsTrue(SymbolCache.TryGetSymbol("SPY", out _));
+            Assert.IsFalse(SymbolCache.TryGetSymbol("AAPL", out _));
+            Assert.AreEqual(version, SymbolCache.Version);
+        }
+
+        [Test]
+        public void TryGetSymbolsResolvesTickersInOrder()
+        {
+            SymbolCache.Set("SPY", Symbols.SPY);
+            SymbolCache.Set("AAPL", Symbols.AAPL);
+
+            var symbols = SymbolCache.TryGetSymbols(new[] { "AAPL", "UNKNOWN", "spy", Symbols.EURUSD.ID.ToString(), null });
+
+            Assert.AreEqual(Symbols.AAPL, symbols[0]);
+            Assert.IsNull(symbols[1]);
+            Assert.AreEqual(Symbols.SPY, symbols[2]);
+            Assert.AreEqual(Symbols.EURUSD, symbols[3]);
+            Assert.IsNull(symbols[4]);
+        }
     }
 }
@@ -25,9 +25,11 @@ using QuantConnect.Lean.Engine.DataFeeds;
 using QuantConnect.Python;
 using QuantConnect.Securities;
 using System;
+using System.Diagnostics;
 using System.Globalization;
 using System.Collections.Generic;
 using System.Linq;
+using QuantConnect.Logging;
 using QuantConnect.Tests.Common.Data.UniverseSelection;
 using QuantConnect.Tests.ToolBox;
 using QuantConnect.ToolBox;
@@ -408,6 +410,227 @@ namespace QuantConnect.Tests.Python
             }
         }
 
+        [TestCase("count", "int64")]
+        [TestCase("flag", "bool")]
+        [TestCase("expiry", "datetime64[ns]")]
+        [TestCase("nullablecount", "float64")]
+        [TestCase("nullableexpiry", "datetime64[ns]")]
+        [TestCase("name", "object")]
+        public void TypedColumnsHaveNumpyTypes(string column, string expectedType)
+        {
+            var converter = new PandasConverter();
+            var rawBars = Enumerable
+                .Range(0, 10)
+                .Select(i => new TypedValueData
+                {
+                    Symbol = Symbols.AAPL,
+                    EndTime = new DateTime(2020, 1, 1).AddDays(i),
+                    Count = i + 1,
+                    Flag = i % 2 == 0,
+                    Expiry = new DateTime(2020, 2, 1).AddDays(i),
+                    NullableCount = i % 2 == 0 ? i : null,
+                    NullableExpiry = i % 2 == 0 ? new DateTime(2020, 2, 1) : null,
+                    Name = $"name{i}"
+                })
+                .ToArray();
+
+            dynamic dataFrame = converter.GetDataFrame(rawBars);
+
+            using (Py.GIL())
+            {
+                var values = dataFrame[column];
+                Assert.AreEqual(expectedType, values.dtype.__str__().ToString());
+                Assert.AreEqual(10, values.__len__().AsManagedObject(typeof(int)));
+            }
+        }
+
+        [Test]
+        public void ColumnarDataFrameEqualsDefault()
+        {
+            var converter = new PandasConverter();
+            var slices = GetTradeBarSlices(3, 10).ToList();
+            // a symbol without data in some of the slices
+            slices[5] = new Slice(slices[5].Time, slices[5].Bars.Values.Take(2), slices[5].UtcTime);
+
+            dynamic dataFrame = converter.GetDataFrame(slices);
+            dynamic columnarDataFrame = converter.GetDataFrame(slices, columnar: true);
+
+            using (Py.GIL())
+            {
+                Assert.AreEqual(29, columnarDataFrame.__len__().AsManagedObject(typeof(int)));
+                Assert.IsTrue(dataFrame.equals(columnarDataFrame).AsManagedObject(typeof(bool)));
+                Assert.IsTrue(dataFrame.index.equals(columnarDataFrame.index).AsManagedObject(typeof(bool)));
+                Assert.AreEqual(dataFrame.index.names.__str__().ToString(), columnarDataFrame.index.names.__str__().ToString());
+
+                var subDataFrame = columnarDataFrame.loc[Symbols.SPY];
+                Assert.AreEqual(10, subDataFrame.__len__().AsManagedObject(typeof(int)));
+            }
+        }
+
+        [Test]
+        public void ParallelDataCollectionEqualsSequential()
+        {
+            var converter = new PandasConverter();
+            // more slices than a parallel batch, so the data is added in several batches
+            var slices = GetTradeBarSlices(20, 2500).ToList();
+            var maxDegreeOfParallelism = PandasConverter.MaxDegreeOfParallelism;
+
+            try
+            {
+                PandasConverter.MaxDegreeOfParallelism = 1;
+                dynamic dataFrame = converter.GetDataFrame(slices);
+
+                PandasConverter.MaxDegreeOfParallelism = 4;
+                dynamic parallelDataFrame = converter.GetDataFrame(slices);
+
+                using (Py.GIL())
+                {
+                    Assert.AreEqual(20 * 2500, parallelDataFrame.__len__().AsManagedObject(typeof(int)));
+                    Assert.IsTrue(dataFrame.equals(parallelDataFrame).AsManagedObject(typeof(bool)));
+                }
+            }
+            finally
+            {
+                PandasConverter.MaxDegreeOfParallelism = maxDegreeOfParallelism;
+            }
+        }
+
+        [Test]
+        public void ParallelDataCollectionKeepsPythonDataOnTheCallingThread()
+        {
+            var converter = new PandasConverter();
+            var maxDegreeOfParallelism = PandasConverter.MaxDegreeOfParallelism;
+
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(), @"
+from AlgorithmImports import *
+
+class CustomPythonData(PythonData):
+    pass
+
+def create(symbol, time, value):
+    data = CustomPythonData()
+    data.symbol = symbol
+    data.time = time
+    data.value = value
+    data['extra'] = value * 2
+    return data");
+
+                var customSymbol = Symbol.Create("CUSTOM", SecurityType.Base, Market.USA);
+                // the python data is mixed with lean data, which is still collected in parallel
+                var slices = GetTradeBarSlices(3, 1500)
+                    .Select((slice, i) =>
+                    {
+                        var customData = module.GetAttr("create")
+                            .Invoke(customSymbol.ToPython(), slice.Time.ToPython(), i.ToPython())
+                            .As<BaseData>();
+                        return new Slice(slice.Time, slice.AllData.Append(customData), slice.UtcTime);
+                    })
+                    .ToList();
+
+                try
+                {
+                    PandasConverter.MaxDegreeOfParallelism = 1;
+                    dynamic dataFrame = converter.GetDataFrame(slices);
+
+                    // the GIL is held by this thread while collecting in parallel
+                    PandasConverter.MaxDegreeOfParallelism = 4;
+                    dynamic parallelDataFrame = converter.GetDataFrame(slices);
+
+                    Assert.IsTrue(dataFrame.equals(parallelDataFrame).AsManagedObject(typeof(bool)));
+                }
+                finally
+                {
+                    PandasConverter.MaxDegreeOfParallelism = maxDegreeOfParallelism;
+                }
+            }
+        }
+
+        [TestCase(false)]
+        [TestCase(true)]
+        public void FieldsProjectionOnlyBuildsRequestedColumns(bool columnar)
+        {
+            var converter = new PandasConverter();
+            var slices = GetTradeBarSlices(3, 10).ToList();
+
+            dynamic dataFrame = converter.GetDataFrame(slices, columnar: columnar);
+            dynamic projectedDataFrame = converter.GetDataFrame(slices, columnar: columnar, fields: new[] { "Close", "volume", "missing" });
+
+            using (Py.GIL())
+            {
+                Assert.AreEqual("['close', 'volume']", projectedDataFrame.columns.sort_values().tolist().__str__().ToString());
+                var expected = dataFrame[projectedDataFrame.columns];
+                Assert.IsTrue(expected.equals(projectedDataFrame).AsManagedObject(typeof(bool)));
+            }
+        }
+
+        [Test]
+        public void FieldsProjectionOfQuoteBarMembers()
+        {
+            var converter = new PandasConverter();
+            var time = new DateTime(2013, 10, 7, 9, 31, 0);
+            var bar = new Bar(1.01m, 1.02m, 1.00m, 1.015m);
+            var slices = new[]
+            {
+                new Slice(time, new BaseData[]
+                {
+                    new TradeBar(time.AddMinutes(-1), Symbols.SPY, 100m, 101m, 99m, 100.5m, 1000, Time.OneMinute),
+                    new QuoteBar(time.AddMinutes(-1), Symbols.SPY, bar, 10m, bar, 20m, Time.OneMinute)
+                }, time)
+            };
+
+            dynamic dataFrame = converter.GetDataFrame(slices, fields: new[] { "close", "bidclose", "asksize" });
+
+            using (Py.GIL())
+            {
+                Assert.AreEqual("['asksize', 'bidclose', 'close']", dataFrame.columns.sort_values().tolist().__str__().ToString());
+                Assert.AreEqual(100.5, (double)dataFrame["close"].iloc[0].AsManagedObject(typeof(double)));
+                Assert.AreEqual(1.015, (double)dataFrame["bidclose"].iloc[0].AsManagedObject(typeof(double)));
+                Assert.AreEqual(20, (double)dataFrame["asksize"].iloc[0].AsManagedObject(typeof(double)));
+            }
+        }
+
+        [TestCase(500, 252 * 390), Explicit("Performance test")]
+        public void ColumnarDataFramePerformance(int symbolCount, int barCount)
+        {
+            var converter = new PandasConverter();
+
+            var timer = Stopwatch.StartNew();
+            using (Py.GIL())
+            {
+                using var dataFrame = converter.GetDataFrame(GetTradeBarSlices(symbolCount, barCount));
+            }
+            timer.Stop();
+            Log.Trace($"Default data frame of {symbolCount} symbols and {barCount} bars took {timer.ElapsedMilliseconds}ms");
+
+            timer.Restart();
+            using (Py.GIL())
+            {
+                using var dataFrame = converter.GetDataFrame(GetTradeBarSlices(symbolCount, barCount), columnar: true);
+            }
+            timer.Stop();
+            Log.Trace($"Columnar data frame of {symbolCount} symbols and {barCount} bars took {timer.ElapsedMilliseconds}ms");
+        }
+
+        private static IEnumerable<Slice> GetTradeBarSlices(int symbolCount, int barCount)
+        {
+            var symbols = new[] { Symbols.SPY, Symbols.AAPL, Symbols.IBM }
+                .Concat(Enumerable.Range(0, Math.Max(0, symbolCount - 3)).Select(i => Symbol.Create($"TICKER{i}", SecurityType.Equity, Market.USA)))
+                .Take(symbolCount)
+                .ToList();
+
+            var start = new DateTime(2013, 10, 7, 9, 30, 0);
+            return Enumerable
+                .Range(0, barCount)
+                .Select(i =>
+                {
+                    var time = start.AddMinutes(i);
+                    var bars = symbols.Select((symbol, j) => new TradeBar(time, symbol, 100m + j, 101m + j, 99m + j, 100m + i % 10, 1000 + i, Time.OneMinute));
+                    return new Slice(time.Add(Time.OneMinute), bars, time.Add(Time.OneMinute));
+                });
+        }
+
         /// <summary>
         /// Specific issues for symbol LOW, reference GH issue #4886
         /// </summary>
@@ -3800,6 +4023,48 @@ def DataFrameIsEmpty():
             }
         }
 
+        [Test]
+        public void IndicatorDataFrameHasTypedColumnsAndIndex()
+        {
+            var dateTime = new DateTime(2018, 1, 1);
+            var bollingerBands = new BollingerBands(5, 2);
+            var data = new Dictionary<string, List<IndicatorDataPoint>>
+            {
+                { "current", new List<IndicatorDataPoint>() },
+                { "upperband", new List<IndicatorDataPoint>() },
+                { "lowerband", new List<IndicatorDataPoint>() },
+                { "other", new List<IndicatorDataPoint>() }
+            };
+            for (var i = 0; i < 100; i++)
+            {
+                var time = dateTime.AddMinutes(i);
+                bollingerBands.Update(time, 100 + i % 7);
+                data["current"].Add(new IndicatorDataPoint(time, bollingerBands.Current.Value));
+                data["upperband"].Add(new IndicatorDataPoint(time, bollingerBands.UpperBand.Current.Value));
+                data["lowerband"].Add(new IndicatorDataPoint(time, bollingerBands.LowerBand.Current.Value));
+                // an output with different times
+                if (i % 2 == 0)
+                {
+                    data["other"].Add(new IndicatorDataPoint(time.AddSeconds(30), i));
+                }
+            }
+
+            var pdConverter = new PandasConverter();
+            using (Py.GIL())
+            {
+                dynamic dataFrame = pdConverter.GetIndicatorDataFrame(data);
+
+                Assert.AreEqual(150, (int)dataFrame.__len__().AsManagedObject(typeof(int)));
+                Assert.AreEqual("datetime64[ns]", dataFrame.index.dtype.__str__().ToString());
+                foreach (var column in data.Keys)
+                {
+                    Assert.AreEqual("float64", dataFrame[column].dtype.__str__().ToString());
+                    var values = dataFrame[column].dropna().tolist().As<List<double>>();
+                    CollectionAssert.AreEqual(data[column].Select(x => (double)x.Value), values);
+                }
+            }
+        }
+
         [TestCaseSource(nameof(GetHistoryWithDuplicateTimes))]
         public void HandlesSlicesWithDuplicateTimeStamps(Symbol symbol, IEnumerable<Slice> data, string expectedDataFrameString)
         {
@@ -4396,6 +4661,21 @@ $"           2013-10-08 00:02:01     110.0    112.0   105.0    110.0     98.0
             public double? NullableColumn { get; set; }
         }
 
+        internal class TypedValueData : BaseData
+        {
+            public int Count { get; set; }
+
+            public bool Flag { get; set; }
+
+            public DateTime Expiry { get; set; }
+
+            public int? NullableCount { get; set; }
+
+            public DateTime? NullableExpiry { get; set; }
+
+            public string Name { get; set; }
+        }
+
         internal class CustomData : DynamicData
         {
             private bool _isInitialized;
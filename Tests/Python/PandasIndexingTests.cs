@@ -74,6 +74,61 @@ namespace QuantConnect.Tests.Python
             }
         }
 
+        [Test]
+        public void MapperCachesSymbolResolutionsUntilSymbolCacheChanges()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_mapper_caches_symbol_resolutions();
+
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test]
+        public void MapperResolvesSequencesInBulk()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_mapper_resolves_sequences_in_bulk();
+
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test]
+        public void MappingReadsSymbolCacheVersionOncePerOperation()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_mapping_reads_symbol_cache_version_once_per_operation();
+
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test]
+        public void IndexingSkipsMappingOnPlainFrames()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_indexing_skips_mapping_on_plain_frames();
+
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test]
+        public void LeanPandasMappingCanBeDisabled()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_lean_pandas_mapping_can_be_disabled();
+
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
         [Test]
         public void ExpectedException()
         {
@@ -14,6 +14,7 @@
 from AlgorithmImports import *
 from QuantConnect.Tests import *
 from QuantConnect.Tests.Python import *
+import PandasMapper
 
 # TODO: Rename to PandasResearchTests and keep this class for QB related tests; rename py module to PandasTests
 class PandasIndexingTests():
@@ -68,3 +69,87 @@ class PandasDataFrameTests():
             return True
         except:
             return False
+
+    def test_mapper_caches_symbol_resolutions(self):
+        # The ticker doesn't resolve and the miss is cached, until the SymbolCache changes
+        ticker = 'PANDASMAPPERCACHE'
+        if PandasMapper.mapper(ticker) != ticker or PandasMapper.mapper(ticker) != ticker:
+            return False
+
+        symbol = Symbol.Create(ticker, SecurityType.Equity, Market.USA)
+        SymbolCache.Set(ticker, symbol)
+        mapped = PandasMapper.mapper(ticker)
+        SymbolCache.TryRemove(symbol)
+        return mapped == symbol and PandasMapper.mapper(ticker) == ticker
+
+    def test_mapping_reads_symbol_cache_version_once_per_operation(self):
+        # A lookup only reads .NET state once per indexing call, however many keys it maps
+        class VersionCounter:
+            def __init__(self, cache):
+                self.cache = cache
+                self.reads = 0
+            @property
+            def version(self):
+                self.reads += 1
+                return self.cache.version
+            def __getattr__(self, name):
+                return getattr(self.cache, name)
+
+        counter = VersionCounter(SymbolCache)
+        PandasMapper.SymbolCache = counter
+        try:
+            close = self.spydf.loc[('SPY', self.spydf.index[0][1]), 'close']
+            reads = counter.reads
+        finally:
+            PandasMapper.SymbolCache = SymbolCache
+        return reads == 1 and close == self.spydf.loc[(self.spy, self.spydf.index[0][1]), 'close']
+
+    def test_indexing_skips_mapping_on_plain_frames(self):
+        # Plain frames go straight to pandas, even if the ticker is in the SymbolCache: its KeyError isn't rewrapped
+        df = pd.DataFrame({'close': [1, 2]}, index=['SPY', 'AAPL'])
+        try:
+            df.loc['MSFT']
+            return False
+        except KeyError as e:
+            if 'No key found for either mapped or original key.' in str(e):
+                return False
+
+        # Lean frames are still indexed by ticker
+        return df.loc['SPY', 'close'] == 1 and self.spydf.loc['SPY'].equals(self.spydf.loc[self.spy])
+
+    def test_lean_pandas_mapping_can_be_disabled(self):
+        # Without the mapping the ticker isn't found, in the scope or in the decorated function only
+        def index_by_ticker():
+            try:
+                return self.spydf.loc['SPY'] is not None
+            except KeyError:
+                return False
+
+        with PandasMapper.lean_pandas_mapping(False):
+            if index_by_ticker():
+                return False
+        if PandasMapper.lean_pandas_mapping(False)(index_by_ticker)() or not index_by_ticker():
+            return False
+
+        # The process wide switch restores the native pandas functions
+        native = PandasMapper._wrapped_functions[0][2]
+        PandasMapper.set_lean_pandas_mapping(False)
+        try:
+            if pd.core.indexing._LocationIndexer.__getitem__ is not native or index_by_ticker():
+                return False
+        finally:
+            PandasMapper.set_lean_pandas_mapping(True)
+        return index_by_ticker()
+
+    def test_mapper_resolves_sequences_in_bulk(self):
+        # Lists, tuples and arrays of tickers are mapped with a single SymbolCache call
+        unknown = 'PANDASMAPPERUNKNOWN'
+        if PandasMapper.mapper(['SPY', unknown, 'aapl']) != [self.spy, unknown, self.aapl]:
+            return False
+        if PandasMapper.mapper(('SPY', 'AAPL')) != (self.spy, self.aapl):
+            return False
+        if list(PandasMapper.mapper(np.array(['SPY', unknown]))) != [self.spy, unknown]:
+            return False
+
+        history = self.spydf['lastprice'].unstack(level=0)
+        return history[['SPY']].equals(history[[self.spy]]) and history.loc[:, np.array(['SPY'])].equals(history[[self.spy]])
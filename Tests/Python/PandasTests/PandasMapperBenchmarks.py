@@ -0,0 +1,76 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+Measures the overhead of the PandasMapper wrapped indexing functions, with the mapping enabled,
+disabled on the current thread with lean_pandas_mapping(False) and removed for the whole process.
+
+To run it directly import the QuantConnect Dlls as described in PandasMapperTests.py, then:
+$ python PandasMapperBenchmarks.py
+'''
+
+from clr import AddReference
+AddReference("QuantConnect.Common")
+AddReference("QuantConnect.Tests")
+
+from QuantConnect import *
+from QuantConnect.Python import PandasConverter
+from QuantConnect.Tests import Symbols
+from QuantConnect.Tests.Python import PythonTestingUtils
+
+import timeit
+import numpy as np
+import pandas as pd
+from PandasMapper import lean_pandas_mapping, set_lean_pandas_mapping
+
+spy = Symbols.SPY
+SymbolCache.Set("SPY", spy)
+spydf = PandasConverter().GetDataFrame(PythonTestingUtils.GetSlices(spy))
+
+# Numerical frame like the ones of optimizers and feature pipelines
+features = pd.DataFrame(np.random.normal(size=(1000, 50)), columns=[f'feature{i}' for i in range(50)])
+
+operations = {
+    'DataFrame[column]': lambda: features['feature10'],
+    'DataFrame.loc[row, column]': lambda: features.loc[500, 'feature10'],
+    'DataFrame.at[row, column]': lambda: features.at[500, 'feature10'],
+    'DataFrame.iloc[row]': lambda: features.iloc[500],
+    'column in DataFrame': lambda: 'feature10' in features,
+    'Lean DataFrame.loc[ticker]': lambda: spydf.loc['SPY'],
+}
+
+def benchmark(operation, number = 10000):
+    '''Average time of the operation in microseconds'''
+    return min(timeit.repeat(operation, number=number, repeat=3)) / number * 1e6
+
+def run():
+    print(f'{"Operation":<30}{"mapping on":>12}{"thread off":>12}{"process off":>13}')
+    for name, operation in operations.items():
+        enabled = benchmark(operation)
+        with lean_pandas_mapping(False):
+            try:
+                disabled = benchmark(operation)
+            except KeyError:
+                # Lean frames can't be indexed by ticker without the mapping
+                disabled = float('nan')
+        set_lean_pandas_mapping(False)
+        try:
+            native = benchmark(operation)
+        except KeyError:
+            native = float('nan')
+        finally:
+            set_lean_pandas_mapping(True)
+        print(f'{name:<30}{enabled:>10.2f}us{disabled:>10.2f}us{native:>11.2f}us')
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,108 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+Measures the python portfolio optimizers over a simulated year of daily rebalances, starting every optimization
+from equal weights and from the previous solution (warm start). Counts the solver iterations and the wall time.
+The mean-variance optimizers can use a quadratic programming solver instead of SLSQP with --solver.
+
+Run it from the Lean output directory, where AlgorithmImports and the framework Portfolio package are:
+$ python PortfolioOptimizerBenchmarks.py --assets 200 --days 252
+$ python PortfolioOptimizerBenchmarks.py --optimizers MinimumVariance MaximumSharpeRatio --assets 2000 --solver admm
+'''
+
+import sys
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+
+optimizers = {
+    'MinimumVariance': MinimumVariancePortfolioOptimizer,
+    'MaximumSharpeRatio': MaximumSharpeRatioPortfolioOptimizer,
+    'RiskParity': RiskParityPortfolioOptimizer
+}
+
+def get_returns(assets, days, lookback, turnover, seed = 0):
+    '''Simulates daily returns from a single factor model. Yields the lookback window of every rebalance,
+    replacing some assets of the universe every month'''
+    random = np.random.RandomState(seed)
+    total = assets + turnover * (days // 21 + 1)
+    beta = random.uniform(0.5, 1.5, total)
+    market = random.normal(3e-4, 1e-2, days + lookback)
+    returns = np.outer(market, beta) + random.normal(2e-4, 1.5e-2, (days + lookback, total))
+    columns = np.array([f'ASSET{i}' for i in range(total)])
+
+    universe = np.arange(assets)
+    for day in range(days):
+        if day > 0 and day % 21 == 0:
+            # drop the first assets of the universe and add new ones
+            added = np.arange(turnover) + universe.max() + 1
+            universe = np.concatenate([universe[turnover:], added])
+        window = returns[day:day + lookback, universe]
+        yield pd.DataFrame(window, columns=columns[universe])
+
+def benchmark(name, warm_start, assets, days, lookback, turnover, solver = None):
+    '''Optimizes every rebalance of the simulation. Returns the total solver iterations and the wall time'''
+    optimizer_type = optimizers[name]
+    module = sys.modules[optimizer_type.__module__]
+    minimize = module.minimize
+    iterations = []
+
+    def counting(function):
+        def counting_function(*args, **kwargs):
+            result = function(*args, **kwargs)
+            iterations.append(result.nit)
+            return result
+        return counting_function
+
+    if solver is None:
+        optimizer = optimizer_type(warm_start=warm_start)
+    else:
+        optimizer = optimizer_type(warm_start=warm_start, solver=solver)
+        optimizer.solver.solve = counting(optimizer.solver.solve)
+    module.minimize = counting(minimize)
+    try:
+        start = time.perf_counter()
+        for returns in get_returns(assets, days, lookback, turnover):
+            optimizer.optimize(returns)
+        elapsed = time.perf_counter() - start
+    finally:
+        module.minimize = minimize
+    return sum(iterations), elapsed
+
+def run(names, assets, days, lookback, turnover, solver = None):
+    print(f'{"Optimizer":<20}{"cold iterations":>16}{"cold time":>12}{"warm iterations":>17}{"warm time":>12}')
+    for name in names:
+        cold_iterations, cold_time = benchmark(name, False, assets, days, lookback, turnover, solver)
+        warm_iterations, warm_time = benchmark(name, True, assets, days, lookback, turnover, solver)
+        print(f'{name:<20}{cold_iterations:>16}{cold_time:>11.2f}s{warm_iterations:>17}{warm_time:>11.2f}s')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks warm started portfolio optimizers over simulated daily rebalances')
+    parser.add_argument('--optimizers', nargs='+', choices=list(optimizers), default=list(optimizers), help='Optimizers to benchmark')
+    parser.add_argument('--assets', type=int, default=200, help='Number of assets of the universe')
+    parser.add_argument('--days', type=int, default=252, help='Number of daily rebalances')
+    parser.add_argument('--lookback', type=int, default=63, help='Number of daily returns of each optimization')
+    parser.add_argument('--turnover', type=int, default=5, help='Number of assets replaced in the universe every month')
+    parser.add_argument('--solver', choices=['admm', 'osqp', 'cvxpy'], help='Quadratic programming solver of the mean-variance optimizers. Defaults to SLSQP')
+    arguments = parser.parse_args()
+
+    if arguments.solver is not None and 'RiskParity' in arguments.optimizers:
+        parser.error('RiskParity is not a quadratic program, it does not take a solver')
+
+    run(arguments.optimizers, arguments.assets, arguments.days, arguments.lookback, arguments.turnover, arguments.solver)